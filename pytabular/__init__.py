@@ -66,6 +66,18 @@ from .query import Connection
 from .pbi_helper import find_local_pbi_instances
 from .document import ModelDocumenter
 from .tmdl import Tmdl
+from .snapshot import MetadataSnapshot, cached_snapshot, load_snapshot
+from .catalog import ServerCatalog
+from .fleet import FleetResult, scan_fleet
+from .dependency import DependencyGraph
+from .dax import DaxReference, extract_references, static_dependencies
+from .diff import ModelDiff, ObjectChange, diff_models
+from .journal import ChangeJournal
+from .search import ExpressionIndex
+from .view import ModelView
+from .identity import IdentityMap
+from .scheduler import RefreshScheduler, RefreshWave
+from .policy import PolicyAction, RefreshPolicy
 
 
 logger.info("Import successful...")
@@ -0,0 +1,139 @@
+"""`catalog.py` opens many databases on one server with one connection.
+
+`ServerCatalog` connects to the server once.
+Database names come from a single DMV query, and a `Tabular` class
+is only built for a database the first time it is asked for.
+Every `Tabular` built by the catalog shares the catalog's `Server`.
+
+Example:
+    ```python title="tenant server"
+    import pytabular as p
+    catalog = p.ServerCatalog(SERVER_CONNECTION_STR)
+    catalog.database_names() # (1)
+    model = catalog["Sales"] # (2)
+    catalog["Sales"] is model # (3)
+    catalog.disconnect() # (4)
+    ```
+
+    1. Names of every database on the server, no models are loaded.
+    2. Builds the `Tabular` class for "Sales" on the shared `Server`.
+    3. `True`, the `Tabular` is kept until `close("Sales")`.
+    4. Disconnects the one `Server` every `Tabular` in the catalog uses.
+"""
+
+import atexit
+import logging
+from typing import Dict, Iterator, List
+import pandas as pd
+from Microsoft.AnalysisServices.Tabular import Server
+from pytabular.pytabular import Tabular
+from pytabular.query import Connection
+
+logger = logging.getLogger("PyTabular")
+
+
+class ServerCatalog:
+    """All the databases on a server, sharing one `Server` connection.
+
+    Args:
+        connection_str (str): Connection string to the server.
+            `Initial Catalog` isn't needed.
+
+    Attributes:
+        Server (Server): The .Net `Server` shared by every `Tabular` in the catalog.
+        Adomd (Connection): Server level connection, used to list the databases.
+    """
+
+    def __init__(self, connection_str: str) -> None:
+        """Connects to the server. No databases are opened."""
+        self.Server = Server()
+        self.Server.Connect(connection_str)
+        logger.info(f"Connected to Server - {self.Server.Name}")
+        self.Adomd: Connection = Connection(self.Server)
+        self._database_names: List[str] = None
+        self._models: Dict[str, Tabular] = {}
+        atexit.register(self.disconnect)
+
+    def __repr__(self) -> str:
+        """Server name, number of databases and number opened."""
+        return (
+            f"ServerCatalog({self.Server.Name} - {len(self)} databases, "
+            f"{len(self._models)} opened)"
+        )
+
+    def database_names(self, refresh: bool = False) -> List[str]:
+        """Names of the databases on the server.
+
+        Read from `$SYSTEM.DBSCHEMA_CATALOGS`, so no database metadata is loaded.
+
+        Args:
+            refresh (bool, optional): Query the server again,
+                instead of using the names from the last call. Defaults to False.
+
+        Returns:
+            List[str]: Database names.
+        """
+        if self._database_names is None or refresh:
+            logger.debug(f"Querying database names on {self.Server.Name}")
+            catalogs = self.Adomd.query(
+                "select [CATALOG_NAME] from $SYSTEM.DBSCHEMA_CATALOGS"
+            )
+            if isinstance(catalogs, pd.DataFrame):
+                self._database_names = catalogs["CATALOG_NAME"].tolist()
+            else:
+                # `query()` returns the value itself for a single row and column.
+                self._database_names = [catalogs]
+        return self._database_names
+
+    def __len__(self) -> int:
+        """Number of databases on the server."""
+        return len(self.database_names())
+
+    def __iter__(self) -> Iterator[str]:
+        """Iterates the database names. Use `catalog[name]` to open one."""
+        return iter(self.database_names())
+
+    def __contains__(self, database: str) -> bool:
+        """Checks if a database is on the server."""
+        return database in self.database_names()
+
+    def __getitem__(self, database: str) -> Tabular:
+        """Gets the `Tabular` class of a database, building it on first access.
+
+        Args:
+            database (str): Name of the database.
+
+        Returns:
+            Tabular: `Tabular` class using the catalog's `Server`.
+        """
+        try:
+            return self._models[database]
+        except KeyError:
+            logger.info(f"Opening {database} on {self.Server.Name}")
+            model = Tabular(server=self.Server, database=database)
+            self._models[database] = model
+            return model
+
+    @property
+    def opened(self) -> Dict[str, Tabular]:
+        """The databases opened so far, by name."""
+        return dict(self._models)
+
+    def close(self, database: str) -> None:
+        """Drops the `Tabular` class of a database. The `Server` stays connected.
+
+        Args:
+            database (str): Name of the database.
+        """
+        model = self._models.pop(database, None)
+        if model is not None:
+            model.disconnect()
+
+    def disconnect(self) -> None:
+        """Closes every opened database and disconnects the shared `Server`."""
+        for database in list(self._models):
+            self.close(database)
+        self.Adomd.Close()
+        logger.info(f"Disconnecting from - {self.Server.Name}")
+        atexit.unregister(self.disconnect)
+        return self.Server.Disconnect()
@@ -7,6 +7,7 @@ import logging
 import pandas as pd
 from pytabular.object import PyObject, PyObjects
 from Microsoft.AnalysisServices.Tabular import ColumnType
+from rich.table import Table
 
 logger = logging.getLogger("PyTabular")
 
@@ -20,35 +21,38 @@ class PyColumn(PyObject):
     See methods for extra functionality.
     """
 
+    __slots__ = ("Table",)
+
     def __init__(self, object, table) -> None:
         """Init that connects your column to parent table.
 
-        It will also build custom rows for your `rich`
-        display table.
-
         Args:
             object (Column): .Net column object.
             table (Table): .Net table object.
         """
         super().__init__(object)
         self.Table = table
-        self._display.add_row(
-            "Description", str(self._object.Description), end_section=True
-        )
-        self._display.add_row("DataType", str(self._object.DataType))
-        self._display.add_row("EncodingHint", str(self._object.EncodingHint))
-        self._display.add_row("IsAvailableInMDX", str(self._object.IsAvailableInMDX))
-        self._display.add_row("IsHidden", str(self._object.IsHidden))
-        self._display.add_row("IsKey", str(self._object.IsKey))
-        self._display.add_row("IsNullable", str(self._object.IsNullable))
-        self._display.add_row("State", str(self._object.State))
-        self._display.add_row("DisplayFolder", str(self._object.DisplayFolder))
+
+    def _build_display(self) -> Table:
+        """Adds custom column rows for your `rich` display table."""
+        display = super()._build_display()
+        display.add_row("Description", str(self._object.Description), end_section=True)
+        display.add_row("DataType", str(self._object.DataType))
+        display.add_row("EncodingHint", str(self._object.EncodingHint))
+        display.add_row("IsAvailableInMDX", str(self._object.IsAvailableInMDX))
+        display.add_row("IsHidden", str(self._object.IsHidden))
+        display.add_row("IsKey", str(self._object.IsKey))
+        display.add_row("IsNullable", str(self._object.IsNullable))
+        display.add_row("State", str(self._object.State))
+        display.add_row("DisplayFolder", str(self._object.DisplayFolder))
+        return display
 
     def get_dependencies(self) -> pd.DataFrame:
-        """Returns the dependant columns of a measure."""
-        dmv_query = f"select * from $SYSTEM.DISCOVER_CALC_DEPENDENCY where [OBJECT] = \
-            '{self.Name}' and [TABLE] = '{self.Table.Name}'"
-        return self.Table.Model.query(dmv_query)
+        """Returns the dependant columns of a measure.
+
+        Read from `Tabular.dependencies`, so only the first call queries the model.
+        """
+        return self.Table.Model.dependencies.depends_on(self.Table.Name, self.Name)
 
     def get_sample_values(self, top_n: int = 3) -> pd.DataFrame:
         """Get sample values of column."""
@@ -126,6 +130,16 @@ class PyColumns(PyObjects):
     `model.Columns.Find('Key')`.
     """
 
+    _frame_properties = [
+        "Name",
+        "Parent.Name",
+        "Type",
+        "DataType",
+        "IsHidden",
+        "Description",
+        "DisplayFolder",
+    ]
+
     def __init__(self, objects) -> None:
         """Init extends through to the `PyObjects()` init."""
         super().__init__(objects)
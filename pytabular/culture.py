@@ -3,6 +3,7 @@
 import logging
 from pytabular.object import PyObject, PyObjects
 from typing import List
+from rich.table import Table
 
 logger = logging.getLogger("PyTabular")
 
@@ -10,12 +11,20 @@ logger = logging.getLogger("PyTabular")
 class PyCulture(PyObject):
     """Main class to interact with cultures in model."""
 
+    _wrapper_attrs = frozenset(("Model", "ObjectTranslations"))
+
     def __init__(self, object, model) -> None:
-        """Mostly extends from `PyObject`. But will add rows to `rich`."""
+        """Mostly extends from `PyObject`. But will build the translations."""
         super().__init__(object)
         self.Model = model
-        self._display.add_row("Culture Name", self._object.Name)
         self.ObjectTranslations = self.set_translation()
+        self._translation_index = self.set_translation_index()
+
+    def _build_display(self) -> Table:
+        """Adds the culture name row to `rich`."""
+        display = super()._build_display()
+        display.add_row("Culture Name", self._object.Name)
+        return display
 
     def set_translation(self) -> List[dict]:
         """Based on the culture, it creates a list of dicts with available translations.
@@ -38,6 +47,24 @@ class PyCulture(PyObject):
             for translation in self._object.ObjectTranslations
         ]
 
+    def set_translation_index(self) -> dict:
+        """Indexes `self.ObjectTranslations` for `get_translation()`.
+
+        If there are duplicates, the first one is kept.
+
+        Returns:
+            dict: `{(object_name, object_parent_name, object_type): translation}`
+        """
+        index = {}
+        for translation in self.ObjectTranslations:
+            key = (
+                translation["object_name"],
+                translation["object_parent_name"],
+                translation["object_type"],
+            )
+            index.setdefault(key, translation)
+        return index
+
     def get_translation(
         self, object_name: str, object_parent_name: str, object_type: str = "Caption"
     ) -> dict:
@@ -56,15 +83,10 @@ class PyCulture(PyObject):
             dict: With translation of the object.
         """
         try:
-            translations = [
-                d
-                for d in self.ObjectTranslations
-                if d["object_name"] == object_name
-                and d["object_type"] == object_type
-                and d["object_parent_name"] == object_parent_name
+            return self._translation_index[
+                (object_name, object_parent_name, object_type)
             ]
-            return translations[0]
-        except Exception:
+        except KeyError:
             return {"object_translation": object_name}
 
 
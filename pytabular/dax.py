@@ -0,0 +1,221 @@
+"""`dax.py` finds table, column and measure references in DAX, without the server.
+
+The tokenizer is one regular expression. It skips comments and string
+literals and picks out `'Quoted Table'[Column]`, `Table[Column]`, `[Column or Measure]`
+and bare table names. `extract_references()` resolves those against the
+measures and tables of the model.
+
+`static_dependencies()` runs that over every measure, calculated column and
+calculated table of a `MetadataSnapshot` or a `Tabular` class and returns a
+`DependencyGraph`, same as `model.dependencies` but without the DMV.
+So it works on snapshots and on changes that haven't been saved.
+
+Example:
+    ```python title="dependencies of a snapshot"
+    import pytabular as p
+    snapshot = p.load_snapshot("metadata_cache/server__database.json")
+    graph = p.static_dependencies(snapshot)
+    graph.downstream("Sales", "Amount")
+    ```
+
+    ```python title="single expression"
+    p.extract_references("SUM('Sales'[Amount]) + [Tax]", table="Sales")
+    ```
+"""
+
+import logging
+import re
+from collections import namedtuple
+from typing import Dict, Iterable, Iterator, List, Tuple, Union
+import pandas as pd
+from pytabular.dependency import DEPENDENCY_COLUMNS, DependencyGraph
+from pytabular.snapshot import MetadataSnapshot, walk_model
+
+logger = logging.getLogger("PyTabular")
+
+DaxReference = namedtuple("DaxReference", ["table", "name", "object_type"])
+DaxReference.__doc__ = """A reference found in a DAX expression.
+
+Attributes:
+    table (str): Table of the referenced object. `None` if it couldn't be resolved.
+    name (str): Name of the referenced object. Table name for tables.
+    object_type (str): "TABLE", "COLUMN" or "MEASURE", like `REFERENCED_OBJECT_TYPE`
+        in `DISCOVER_CALC_DEPENDENCY`.
+"""
+
+_TOKENS = re.compile(
+    r"""
+    (?P<comment>//[^\n]*|--[^\n]*|/\*.*?\*/)
+    | (?P<string>"(?:[^"]|"")*")
+    | '(?P<quoted>(?:[^']|'')*)'(?:\s*\[(?P<quoted_column>(?:[^\]]|\]\])*)\])?
+    | (?<![\w.@$])(?P<table>[A-Za-z_][\w]*)
+        (?:\s*\[(?P<table_column>(?:[^\]]|\]\])*)\]|(?P<call>\s*\())?
+    | \[(?P<bracket>(?:[^\]]|\]\])*)\]
+    """,
+    re.VERBOSE | re.DOTALL,
+)
+
+
+def _unescape(name: str, quote: str) -> str:
+    """Removes the doubled up escape of `'` or `]` in a name."""
+    return None if name is None else name.replace(quote * 2, quote)
+
+
+def tokenize(expression: str) -> Iterator[Tuple[str, str, bool]]:
+    """Yields the raw references of a DAX expression, in order.
+
+    Args:
+        expression (str): DAX expression.
+
+    Yields:
+        Tuple[str, str, bool]: `(table, name, bare)`. `table` is `None` for `[Name]`,
+            `name` is `None` for a table on its own.
+            `bare` is `True` for an unquoted word on its own (ex. `Sales` or a `VAR` name),
+            which may or may not be a table. Function names are not yielded.
+    """
+    for token in _TOKENS.finditer(expression or ""):
+        if token.lastgroup in ("comment", "string", "call"):
+            continue
+        if token.group("quoted") is not None:
+            column = _unescape(token.group("quoted_column"), "]")
+            yield _unescape(token.group("quoted"), "'"), column, False
+        elif token.group("table") is not None:
+            column = _unescape(token.group("table_column"), "]")
+            yield token.group("table"), column, column is None
+        else:
+            yield None, _unescape(token.group("bracket"), "]"), False
+
+
+def _fold_names(
+    measures: Dict[str, str] = None, tables: Iterable[str] = None
+) -> Tuple[Dict[str, Tuple[str, str]], Dict[str, str]]:
+    """Keys measures and tables by `casefold()`ed name, since DAX names are case-insensitive.
+
+    Returns:
+        Tuple[Dict[str, Tuple[str, str]], Dict[str, str]]:
+            `{folded name: (measure name, table name)}` and `{folded name: table name}`.
+    """
+    folded_measures = {
+        name.casefold(): (name, table) for name, table in (measures or {}).items()
+    }
+    folded_tables = {name.casefold(): name for name in tables or []}
+    return folded_measures, folded_tables
+
+
+def _resolve_references(
+    expression: str,
+    table: str,
+    measures: Dict[str, Tuple[str, str]],
+    tables: Dict[str, str],
+) -> List[DaxReference]:
+    """`extract_references()` with measures and tables from `_fold_names()`."""
+    references = {}
+    for ref_table, name, bare in tokenize(expression):
+        model_table = tables.get(ref_table.casefold()) if ref_table is not None else None
+        if name is None:
+            if bare and model_table is None:
+                continue
+            model_table = model_table or ref_table
+            reference = DaxReference(model_table, model_table, "TABLE")
+            references.setdefault(reference, None)
+            continue
+        measure = measures.get(name.casefold())
+        if ref_table is None:
+            if measure is not None:
+                reference = DaxReference(measure[1], measure[0], "MEASURE")
+            else:
+                reference = DaxReference(table, name, "COLUMN")
+        elif measure is not None and measure[1].casefold() == ref_table.casefold():
+            reference = DaxReference(measure[1], measure[0], "MEASURE")
+        else:
+            reference = DaxReference(model_table or ref_table, name, "COLUMN")
+        references.setdefault(reference, None)
+    return list(references)
+
+
+def extract_references(
+    expression: str,
+    table: str = None,
+    measures: Dict[str, str] = None,
+    tables: Iterable[str] = None,
+) -> List[DaxReference]:
+    """References of a DAX expression, resolved against the model.
+
+    - `Table[Name]` is a measure if `Name` is a measure of `Table`, otherwise a column.
+    - `[Name]` is a measure if `Name` is in `measures`,
+        otherwise a column of `table`, the table the expression belongs to.
+    - `'Table'` is a table. `Table` is a table only if it is in `tables`,
+        so keywords and variables aren't picked up.
+
+    Names are matched case-insensitively, like DAX does, and measures and tables
+    that are found are returned with the names from `measures` and `tables`.
+
+    Args:
+        expression (str): DAX expression.
+        table (str, optional): Table the expression belongs to. Defaults to None.
+        measures (Dict[str, str], optional): Measure name to table name.
+            Defaults to None.
+        tables (Iterable[str], optional): Table names. If `None`,
+            bare words are never tables. Defaults to None.
+
+    Returns:
+        List[DaxReference]: Each reference once, in the order first found.
+    """
+    return _resolve_references(expression, table, *_fold_names(measures, tables))
+
+
+def static_dependencies(source: Union[MetadataSnapshot, object]) -> DependencyGraph:
+    """Builds a `DependencyGraph` from the DAX of a snapshot or a model.
+
+    Reads measures, calculated columns and calculated tables.
+    Rows have the same columns as `DISCOVER_CALC_DEPENDENCY`,
+    with `OBJECT_TYPE` "MEASURE", "CALC_COLUMN" or "CALC_TABLE".
+
+    Args:
+        source (Union[MetadataSnapshot, Tabular]): A `MetadataSnapshot`,
+            or a `Tabular` class. A `Tabular` is read from the local .Net objects,
+            so changes that aren't saved are included.
+
+    Returns:
+        DependencyGraph: Dependencies found in the DAX.
+    """
+    if isinstance(source, MetadataSnapshot):
+        metadata = {
+            kind: getattr(source, kind)
+            for kind in ("tables", "columns", "measures", "partitions")
+        }
+    else:
+        metadata = walk_model(source.Model)
+    measures, tables = _fold_names(
+        {measure["name"]: measure["table"] for measure in metadata["measures"]},
+        [table["name"] for table in metadata["tables"]],
+    )
+    expressions = [
+        ("MEASURE", measure["table"], measure["name"], measure["expression"])
+        for measure in metadata["measures"]
+    ]
+    expressions += [
+        ("CALC_COLUMN", column["table"], column["name"], column["expression"])
+        for column in metadata["columns"]
+        if column["type"] == "Calculated"
+    ]
+    expressions += [
+        ("CALC_TABLE", partition["table"], partition["table"], partition["expression"])
+        for partition in metadata["partitions"]
+        if partition["source_type"] == "Calculated"
+    ]
+    rows = [
+        {
+            "OBJECT_TYPE": object_type,
+            "TABLE": table,
+            "OBJECT": name,
+            "EXPRESSION": expression,
+            "REFERENCED_OBJECT_TYPE": reference.object_type,
+            "REFERENCED_TABLE": reference.table,
+            "REFERENCED_OBJECT": reference.name,
+        }
+        for object_type, table, name, expression in expressions
+        for reference in _resolve_references(expression, table, measures, tables)
+    ]
+    logger.debug(f"Found {len(rows)} references in {len(expressions)} expressions")
+    return DependencyGraph(pd.DataFrame(rows, columns=DEPENDENCY_COLUMNS))
@@ -0,0 +1,182 @@
+"""`dependency.py` holds the calculation dependencies of a whole model.
+
+`DependencyGraph` is built from one `$SYSTEM.DISCOVER_CALC_DEPENDENCY` query.
+Lookups by object are then a dictionary lookup, instead of a query per object.
+It is cached on the `Tabular` class as `model.dependencies`
+and dropped on `save_changes()` and `reload_model_info()`.
+
+Example:
+    ```python title="what breaks if this column goes"
+    import pytabular as p
+    model = p.Tabular(CONNECTION_STR)
+    model.dependencies.referenced_by("Sales", "Amount") # (1)
+    model.dependencies.downstream("Sales", "Amount") # (2)
+    model.Measures["Total Sales"].get_dependencies() # (3)
+    ```
+
+    1. Rows of the DMV for objects that reference `'Sales'[Amount]` directly.
+    2. Every `(table, object)` that depends on it, directly or not.
+    3. Same as `model.dependencies.depends_on("Sales", "Total Sales")`.
+"""
+
+import logging
+from collections import deque
+from typing import Dict, List, Set, Tuple
+import pandas as pd
+
+logger = logging.getLogger("PyTabular")
+
+DMV_QUERY = "select * from $SYSTEM.DISCOVER_CALC_DEPENDENCY"
+
+DEPENDENCY_COLUMNS = [
+    "DATABASE_NAME",
+    "OBJECT_TYPE",
+    "TABLE",
+    "OBJECT",
+    "EXPRESSION",
+    "REFERENCED_OBJECT_TYPE",
+    "REFERENCED_TABLE",
+    "REFERENCED_OBJECT",
+    "REFERENCED_EXPRESSION",
+    "QUERY",
+]
+"""Columns of `$SYSTEM.DISCOVER_CALC_DEPENDENCY`."""
+
+
+class DependencyGraph:
+    """Calculation dependencies of a model, indexed by `(table, object)`.
+
+    Edges go from an object to what it references.
+    "Upstream" is what an object depends on, "downstream" is what depends on it.
+
+    Args:
+        dependencies (pd.DataFrame): Result of `DMV_QUERY`,
+            or anything with the same `TABLE`, `OBJECT`,
+            `REFERENCED_TABLE` and `REFERENCED_OBJECT` columns.
+
+    Attributes:
+        frame (pd.DataFrame): The dependencies.
+    """
+
+    def __init__(self, dependencies: pd.DataFrame) -> None:
+        """Indexes the dependencies by object and by referenced object."""
+        if not isinstance(dependencies, pd.DataFrame) or len(dependencies.columns) == 0:
+            dependencies = pd.DataFrame(columns=DEPENDENCY_COLUMNS)
+        self.frame = dependencies.reset_index(drop=True)
+        self._by_object: Dict[Tuple[str, str], List[int]] = self._index(
+            ["TABLE", "OBJECT"]
+        )
+        self._by_referenced: Dict[Tuple[str, str], List[int]] = self._index(
+            ["REFERENCED_TABLE", "REFERENCED_OBJECT"]
+        )
+        objects = list(zip(self.frame["TABLE"], self.frame["OBJECT"]))
+        referenced = list(
+            zip(self.frame["REFERENCED_TABLE"], self.frame["REFERENCED_OBJECT"])
+        )
+        self._upstream: Dict[Tuple[str, str], List[Tuple[str, str]]] = {
+            key: [referenced[row] for row in rows]
+            for key, rows in self._by_object.items()
+        }
+        self._downstream: Dict[Tuple[str, str], List[Tuple[str, str]]] = {
+            key: [objects[row] for row in rows]
+            for key, rows in self._by_referenced.items()
+        }
+        logger.debug(f"Indexed {len(self.frame)} dependencies")
+
+    @classmethod
+    def from_model(cls, model) -> "DependencyGraph":
+        """Builds the graph with one DMV query.
+
+        Args:
+            model (Tabular): The `Tabular` class to query.
+
+        Returns:
+            DependencyGraph: Dependencies of the model.
+        """
+        logger.info("Querying DISCOVER_CALC_DEPENDENCY...")
+        return cls(model.query(DMV_QUERY))
+
+    def _index(self, keys: List[str]) -> Dict[Tuple[str, str], List[int]]:
+        """Row positions of the frame by `keys`."""
+        if len(self.frame) == 0:
+            return {}
+        return {
+            key: list(rows) for key, rows in self.frame.groupby(keys).indices.items()
+        }
+
+    def __len__(self) -> int:
+        """Number of dependencies."""
+        return len(self.frame)
+
+    def __repr__(self) -> str:
+        """Number of dependencies and objects."""
+        return (
+            f"DependencyGraph({len(self)} dependencies, "
+            f"{len(set(self._upstream) | set(self._downstream))} objects)"
+        )
+
+    def depends_on(self, table: str, name: str) -> pd.DataFrame:
+        """Rows for what an object references directly.
+
+        Same rows as querying the DMV `where [TABLE] = table and [OBJECT] = name`.
+
+        Args:
+            table (str): Table of the object.
+            name (str): Name of the object.
+
+        Returns:
+            pd.DataFrame: The dependency rows.
+        """
+        rows = self._by_object.get((table, name), [])
+        return self.frame.iloc[rows].reset_index(drop=True)
+
+    def referenced_by(self, table: str, name: str) -> pd.DataFrame:
+        """Rows for what references an object directly.
+
+        Args:
+            table (str): Table of the object.
+            name (str): Name of the object.
+
+        Returns:
+            pd.DataFrame: The dependency rows.
+        """
+        rows = self._by_referenced.get((table, name), [])
+        return self.frame.iloc[rows].reset_index(drop=True)
+
+    def _closure(
+        self, start: Tuple[str, str], edges: Dict[Tuple[str, str], List[Tuple[str, str]]]
+    ) -> Set[Tuple[str, str]]:
+        """Everything reachable from `start` through `edges`, without `start`."""
+        seen = {start}
+        queue = deque([start])
+        while queue:
+            for neighbor in edges.get(queue.popleft(), []):
+                if neighbor not in seen:
+                    seen.add(neighbor)
+                    queue.append(neighbor)
+        seen.discard(start)
+        return seen
+
+    def upstream(self, table: str, name: str) -> Set[Tuple[str, str]]:
+        """Every `(table, object)` an object depends on, directly or not.
+
+        Args:
+            table (str): Table of the object.
+            name (str): Name of the object.
+
+        Returns:
+            Set[Tuple[str, str]]: `(table, object)` of each dependency.
+        """
+        return self._closure((table, name), self._upstream)
+
+    def downstream(self, table: str, name: str) -> Set[Tuple[str, str]]:
+        """Every `(table, object)` that depends on an object, directly or not.
+
+        Args:
+            table (str): Table of the object.
+            name (str): Name of the object.
+
+        Returns:
+            Set[Tuple[str, str]]: `(table, object)` of each dependant.
+        """
+        return self._closure((table, name), self._downstream)
@@ -0,0 +1,269 @@
+"""`diff.py` compares two models, or two snapshots of a model.
+
+Every object gets a content hash of its metadata.
+Each table also gets a subtree hash of itself and its columns, measures and partitions,
+and the model gets one hash of everything.
+The comparison goes top down and only goes into a table if its subtree hash changed,
+so two models that are mostly the same are compared quickly.
+
+Objects are matched by name (`(table, name)` for columns, measures and partitions).
+Relationships are matched by their from and to columns, since their names
+are usually generated and won't match between a dev and a prod model.
+
+Example:
+    ```python title="before a deployment"
+    import pytabular as p
+    prod = p.Tabular(PROD_CONNECTION_STR)
+    dev = p.Tabular(DEV_CONNECTION_STR)
+    diff = p.diff_models(prod, dev) # (1)
+    diff.frame() # (2)
+    ```
+
+    1. `MetadataSnapshot`s work too, ex. `p.diff_models(p.load_snapshot(path), dev)`.
+    2. One row per added, removed or changed object.
+    With the old and new value of each changed property.
+"""
+
+import hashlib
+import json
+import logging
+from collections import namedtuple
+from typing import Dict, List, Tuple, Union
+import pandas as pd
+from pytabular.snapshot import MetadataSnapshot
+
+logger = logging.getLogger("PyTabular")
+
+TABLE_KINDS = ("columns", "measures", "partitions")
+"""Kinds that belong to a table."""
+
+ObjectChange = namedtuple(
+    "ObjectChange", ["status", "kind", "table", "name", "properties"]
+)
+ObjectChange.__doc__ = """An added, removed or changed object.
+
+Attributes:
+    status (str): "added", "removed" or "changed".
+    kind (str): "tables", "columns", "measures", "partitions", "relationships" or "roles".
+    table (str): Table of the object. `None` for relationships and roles.
+    name (str): Name of the object.
+        For relationships it is `'From'[Column] -> 'To'[Column]`.
+    properties (Dict[str, Tuple]): For "changed", property name to `(old, new)`.
+        Empty otherwise.
+"""
+
+
+def _hash(values) -> str:
+    """Stable hash of plain python values. Same in every process, unlike `hash()`."""
+    dumped = json.dumps(values, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.blake2b(dumped.encode("utf-8"), digest_size=16).hexdigest()
+
+
+def _relationship_name(relationship: dict) -> str:
+    """Key of a relationship, its from and to columns."""
+    return (
+        f"'{relationship['from_table']}'[{relationship['from_column']}] -> "
+        f"'{relationship['to_table']}'[{relationship['to_column']}]"
+    )
+
+
+class _HashTree:
+    """Content hashes of a snapshot, grouped the way `diff_models()` compares them.
+
+    Attributes:
+        objects (Dict[str, Dict[Tuple[str, str], Tuple[str, dict]]]): For tables,
+            relationships and roles, `(table, name)` to the object hash and the object.
+        by_table (Dict[Tuple[str, str], Dict[Tuple[str, str], Tuple[str, dict]]]):
+            Same for columns, measures and partitions, grouped by `(table, kind)`.
+        kind_hashes (Dict[Tuple[str, str], str]): `(table, kind)` to a hash
+            of all the objects of that kind in that table.
+        table_hashes (Dict[str, str]): Table name to the subtree hash of the table.
+        root (str): Hash of the whole model.
+    """
+
+    def __init__(self, snapshot: MetadataSnapshot) -> None:
+        """Hashes every object, then every table subtree, then the model."""
+        self.objects: Dict[str, Dict[Tuple[str, str], Tuple[str, dict]]] = {
+            "tables": {},
+            "relationships": {},
+            "roles": {},
+        }
+        self.by_table: Dict[Tuple[str, str], Dict[Tuple[str, str], Tuple[str, dict]]] = {}
+        for table in snapshot.tables:
+            self.objects["tables"][(table["name"], table["name"])] = (_hash(table), table)
+        for kind in TABLE_KINDS:
+            for obj in getattr(snapshot, kind):
+                self.by_table.setdefault((obj["table"], kind), {})[
+                    (obj["table"], obj["name"])
+                ] = (_hash(obj), obj)
+        for relationship in snapshot.relationships:
+            relationship = dict(relationship)
+            relationship.pop("name", None)
+            self.objects["relationships"][
+                (None, _relationship_name(relationship))
+            ] = (_hash(relationship), relationship)
+        for role in snapshot.roles:
+            self.objects["roles"][(None, role["name"])] = (_hash(role), role)
+
+        self.kind_hashes = {
+            key: _hash(sorted(obj_hash for obj_hash, _ in objects.values()))
+            for key, objects in self.by_table.items()
+        }
+        self.table_hashes = {
+            table: _hash(
+                [obj_hash] + [self.kind_hashes.get((table, kind)) for kind in TABLE_KINDS]
+            )
+            for (table, _), (obj_hash, _) in self.objects["tables"].items()
+        }
+        self.root = _hash(
+            [
+                sorted(self.table_hashes.items()),
+                sorted(h for h, _ in self.objects["relationships"].values()),
+                sorted(h for h, _ in self.objects["roles"].values()),
+            ]
+        )
+
+    def table_objects(
+        self, table: str, kind: str
+    ) -> Dict[Tuple[str, str], Tuple[str, dict]]:
+        """Objects of a kind in one table."""
+        return self.by_table.get((table, kind), {})
+
+
+class ModelDiff:
+    """Result of `diff_models()`.
+
+    Attributes:
+        added (List[ObjectChange]): Objects only in the new model.
+        removed (List[ObjectChange]): Objects only in the old model.
+        changed (List[ObjectChange]): Objects in both, with different properties.
+        tables_compared (int): Tables whose subtree changed and were compared.
+    """
+
+    def __init__(self) -> None:
+        """Starts with no changes."""
+        self.added: List[ObjectChange] = []
+        self.removed: List[ObjectChange] = []
+        self.changed: List[ObjectChange] = []
+        self.tables_compared: int = 0
+
+    def __len__(self) -> int:
+        """Number of added, removed and changed objects."""
+        return len(self.added) + len(self.removed) + len(self.changed)
+
+    def __bool__(self) -> bool:
+        """`True` if anything is different."""
+        return len(self) > 0
+
+    def __repr__(self) -> str:
+        """Counts of added, removed and changed objects."""
+        return (
+            f"ModelDiff({len(self.added)} added, {len(self.removed)} removed, "
+            f"{len(self.changed)} changed)"
+        )
+
+    def frame(self) -> pd.DataFrame:
+        """Every change as a `pd.DataFrame`, one row per object and changed property.
+
+        Returns:
+            pd.DataFrame: Status, Kind, Table, Name, Property, Old and New.
+        """
+        rows = []
+        for change in self.added + self.removed + self.changed:
+            row = [change.status, change.kind, change.table, change.name]
+            if change.properties:
+                rows += [
+                    row + [prop, old, new]
+                    for prop, (old, new) in change.properties.items()
+                ]
+            else:
+                rows.append(row + [None, None, None])
+        return pd.DataFrame(
+            rows, columns=["Status", "Kind", "Table", "Name", "Property", "Old", "New"]
+        )
+
+    def _compare(
+        self,
+        kind: str,
+        old: Dict[Tuple[str, str], Tuple[str, dict]],
+        new: Dict[Tuple[str, str], Tuple[str, dict]],
+    ) -> None:
+        """Compares objects of one kind by hash, then by property if the hash changed."""
+        for key in new.keys() - old.keys():
+            self.added.append(ObjectChange("added", kind, *key, {}))
+        for key in old.keys() - new.keys():
+            self.removed.append(ObjectChange("removed", kind, *key, {}))
+        for key in old.keys() & new.keys():
+            (old_hash, old_obj), (new_hash, new_obj) = old[key], new[key]
+            if old_hash == new_hash:
+                continue
+            properties = {
+                prop: (old_obj.get(prop), new_obj.get(prop))
+                for prop in old_obj.keys() | new_obj.keys()
+                if old_obj.get(prop) != new_obj.get(prop)
+            }
+            self.changed.append(ObjectChange("changed", kind, *key, properties))
+
+
+def _as_snapshot(model: Union[MetadataSnapshot, object]) -> MetadataSnapshot:
+    """A `Tabular` class as a `MetadataSnapshot`, snapshots as is."""
+    if isinstance(model, MetadataSnapshot):
+        return model
+    return model.snapshot()
+
+
+def diff_models(
+    old: Union[MetadataSnapshot, object], new: Union[MetadataSnapshot, object]
+) -> ModelDiff:
+    """Compares two models by content hash.
+
+    Args:
+        old (Union[MetadataSnapshot, Tabular]): The model to compare from, ex. prod.
+        new (Union[MetadataSnapshot, Tabular]): The model to compare to, ex. dev.
+
+    Returns:
+        ModelDiff: Added, removed and changed objects.
+    """
+    old_tree, new_tree = _HashTree(_as_snapshot(old)), _HashTree(_as_snapshot(new))
+    diff = ModelDiff()
+    if old_tree.root == new_tree.root:
+        logger.info("Models are the same")
+        return diff
+
+    old_tables, new_tables = old_tree.table_hashes, new_tree.table_hashes
+    for table in new_tables.keys() - old_tables.keys():
+        diff.added.append(ObjectChange("added", "tables", table, table, {}))
+        for kind in TABLE_KINDS:
+            diff._compare(kind, {}, new_tree.table_objects(table, kind))
+    for table in old_tables.keys() - new_tables.keys():
+        diff.removed.append(ObjectChange("removed", "tables", table, table, {}))
+        for kind in TABLE_KINDS:
+            diff._compare(kind, old_tree.table_objects(table, kind), {})
+    changed_tables = [
+        table
+        for table in old_tables.keys() & new_tables.keys()
+        if old_tables[table] != new_tables[table]
+    ]
+    for table in changed_tables:
+        diff.tables_compared += 1
+        key = (table, table)
+        diff._compare(
+            "tables",
+            {key: old_tree.objects["tables"][key]},
+            {key: new_tree.objects["tables"][key]},
+        )
+        for kind in TABLE_KINDS:
+            if old_tree.kind_hashes.get((table, kind)) != new_tree.kind_hashes.get(
+                (table, kind)
+            ):
+                diff._compare(
+                    kind,
+                    old_tree.table_objects(table, kind),
+                    new_tree.table_objects(table, kind),
+                )
+    for kind in ("relationships", "roles"):
+        diff._compare(kind, old_tree.objects[kind], new_tree.objects[kind])
+    logger.info(
+        f"{diff} - compared {diff.tables_compared} of {len(old_tables)} tables"
+    )
+    return diff
@@ -0,0 +1,212 @@
+"""`fleet.py` scans many models at once, each in its own process.
+
+`scan_fleet()` connects to every connection string in a process pool,
+so one slow or broken model doesn't hold up the rest.
+In each process the `Tabular` class is built, a `MetadataSnapshot` is taken
+and your collectors are run. Results are yielded as each model finishes.
+With no collectors, only the snapshot is taken, with `cached_snapshot()`.
+The `Tabular` class is not built, and with a `cache_dir`
+models that haven't changed since the last scan are not walked at all.
+Errors are caught per model (and per collector) and reported in the `FleetResult`,
+the run keeps going.
+
+Collectors are sent to other processes, so they need to be picklable.
+Functions defined at the top level of a module are, lambdas are not.
+Whatever a collector returns needs to be picklable too.
+
+Example:
+    ```python title="nightly audit"
+    import pytabular as p
+
+    def table_count(model):
+        return len(model.Tables)
+
+    if __name__ == "__main__": # (1)
+        for result in p.scan_fleet(
+            CONNECTION_STRS,
+            collectors={"table_count": table_count},
+            max_workers=8,
+            cache_dir="metadata_cache", # (2)
+        ):
+            if result.errors:
+                print(result.connection_str, result.errors)
+            else:
+                print(result.database, result.results["table_count"])
+    ```
+
+    1. Needed on Windows, where worker processes import your script.
+    2. Snapshots are cached. With collectors, the `Tabular` class still walks
+    each model, the cache only saves walking it a second time for the snapshot.
+"""
+
+import logging
+import time
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Callable, Dict, Iterable, Iterator
+from pytabular.pytabular import Tabular
+from pytabular.snapshot import cached_snapshot
+
+logger = logging.getLogger("PyTabular")
+
+FleetResult = namedtuple(
+    "FleetResult",
+    [
+        "connection_str",
+        "server",
+        "database",
+        "snapshot",
+        "results",
+        "errors",
+        "seconds",
+    ],
+)
+FleetResult.__doc__ = """Result of scanning one model.
+
+Attributes:
+    connection_str (str): Connection string that was scanned.
+    server (str): Server name. `None` if the connection failed.
+    database (str): Database name. `None` if the connection failed.
+    snapshot (MetadataSnapshot): `None` if not asked for or if it failed.
+    results (Dict[str, Any]): Return value of each collector that succeeded.
+    errors (Dict[str, str]): Error of each step that failed.
+        Keys are "connect", "snapshot", "worker" or a collector name.
+        With no collectors, a failed connection is reported as "snapshot".
+    seconds (float): Time spent on the model.
+"""
+
+
+def _error(error: Exception) -> str:
+    """Error as a short picklable string."""
+    return f"{type(error).__name__}: {error}"
+
+
+def _scan_model(
+    connection_str: str,
+    collectors: Dict[str, Callable],
+    snapshot: bool,
+    cache_dir: str,
+) -> FleetResult:
+    """Scans one model. Runs in a worker process.
+
+    Args:
+        connection_str (str): Connection string of the model.
+        collectors (Dict[str, Callable]): Functions that take the `Tabular` class.
+        snapshot (bool): Take a `MetadataSnapshot`.
+        cache_dir (str): Folder of cached snapshots, see `cached_snapshot()`.
+
+    Returns:
+        FleetResult: Result of the model.
+    """
+    start = time.perf_counter()
+    results, errors = {}, {}
+    if snapshot and len(collectors) == 0:
+        try:
+            metadata = cached_snapshot(connection_str, cache_dir)
+        except Exception as error:
+            errors["snapshot"] = _error(error)
+            return FleetResult(
+                connection_str, None, None, None, results, errors, time.perf_counter() - start
+            )
+        return FleetResult(
+            connection_str,
+            metadata.server,
+            metadata.database,
+            metadata,
+            results,
+            errors,
+            time.perf_counter() - start,
+        )
+    try:
+        model = Tabular(connection_str)
+    except Exception as error:
+        errors["connect"] = _error(error)
+        return FleetResult(
+            connection_str, None, None, None, results, errors, time.perf_counter() - start
+        )
+    metadata = None
+    try:
+        if snapshot:
+            try:
+                metadata = model.snapshot(cache_dir)
+            except Exception as error:
+                errors["snapshot"] = _error(error)
+        for name, collector in collectors.items():
+            try:
+                results[name] = collector(model)
+            except Exception as error:
+                errors[name] = _error(error)
+        return FleetResult(
+            connection_str,
+            model.Server.Name,
+            model.Database.Name,
+            metadata,
+            results,
+            errors,
+            time.perf_counter() - start,
+        )
+    finally:
+        model.disconnect()
+
+
+def scan_fleet(
+    connection_strs: Iterable[str],
+    collectors: Dict[str, Callable] = None,
+    max_workers: int = None,
+    snapshot: bool = True,
+    cache_dir: str = None,
+) -> Iterator[FleetResult]:
+    """Scans many models in a process pool, yielding each result as it completes.
+
+    Args:
+        connection_strs (Iterable[str]): One connection string per model.
+        collectors (Dict[str, Callable], optional): Name and function to run
+            on each model. Each function gets the `Tabular` class and
+            its return value is put in `FleetResult.results`. Defaults to None.
+        max_workers (int, optional): Number of processes.
+            Defaults to None, which is the number of processors.
+        snapshot (bool, optional): Take a `MetadataSnapshot` of each model.
+            Defaults to True.
+        cache_dir (str, optional): Folder of cached snapshots,
+            see `cached_snapshot()`. Defaults to None, always walk the models.
+
+    Yields:
+        FleetResult: Result of each model, in the order they finish.
+    """
+    collectors = collectors or {}
+    connection_strs = list(connection_strs)
+    logger.info(f"Scanning {len(connection_strs)} models...")
+    failed = 0
+    executor = ProcessPoolExecutor(max_workers=max_workers)
+    futures = {}
+    try:
+        futures = {
+            executor.submit(
+                _scan_model, connection_str, collectors, snapshot, cache_dir
+            ): connection_str
+            for connection_str in connection_strs
+        }
+        for future in as_completed(futures):
+            try:
+                result = future.result()
+            except Exception as error:
+                # Worker died or the result couldn't be pickled.
+                result = FleetResult(
+                    futures[future], None, None, None, {}, {"worker": _error(error)}, None
+                )
+            if result.errors:
+                failed += 1
+                logger.warning(
+                    f"Errors scanning {result.server}::{result.database} - {result.errors}"
+                )
+            else:
+                logger.debug(f"Scanned {result.database} in {result.seconds:.2f}s")
+            yield result
+    finally:
+        # If stopped early (`break`, error, etc.), don't wait on the models still queued.
+        # Same as `shutdown(cancel_futures=True)`, which isn't in python 3.8.
+        cancelled = sum(future.cancel() for future in futures)
+        if cancelled:
+            logger.info(f"Stopped scan, cancelled {cancelled} queued models")
+        executor.shutdown(wait=False)
+    logger.info(f"Scanned {len(connection_strs)} models, {failed} with errors")
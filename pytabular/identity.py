@@ -0,0 +1,144 @@
+"""`identity.py` has the `IdentityMap`, one `PyObject` per .Net object across reloads.
+
+Without it, `reload_model_info()` builds a new `PyTable`, `PyColumn`, `PyMeasure`, etc.
+for every object in the model, and anything keyed on the old ones goes stale.
+With it, a `PyObject` is kept as is when wrapping the reloaded .Net object
+again would give the same thing (see `PyObject._unchanged()`).
+A `PyTable` is kept, with its children, when the table and its columns,
+measures and partitions are the same .Net objects. Otherwise the table and
+its children are new, and the old ones are left as they were,
+so a `ModelView` someone has pinned never changes.
+`PyObject`s of removed objects are dropped.
+
+Objects are keyed by their `LineageTag`, or by their path (ex. `Sales/Total Sales`)
+if they don't have one.
+
+Example:
+    ```python title="same PyObject after a reload"
+    measure = model.Measures["Total Sales"]
+    model.reload_model_info()
+    model.Measures["Total Sales"] is measure # (1)
+    ```
+
+    1. `True`, if nothing in the "Sales" table was added, removed or replaced.
+"""
+
+import logging
+from contextlib import contextmanager
+from typing import Dict, Iterator, Tuple
+from pytabular.object import PyObject
+
+logger = logging.getLogger("PyTabular")
+
+
+def identity_key(obj) -> Tuple[str, ...]:
+    """Key of a .Net object in the `IdentityMap`.
+
+    Args:
+        obj (MetadataObject): The .Net object.
+
+    Returns:
+        Tuple[str, ...]: `(object type, "LineageTag", tag)`,
+            or `(object type, *names)` with the names from the top of the model down.
+    """
+    object_type = str(obj.ObjectType)
+    lineage_tag = getattr(obj, "LineageTag", None)
+    if lineage_tag:
+        return (object_type, "LineageTag", str(lineage_tag))
+    names = []
+    while obj is not None and str(obj.ObjectType) not in ("Model", "Database"):
+        names.append(obj.Name)
+        obj = obj.Parent
+    return (object_type, *names[::-1])
+
+
+class IdentityMap:
+    """`PyObject` of each .Net object, kept by `Tabular` across reloads.
+
+    Attributes:
+        reused (int): `PyObject`s reused by the last `rebuild()`.
+        created (int): `PyObject`s created since the last `rebuild()` started.
+        dropped (int): `PyObject`s dropped by the last `rebuild()`.
+    """
+
+    def __init__(self) -> None:
+        """Starts empty."""
+        self._wrappers: Dict[Tuple[str, ...], PyObject] = {}
+        self._keys: Dict[object, Tuple[str, ...]] = {}
+        self._previous: Dict[Tuple[str, ...], PyObject] = {}
+        self.reused: int = 0
+        self.created: int = 0
+        self.dropped: int = 0
+
+    def __len__(self) -> int:
+        """Number of `PyObject`s in the map."""
+        return len(self._wrappers)
+
+    def __repr__(self) -> str:
+        """Size and counts of the last rebuild."""
+        return (
+            f"IdentityMap({len(self)} objects, {self.reused} reused, "
+            f"{self.created} created, {self.dropped} dropped)"
+        )
+
+    @contextmanager
+    def rebuild(self) -> Iterator["IdentityMap"]:
+        """Starts over for a reload.
+
+        `PyObject`s wrapped in the `with` block are kept,
+        the ones that weren't wrapped again are dropped at the end.
+        """
+        self._previous, self._wrappers, self._keys = self._wrappers, {}, {}
+        self.reused = self.created = 0
+        try:
+            yield self
+        finally:
+            self.dropped = len(self._previous)
+            self._previous = {}
+            logger.debug(f"Rebuilt {self}")
+
+    def wrap(self, cls: type, obj, *args) -> PyObject:
+        """The `PyObject` for a .Net object, reused if it was wrapped before the rebuild.
+
+        A `PyObject` is only reused if it is unchanged, it is never changed in place.
+        The children of a reused `PyObject` are kept with it.
+
+        Args:
+            cls (type): `PyObject` class, ex. `PyTable`.
+            obj (MetadataObject): The .Net object.
+            *args: Rest of the arguments for `cls`, ex. the `Tabular` class.
+
+        Returns:
+            PyObject: The reused or new `PyObject`.
+        """
+        key = identity_key(obj)
+        pyobject = self._previous.get(key)
+        if type(pyobject) is cls and pyobject._unchanged(obj, *args):
+            for child in pyobject._children():
+                self._keep(identity_key(child._object), child)
+                self.reused += 1
+            self.reused += 1
+        else:
+            pyobject = cls(obj, *args)
+            self.created += 1
+        self._keep(key, pyobject)
+        return pyobject
+
+    def _keep(self, key: Tuple[str, ...], pyobject: PyObject) -> None:
+        """Keeps a `PyObject` in the map, so it isn't dropped at the end of the rebuild."""
+        self._previous.pop(key, None)
+        if key in self._wrappers:
+            logger.debug(f"{key} is not unique... Not kept across reloads...")
+            return
+        self._wrappers[key] = pyobject
+        self._keys[pyobject._object] = key
+
+    def discard(self, obj) -> None:
+        """Drops the `PyObject` of a removed .Net object, if it was wrapped.
+
+        Args:
+            obj (MetadataObject): The removed .Net object.
+        """
+        key = self._keys.pop(obj, None)
+        if key is not None:
+            self._wrappers.pop(key, None)
@@ -0,0 +1,250 @@
+"""`journal.py` keeps a local history of every `save_changes()`.
+
+`ChangeJournal` appends each property change, added and removed object of a save
+to a SQLite file, with the time, user, server and database.
+Rows are indexed by table and time, so "what changed on this table since last week"
+is a quick query instead of diffing whole models.
+
+Example:
+    ```python title="turn on the journal"
+    import pytabular as p
+    model = p.Tabular(CONNECTION_STR)
+    model.journal = p.ChangeJournal("model_changes.db", retention_days=365) # (1)
+    model.Measures["Total Sales"].Description = "Sum of sales amount"
+    model.save_changes() # (2)
+    model.journal.changes(table="Sales", since="2024-01-01") # (3)
+    ```
+
+    1. Rows older than a year are pruned when the journal is opened.
+    2. The property change is written to `model_changes.db`.
+    3. `pd.DataFrame` of the changes on the "Sales" table since the date, newest first.
+"""
+
+import getpass
+import logging
+import sqlite3
+from contextlib import closing
+from datetime import datetime, timedelta, timezone
+from typing import List, Tuple, Union
+import pandas as pd
+
+logger = logging.getLogger("PyTabular")
+
+COLUMNS = [
+    "ts",
+    "user",
+    "server",
+    "database",
+    "kind",
+    "object_type",
+    "table_name",
+    "object_path",
+    "property",
+    "old",
+    "new",
+]
+"""Columns of the `changes` table."""
+
+_SCHEMA = f"""
+create table if not exists changes (
+    id integer primary key,
+    {", ".join(f"{column} text" for column in COLUMNS)}
+);
+create index if not exists changes_table_ts on changes (table_name, ts);
+create index if not exists changes_ts on changes (ts);
+"""
+
+
+def _timestamp(value: Union[datetime, str] = None) -> str:
+    """UTC timestamp as text that sorts by time. Naive datetimes are local time."""
+    if isinstance(value, str):
+        return value
+    value = value or datetime.now(timezone.utc)
+    return value.astimezone(timezone.utc).strftime("%Y-%m-%d %H:%M:%S.%f")
+
+
+def _text(value) -> str:
+    """Value as text for the journal. `None` stays `None`."""
+    return None if value is None else str(value)
+
+
+def _ancestors(obj) -> list:
+    """The object and its parents up to, but not including, the `Model`."""
+    chain = []
+    while obj is not None and str(obj.ObjectType) not in ("Model", "Database"):
+        chain.append(obj)
+        obj = obj.Parent
+    return chain[::-1]
+
+
+def _locate(obj, table: str = None) -> Tuple[str, str, str]:
+    """Object type, table name and path of a .Net object.
+
+    Path is the names from the top of the model down, ex. `Sales/Total Sales`.
+
+    Args:
+        obj (MetadataObject): The .Net object.
+        table (str, optional): Table of the object, for removed objects
+            that no longer have a `Parent`. Defaults to None.
+    """
+    chain = _ancestors(obj)
+    tables = [ancestor.Name for ancestor in chain if str(ancestor.ObjectType) == "Table"]
+    path = [ancestor.Name for ancestor in chain]
+    if len(tables) == 0 and table is not None:
+        tables, path = [table], [table] + path
+    return (
+        str(obj.ObjectType),
+        tables[0] if len(tables) > 0 else None,
+        "/".join(path),
+    )
+
+
+def _tables_of(model, objects) -> dict:
+    """Table name of each object, from the `PyObjects` of the model.
+
+    Removed objects have no `Parent`, but their `PyObject` still knows its table.
+    """
+    objects = set(objects)
+    if len(objects) == 0:
+        return {}
+    return {
+        pyobject._object: pyobject.Table.Name
+        for attr in ("Columns", "Measures", "Partitions")
+        for pyobject in getattr(model, attr)
+        if pyobject._object in objects
+    }
+
+
+class ChangeJournal:
+    """Append only journal of model changes in a SQLite file.
+
+    Assign it to `Tabular.journal` and every `save_changes()` is recorded.
+
+    Args:
+        path (str, optional): SQLite file. Created if needed.
+            Defaults to "pytabular_journal.db".
+        retention_days (int, optional): Rows older than this
+            are deleted when the journal is opened. Defaults to None, keep everything.
+    """
+
+    def __init__(
+        self, path: str = "pytabular_journal.db", retention_days: int = None
+    ) -> None:
+        """Creates the table and indexes if needed, then prunes old rows."""
+        self.path = path
+        self.retention_days = retention_days
+        with closing(self._connect()) as connection:
+            connection.executescript(_SCHEMA)
+        if retention_days is not None:
+            self.prune(retention_days)
+
+    def __repr__(self) -> str:
+        """Path of the journal."""
+        return f"ChangeJournal({self.path})"
+
+    def _connect(self) -> sqlite3.Connection:
+        """New connection to the journal."""
+        return sqlite3.connect(self.path)
+
+    def _append(self, rows: List[tuple]) -> int:
+        """Writes rows in one transaction."""
+        if len(rows) == 0:
+            return 0
+        with closing(self._connect()) as connection, connection:
+            connection.executemany(
+                f"insert into changes ({', '.join(COLUMNS)}) "
+                f"values ({', '.join('?' for _ in COLUMNS)})",
+                rows,
+            )
+        return len(rows)
+
+    def record(self, model, impact) -> int:
+        """Appends the impact of a `SaveChanges()`.
+
+        Called by `Tabular.save_changes()` when `Tabular.journal` is set,
+        before the `PyObjects` are patched or reloaded.
+
+        Args:
+            model (Tabular): The `Tabular` class that was saved.
+            impact (ModelOperationImpact): `Impact` from the `SaveChanges()` results.
+
+        Returns:
+            int: Number of rows written.
+        """
+        try:
+            user = getpass.getuser()
+        except Exception:
+            user = None
+        header = (_timestamp(), user, model.Server.Name, model.Database.Name)
+        rows = [
+            header + ("property", *_locate(change.Object))
+            + (
+                change.PropertyName,
+                _text(change.OriginalValue),
+                _text(change.NewValue),
+            )
+            for change in impact.PropertyChanges
+        ]
+        rows += [
+            header + ("added", *_locate(obj), None, None, None)
+            for obj in impact.AddedObjects
+        ]
+        removed = list(impact.RemovedObjects)
+        tables = _tables_of(model, removed)
+        rows += [
+            header + ("removed", *_locate(obj, tables.get(obj)), None, None, None)
+            for obj in removed
+        ]
+        written = self._append(rows)
+        logger.debug(f"Journaled {written} changes to {self.path}")
+        return written
+
+    def changes(
+        self,
+        table: str = None,
+        since: Union[datetime, str] = None,
+        object_type: str = None,
+    ) -> pd.DataFrame:
+        """Reads changes from the journal, newest first.
+
+        Args:
+            table (str, optional): Only changes to this table or objects in it.
+                Defaults to None.
+            since (Union[datetime, str], optional): Only changes at or after this time.
+                Strings are UTC, "YYYY-MM-DD HH:MM:SS". Defaults to None.
+            object_type (str, optional): Only this object type, ex. "Measure".
+                Defaults to None.
+
+        Returns:
+            pd.DataFrame: One row per change, with the `COLUMNS` of the journal.
+        """
+        filters, params = [], []
+        if table is not None:
+            filters.append("table_name = ?")
+            params.append(table)
+        if since is not None:
+            filters.append("ts >= ?")
+            params.append(_timestamp(since))
+        if object_type is not None:
+            filters.append("object_type = ?")
+            params.append(object_type)
+        where = f"where {' and '.join(filters)}" if len(filters) > 0 else ""
+        query = f"select {', '.join(COLUMNS)} from changes {where} order by ts desc, id desc"
+        with closing(self._connect()) as connection:
+            return pd.read_sql_query(query, connection, params=params)
+
+    def prune(self, days: int) -> int:
+        """Deletes changes older than `days`.
+
+        Args:
+            days (int): Number of days to keep.
+
+        Returns:
+            int: Number of rows deleted.
+        """
+        cutoff = _timestamp(datetime.now(timezone.utc) - timedelta(days=days))
+        with closing(self._connect()) as connection, connection:
+            deleted = connection.execute("delete from changes where ts < ?", (cutoff,))
+            deleted = deleted.rowcount
+        logger.debug(f"Pruned {deleted} changes older than {days} days from {self.path}")
+        return deleted
@@ -3,7 +3,8 @@
 import logging
 import datetime
 import os
-from typing import Dict, List
+from typing import Dict, Iterable, List
+import numpy as np
 import pandas as pd
 
 from pytabular.currency import unicodes
@@ -26,6 +27,21 @@ def ticks_to_datetime(ticks: int) -> datetime.datetime:
     return datetime.datetime(1, 1, 1) + datetime.timedelta(microseconds=ticks // 10)
 
 
+def ticks_to_datetime64(ticks: Iterable[int]) -> np.ndarray:
+    """Converts many C# system datetime ticks at once into numpy `datetime64`.
+
+    Same as `ticks_to_datetime()`, but vectorized for arrays of ticks.
+
+    Args:
+            ticks (Iterable[int]): C# DateTime Ticks.
+
+    Returns:
+            np.ndarray: `datetime64[us]` array of ticks.
+    """
+    ticks = np.asarray(ticks, dtype=np.int64)
+    return np.datetime64("0001-01-01", "us") + (ticks // 10).astype("timedelta64[us]")
+
+
 def pandas_datatype_to_tabular_datatype(df: pd.DataFrame) -> Dict:
     """Takes dataframe columns and gets respective tabular column datatype.
 
@@ -5,9 +5,11 @@ will be done through these classes.
 """
 
 import logging
+from contextlib import nullcontext
 import pandas as pd
 from pytabular.object import PyObject, PyObjects
 from Microsoft.AnalysisServices.Tabular import Measure, Table
+from rich.table import Table as RichTable
 
 
 logger = logging.getLogger("PyTabular")
@@ -19,35 +21,39 @@ class PyMeasure(PyObject):
     See methods for available functionality.
     """
 
+    __slots__ = ("Table",)
+
     def __init__(self, object, table) -> None:
         """Connects measure to parent `PyTable`.
 
-        It will also add some custom rows for the `rich`
-        table display.
-
         Args:
             object (object.PyObject): The .Net measure object.
             table (table.PyTable): The parent `PyTable`.
         """
         super().__init__(object)
         self.Table = table
-        self._display.add_row("Expression", self._object.Expression, end_section=True)
-        self._display.add_row("DisplayFolder", self._object.DisplayFolder)
-        self._display.add_row("IsHidden", str(self._object.IsHidden))
-        self._display.add_row("FormatString", self._object.FormatString)
+
+    def _build_display(self) -> RichTable:
+        """Adds some custom measure rows for the `rich` table display."""
+        display = super()._build_display()
+        display.add_row("Expression", self._object.Expression, end_section=True)
+        display.add_row("DisplayFolder", self._object.DisplayFolder)
+        display.add_row("IsHidden", str(self._object.IsHidden))
+        display.add_row("FormatString", self._object.FormatString)
+        return display
 
     def get_dependencies(self) -> pd.DataFrame:
         """Get the dependant objects of a measure.
 
+        Read from `Tabular.dependencies`, so only the first call queries the model.
+
         Returns:
             pd.DataFrame: The Return Value is a Pandas dataframe
                             which displays all the dependancies
                             of the object.
 
         """
-        dmv_query = f"select * from $SYSTEM.DISCOVER_CALC_DEPENDENCY where \
-            [OBJECT] = '{self.Name}' and [TABLE] = '{self.Table.Name}'"
-        return self.Table.Model.query(dmv_query)
+        return self.Table.Model.dependencies.depends_on(self.Table.Name, self.Name)
 
 
 class PyMeasures(PyObjects):
@@ -61,6 +67,16 @@ class PyMeasures(PyObjects):
     `model.Measures.find('ratio')`.
     """
 
+    _frame_properties = [
+        "Name",
+        "Parent.Name",
+        "IsHidden",
+        "Description",
+        "DisplayFolder",
+        "FormatString",
+        "Expression",
+    ]
+
     def __init__(self, objects, parent=None) -> None:
         """Extends init from `PyObjects`."""
         super().__init__(objects, parent)
@@ -102,7 +118,8 @@ class PyMeasures(PyObjects):
             name (str): Name of the measure. Brackets ARE NOT required.
             expression (str): DAX expression for the measure.
             auto_save (bool, optional): Automatically save changes after measure creations.
-                Defaults to `True`
+                Defaults to `True`. The `Tabular.write_lock()` is held
+                from the change through the save.
         """
         if isinstance(self.parent._object, Table):
             table = self.parent
@@ -113,6 +130,13 @@ class PyMeasures(PyObjects):
 
         logger.debug(f"Creating measure in {table.Name}")
 
+        with model.write_lock() if auto_save else nullcontext():
+            return self._add_measure(model, table, name, expression, auto_save, kwargs)
+
+    def _add_measure(
+        self, model, table, name: str, expression: str, auto_save: bool, kwargs: dict
+    ) -> PyMeasure:
+        """Creates or overwrites the measure for `add_measure()`."""
         new = True
 
         try:
@@ -4,10 +4,28 @@ These classes are used with the others (Tables, Columns, Measures, Partitions, e
 """
 
 from __future__ import annotations
+import copy
+import logging
 from abc import ABC
+from contextlib import nullcontext
 from rich.console import Console
 from rich.table import Table
 from collections.abc import Iterable
+from typing import Any, Iterator, List, Tuple, Union
+import numpy as np
+import pandas as pd
+
+logger = logging.getLogger("PyTabular")
+
+
+def clear_property_caches() -> None:
+    """Invalidates the property cache of every `PyObject`, and the name index of every `PyObjects`.
+
+    Caches are cleared lazily, on their next read.
+    Called in `Tabular.save_changes()` and `Tabular.reload_model_info()`.
+    """
+    PyObject._cache_version += 1
+    PyObject._names_version += 1
 
 
 class PyObject(ABC):
@@ -15,46 +33,130 @@ class PyObject(ABC):
 
     Notice the magic methods. `__rich_repr__()` starts the baseline for displaying your model.
     It uses the amazing `rich` python package and
-    builds your display from the `self._display`.
+    builds your display from `self._build_display()`.
     `__getattr__()` will check in `self._object`, if unable to find anything in `self`.
     This will let you pull properties from the main .Net class.
+    `__setattr__()` does the same when setting,
+    except for the attributes the `PyObject` keeps itself, see `_wrapper_attrs`.
+    Reads from `self._object` can be cached, see `cache_properties()`.
     """
 
+    __slots__ = ("_object", "_cache", "_cached_version")
+    _cache_version = 0
+    _names_version = 0
+    _wrapper_attrs = frozenset()
+    """Attributes set on the `PyObject` itself, not on `self._object`."""
+
     def __init__(self, object) -> None:
         """Init to create your PyObject.
 
         This will take the `object` and
         set as an attribute to the `self._object`.
         You can use that if you want to interact directly with the .Net object.
-        It will also begin to build out a default `rich` table display.
+        The `rich` table display is not built here,
+        see `_build_display()`.
 
         Args:
             object (.Net object): A .Net object.
         """
         self._object = object
-        self._display = Table(title=self.Name)
-        self._display.add_column(
-            "Properties", justify="right", style="cyan", no_wrap=True
-        )
-        self._display.add_column("", justify="left", style="magenta", no_wrap=False)
+        self._cache = None
+        self._cached_version = PyObject._cache_version
+
+    def _unchanged(self, object, *args) -> bool:
+        """`True` if `type(self)(object, *args)` would be the same as `self`.
+
+        Used by the `IdentityMap` to keep `PyObject`s across reloads.
+        `False` unless a subclass knows better.
+        """
+        return False
 
-        self._display.add_row("Name", self.Name)
-        self._display.add_row("ObjectType", str(self.ObjectType))
+    def _children(self) -> tuple:
+        """`PyObject`s that belong to `self`, ex. the columns of a `PyTable`."""
+        return ()
+
+    def _build_display(self) -> Table:
+        """Builds the default `rich` table display.
+
+        Only called when the object is displayed, so none of the .Net properties
+        shown in the table are read while the model is loading.
+        Subclasses extend this to add their own rows.
+
+        Returns:
+            Table: `rich` table with the object's properties.
+        """
+        display = Table(title=self.Name)
+        display.add_column("Properties", justify="right", style="cyan", no_wrap=True)
+        display.add_column("", justify="left", style="magenta", no_wrap=False)
+
+        display.add_row("Name", self.Name)
+        display.add_row("ObjectType", str(self.ObjectType))
         if str(self.ObjectType) not in "Model":
-            self._display.add_row("ParentName", self.Parent.Name)
-            self._display.add_row(
+            display.add_row("ParentName", self.Parent.Name)
+            display.add_row(
                 "ParentObjectType",
                 str(self.Parent.ObjectType),
                 end_section=True,
             )
+        return display
+
+    @property
+    def _display(self) -> Table:
+        """The `rich` table display. Built fresh on each access."""
+        return self._build_display()
 
     def __rich_repr__(self) -> str:
         """See [Rich Repr](https://rich.readthedocs.io/en/stable/pretty.html#rich-repr-protocol)."""
-        Console().print(self._display)
+        Console().print(self._build_display())
 
     def __getattr__(self, attr):
-        """Searches in `self._object`."""
-        return getattr(self._object, attr)
+        """Searches in `self._object`. Uses the property cache if enabled."""
+        if attr in PyObject.__slots__:
+            raise AttributeError(attr)
+        cache = getattr(self, "_cache", None)
+        if cache is None:
+            return getattr(self._object, attr)
+        if self._cached_version != PyObject._cache_version:
+            cache.clear()
+            self._cached_version = PyObject._cache_version
+        try:
+            return cache[attr]
+        except KeyError:
+            value = cache[attr] = getattr(self._object, attr)
+            return value
+
+    def __setattr__(self, attr, value):
+        """Sets the attribute on `self` or on `self._object`.
+
+        Names starting with `_`, names in `_wrapper_attrs`
+        and names the class already has (slots, methods, properties) are set on `self`.
+        Everything else is set on `self._object`,
+        so for example `column.IsHidden = True` sets the .Net property,
+        and is dropped from the property cache.
+        A read only property, for example `model.Tables = ...`, raises `AttributeError`.
+        """
+        if attr[0] == "_" or attr in self._wrapper_attrs or hasattr(type(self), attr):
+            object.__setattr__(self, attr, value)
+            return
+        setattr(self._object, attr, value)
+        if attr == "Name":
+            PyObject._names_version += 1
+        cache = getattr(self, "_cache", None)
+        if cache is not None:
+            cache.pop(attr, None)
+
+    def cache_properties(self, enabled: bool = True) -> None:
+        """Turns on (or off) caching of the properties read from `self._object`.
+
+        Once read, a property is kept until `save_changes()`, or until it is set
+        through the `PyObject`. Changes made straight to `self._object`
+        or from outside of PyTabular are not seen until then.
+
+        Args:
+            enabled (bool, optional): `False` turns caching off. Defaults to True.
+        """
+        self._cache = {} if enabled else None
+        self._cached_version = PyObject._cache_version
 
 
 class PyObjects:
@@ -62,15 +164,18 @@ class PyObjects:
 
     Notice the magic methods. `__rich_repr__()` starts the baseline for displaying your model.
     It uses the amazing `rich` python package and
-    builds your display from the `self._display`.
+    builds your display from `self._build_display()`.
     Still building out the magic methods to give `PyObjects` more flexibility.
     """
 
+    _frame_properties = ["Name"]
+    """Default properties for `to_dataframe()`."""
+
     def __init__(self, objects: list[PyObject], parent=None) -> None:
         """Initialization of `PyObjects`.
 
         Takes the objects in something that is iterable.
-        Then will build a default `rich` table display.
+        The default `rich` table display is built when displayed.
 
         Args:
             objects(list[PyObject]): .Net objects.
@@ -78,25 +183,62 @@ class PyObjects:
         """
         self._objects = objects
         self.parent = parent
-        self._display = Table(title=str(self.__class__.mro()[0]))
+        self._index = None
+        self._indexed_version = PyObject._names_version
+
+    def _build_display(self) -> Table:
+        """Builds the default `rich` table display, only when displayed.
+
+        Returns:
+            Table: `rich` table with the index and name of each object.
+        """
+        display = Table(title=str(self.__class__.mro()[0]))
         for index, obj in enumerate(self._objects):
-            self._display.add_row(str(index), obj.Name)
+            display.add_row(str(index), obj.Name)
+        return display
+
+    @property
+    def _display(self) -> Table:
+        """The `rich` table display. Built fresh on each access."""
+        return self._build_display()
 
     def __rich_repr__(self) -> str:
         """See [Rich Repr](https://rich.readthedocs.io/en/stable/pretty.html#rich-repr-protocol)."""
-        Console().print(self._display)
+        Console().print(self._build_display())
+
+    def _name_index(self) -> dict:
+        """Name to `PyObject` index. Built on first use.
+
+        If names are duplicated, the last one wins.
+        Rebuilt after a `PyObject` is renamed through PyTabular,
+        and after `clear_property_caches()`.
+
+        Returns:
+            dict: `{PyObject.Name: PyObject}`
+        """
+        if self._index is None or self._indexed_version != PyObject._names_version:
+            self._indexed_version = PyObject._names_version
+            self._index = {pyobject.Name: pyobject for pyobject in self._objects}
+        return self._index
 
     def __getitem__(self, object):
         """Get item from `PyObjects`.
 
         Checks if item is str or int.
-        If string will iterate through and try to find matching name.
+        If string will look up the matching name in `self._name_index()`.
+        If the object found has been renamed outside of PyTabular, the index is rebuilt.
+        A missing name doesn't rebuild the index.
         Otherwise, will call into `self._objects[int]` to retrieve item.
         """
         if isinstance(object, str):
-            return [pyobject for pyobject in self._objects if object == pyobject.Name][
-                -1
-            ]
+            pyobject = self._name_index().get(object)
+            if pyobject is not None and pyobject.Name != object:
+                logger.debug(f"{object} was renamed, rebuilding index...")
+                self._index = None
+                pyobject = self._name_index().get(object)
+            if pyobject is None:
+                raise IndexError(f"{object} not found in {self.__class__.__name__}")
+            return pyobject
         elif isinstance(object, slice):
             cls = type(self)
             return cls(self._objects[object])
@@ -120,14 +262,41 @@ class PyObjects:
 
         This is useful for building out a custom `PyObjects` class to work with.
         """
-        if isinstance(obj, Iterable):
-            self._objects.__iadd__(obj._objects)
-        else:
-            self._objects.__iadd__([obj])
+        new_objects = list(obj._objects) if isinstance(obj, Iterable) else [obj]
+        self._objects.__iadd__(new_objects)
 
-        self.__init__(self._objects)
+        if self._index is not None:
+            self._index.update((pyobject.Name, pyobject) for pyobject in new_objects)
         return self
 
+    def cache_properties(self, enabled: bool = True) -> None:
+        """Turns on (or off) the property cache of every `PyObject` in `PyObjects`."""
+        for pyobject in self._objects:
+            pyobject.cache_properties(enabled)
+
+    def _changed(self, removed=frozenset(), added=(), replaced=None) -> PyObjects:
+        """Copy-on-write change, `self` is left as is.
+
+        Used to patch the model without changing collections that might be in use.
+
+        Args:
+            removed (set, optional): .Net objects to leave out.
+            added (Iterable[PyObject], optional): `PyObject`(s) to add at the end.
+            replaced (dict, optional): `{PyObject: PyObject}` to swap in, in place.
+
+        Returns:
+            PyObjects: A new `PyObjects` of the same class.
+        """
+        replaced = replaced or {}
+        changed = copy.copy(self)
+        changed._objects = [
+            replaced.get(pyobject, pyobject)
+            for pyobject in self._objects
+            if pyobject._object not in removed
+        ] + list(added)
+        changed._index = None
+        return changed
+
     def _first_visible_object(self):
         """Does what the method is called. Get's first `object.IsHidden is False`."""
         for object in self:
@@ -154,6 +323,176 @@ class PyObjects:
         ]
         return self.__class__.mro()[0](items)
 
+    def to_dataframe(self, properties: List[str] = None) -> pd.DataFrame:
+        """Reads properties of every `PyObject` into a `pd.DataFrame` in one pass.
+
+        Rows are in the same order as the `PyObjects`,
+        so the index can be used with `where()`.
+        .Net values that aren't a str, bool, int or float are converted with `str()`.
+
+        Args:
+            properties (List[str], optional): Properties to read. Can go through
+                objects with a `.`, for example `"Parent.Name"`.
+                Defaults to `self._frame_properties`.
+
+        Returns:
+            pd.DataFrame: One row per `PyObject`, one column per property.
+
+        Example:
+            ```python
+            model.Columns.to_dataframe(["Name", "Parent.Name", "IsHidden"])
+            ```
+        """
+        properties = properties or self._frame_properties
+        paths = [property.split(".") for property in properties]
+
+        def read(pyobject, path):
+            """Reads a property path and converts it to a python value."""
+            value = pyobject
+            for attr in path:
+                if value is None:
+                    return None
+                value = getattr(value, attr)
+            if value is None or isinstance(value, (str, bool, int, float)):
+                return value
+            return str(value)
+
+        rows = [[read(pyobject, path) for path in paths] for pyobject in self._objects]
+        return pd.DataFrame(rows, columns=properties)
+
+    def where(self, mask) -> PyObjects:
+        """Returns the `PyObject`(s) where `mask` is `True`.
+
+        Args:
+            mask (Union[pd.Series, list]): Booleans from a `to_dataframe()` frame.
+                A `pd.Series` can be filtered down already,
+                its index is used to find the `PyObject`(s).
+
+        Returns:
+            PyObjects: Returns a `PyObjects` class with the matching `PyObject`(s).
+
+        Example:
+            ```python
+            df = model.Columns.to_dataframe(["DataType", "IsHidden", "Description"])
+            model.Columns.where(
+                (df["DataType"] == "String") & df["IsHidden"] & (df["Description"] == "")
+            ) # (1)
+            ```
+
+            1. Hidden string columns without a description.
+        """
+        if isinstance(mask, pd.Series):
+            positions = mask.index[mask.to_numpy(dtype=bool)]
+        else:
+            positions = np.flatnonzero(np.asarray(mask, dtype=bool))
+        items = [self._objects[position] for position in positions]
+        return self.__class__.mro()[0](items)
+
+    def _tabular(self):
+        """The `Tabular` class the `PyObject`(s) belong to."""
+        pyobject = self._objects[0]
+        table = getattr(pyobject, "Table", None)
+        return (table if isinstance(table, PyObject) else pyobject).Model
+
+    def _assignments(self, updates) -> Iterator[Tuple[PyObject, str, Any]]:
+        """Yields `(PyObject, property, value)` for each update in `set_properties()`."""
+        if isinstance(updates, pd.DataFrame):
+            table_key = next(
+                (key for key in ("Table", "Parent.Name") if key in updates.columns), None
+            )
+            keys = ["Name"] + ([table_key] if table_key else [])
+            properties = [column for column in updates.columns if column not in keys]
+            if table_key:
+                lookup = {
+                    (pyobject.Parent.Name, pyobject.Name): pyobject
+                    for pyobject in self._objects
+                }
+            for row in updates.to_dict("records"):
+                if table_key:
+                    try:
+                        pyobject = lookup[(row[table_key], row["Name"])]
+                    except KeyError:
+                        raise IndexError(
+                            f"{row[table_key]}.{row['Name']} not found in "
+                            f"{self.__class__.__name__}"
+                        )
+                else:
+                    pyobject = self[row["Name"]]
+                for property in properties:
+                    value = row[property]
+                    if value is None or (isinstance(value, float) and np.isnan(value)):
+                        continue
+                    yield pyobject, property, value
+        elif all(isinstance(value, dict) for value in updates.values()):
+            for name, properties in updates.items():
+                pyobject = self[name]
+                for property, value in properties.items():
+                    yield pyobject, property, value
+        else:
+            for pyobject in self._objects:
+                for property, value in updates.items():
+                    yield pyobject, property, value
+
+    def set_properties(
+        self, updates: Union[dict, pd.DataFrame], auto_save: bool = True
+    ) -> int:
+        """Sets properties on many `PyObject`(s), then saves once.
+
+        Properties are set on the .Net objects, see `PyObject._object`.
+        Values that are already set are skipped.
+        With `auto_save`, `save_changes()` runs once at the end,
+        and the `PyObjects` are patched from the changes instead of reloaded.
+        The `Tabular.write_lock()` is held from the first change through the save.
+
+        Args:
+            updates (Union[dict, pd.DataFrame]): One of
+                `{property: value}` to set on every `PyObject`,
+                `{name: {property: value}}` to set per `PyObject`,
+                or a `pd.DataFrame` with a `Name` column, an optional `Table`
+                (or `Parent.Name`) column for duplicate names, and a column per property.
+                Empty (`NaN` or `None`) cells in the `pd.DataFrame` are skipped.
+            auto_save (bool, optional): Save changes once done. Defaults to True.
+
+        Returns:
+            int: Number of properties changed.
+
+        Example:
+            ```python
+            model.Tables["Sales"].Measures.set_properties({"DisplayFolder": "Sales"})
+
+            df = model.Measures.to_dataframe(["Name", "Parent.Name", "FormatString"])
+            df["FormatString"] = df["FormatString"].replace("", "#,0")
+            model.Measures.set_properties(df) # (1)
+            ```
+
+            1. Only measures without a format string are changed.
+        """
+        assignments = 0
+        changed = 0
+        lock = (
+            self._tabular().write_lock()
+            if auto_save and len(self._objects) > 0
+            else nullcontext()
+        )
+        with lock:
+            for pyobject, property, value in self._assignments(updates):
+                assignments += 1
+                current = getattr(pyobject._object, property)
+                if current == value or (
+                    current is not None
+                    and not isinstance(current, (str, bool, int, float))
+                    and str(current) == str(value)
+                ):
+                    continue
+                setattr(pyobject._object, property, value)
+                if pyobject._cache is not None:
+                    pyobject._cache.pop(property, None)
+                changed += 1
+            logger.info(f"Set {changed} properties, {assignments - changed} already set")
+            if auto_save and changed > 0:
+                self._tabular().save_changes()
+        return changed
+
     def get(self, object_str: str, alt_result: str = "") -> str:
         """Gets the object based on str.
 
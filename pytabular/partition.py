@@ -9,6 +9,7 @@ from pytabular.object import PyObject, PyObjects
 from logic_utils import ticks_to_datetime
 import pandas as pd
 from datetime import datetime
+from rich.table import Table
 
 logger = logging.getLogger("PyTabular")
 
@@ -19,25 +20,28 @@ class PyPartition(PyObject):
     See methods for available uses.
     """
 
+    __slots__ = ("Table",)
+
     def __init__(self, object, table) -> None:
         """Extends from `PyObject` class.
 
-        Adds a few custom rows to `rich` table for the partition.
-
         Args:
             object (Partition): .Net Partition object.
             table (PyTable): Parent table of the partition in question.
         """
         super().__init__(object)
         self.Table = table
-        self._display.add_row("Mode", str(self._object.Mode))
-        self._display.add_row("State", str(self._object.State))
-        self._display.add_row(
-            "SourceType", str(self._object.SourceType), end_section=True
-        )
-        self._display.add_row(
+
+    def _build_display(self) -> Table:
+        """Adds a few custom rows to `rich` table for the partition."""
+        display = super()._build_display()
+        display.add_row("Mode", str(self._object.Mode))
+        display.add_row("State", str(self._object.State))
+        display.add_row("SourceType", str(self._object.SourceType), end_section=True)
+        display.add_row(
             "RefreshedTime", self.last_refresh().strftime("%m/%d/%Y, %H:%M:%S")
         )
+        return display
 
     def last_refresh(self) -> datetime:
         """Queries `RefreshedTime` attribute in the partition.
@@ -72,6 +76,8 @@ class PyPartitions(PyObjects):
     `model.Partitions.find('prev-year')`.
     """
 
+    _frame_properties = ["Name", "Parent.Name", "SourceType", "Mode", "State"]
+
     def __init__(self, objects) -> None:
         """Extends through to `PyObjects`."""
         super().__init__(objects)
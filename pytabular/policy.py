@@ -0,0 +1,302 @@
+"""`policy.py` keeps date partitioned tables to a rolling window.
+
+A `RefreshPolicy` says how many years to keep and how many months to refresh.
+`PyTable.apply_refresh_policy()` then creates, merges and removes partitions
+to match it, and refreshes only the "hot" months and the new partitions.
+
+Partitions are cloned from a template partition. Its M or SQL source
+uses two placeholders, `RangeStart` and `RangeEnd` by default,
+which are replaced by date literals for each partition.
+The template is kept in an annotation on the table and the template partition
+is removed, so it doesn't load the same rows as the policy partitions.
+
+Partitions are named `{table} {YYYY}` for a year and `{table} {YYYY-MM}` for a month.
+The current year, and last year while it has hot months,
+are monthly. Older years are merged into one partition per year.
+
+Example:
+    ```python title="nightly"
+    import pytabular as p
+    model = p.Tabular(CONNECTION_STR)
+    policy = p.RefreshPolicy(keep_years=3, refresh_months=2)
+    model.Tables["Sales"].apply_refresh_policy(policy, template="Sales Template") # (1)
+    model.Tables["Sales"].apply_refresh_policy(policy) # (2)
+    ```
+
+    1. First run, the M of the "Sales Template" partition has
+    `each [Date] >= RangeStart and [Date] < RangeEnd`.
+    2. Runs after that read the template from the table's annotation.
+"""
+
+import logging
+import re
+from collections import namedtuple
+from datetime import date
+from typing import Dict, List, Tuple
+import pandas as pd
+from Microsoft.AnalysisServices.Tabular import Annotation
+
+logger = logging.getLogger("PyTabular")
+
+TEMPLATE_ANNOTATION = "PyTabular_RefreshPolicyTemplate"
+"""Name of the table annotation that keeps the template source."""
+
+PolicyAction = namedtuple("PolicyAction", ["action", "partition", "start", "end"])
+PolicyAction.__doc__ = """One step of applying a `RefreshPolicy`.
+
+Attributes:
+    action (str): "create", "merge", "remove" or "refresh".
+        "merge" is a month partition merged into its year partition.
+    partition (str): Name of the partition. For "merge", the month partition.
+    start (date): First day in the partition.
+    end (date): First day after the partition.
+"""
+
+
+def _add_months(day: date, months: int) -> date:
+    """First of the month, `months` after (or before) the month of `day`."""
+    month = day.year * 12 + day.month - 1 + months
+    return date(month // 12, month % 12 + 1, 1)
+
+
+def _source_attr(partition) -> str:
+    """Attribute of the partition source that has the M or SQL."""
+    for attr in ("Expression", "Query"):
+        if getattr(partition.Source, attr, None) is not None:
+            return attr
+    raise ValueError(f"{partition.Name} has no M or SQL source to use as a template")
+
+
+class RefreshPolicy:
+    """Rolling window of partitions for a date partitioned table.
+
+    Args:
+        keep_years (int): Full years to keep before the current one.
+            Older partitions are removed.
+        refresh_months (int, optional): Months to refresh, counting the current month.
+            Defaults to 1.
+        start_parameter (str, optional): Placeholder for the first day in the template.
+            Defaults to "RangeStart".
+        end_parameter (str, optional): Placeholder for the first day after.
+            Defaults to "RangeEnd".
+        date_format (str, optional): `str.format()` of the date literals,
+            with the date as `d`. Defaults to None, `#date(...)` for M and
+            `'YYYY-MM-DD'` for SQL.
+    """
+
+    def __init__(
+        self,
+        keep_years: int,
+        refresh_months: int = 1,
+        start_parameter: str = "RangeStart",
+        end_parameter: str = "RangeEnd",
+        date_format: str = None,
+    ) -> None:
+        """Checks and sets the policy."""
+        if keep_years < 0 or refresh_months < 1:
+            raise ValueError("keep_years can't be negative and refresh_months must be 1 or more")
+        self.keep_years = keep_years
+        self.refresh_months = refresh_months
+        self.start_parameter = start_parameter
+        self.end_parameter = end_parameter
+        self.date_format = date_format
+
+    def __repr__(self) -> str:
+        """Years kept and months refreshed."""
+        return (
+            f"RefreshPolicy(keep_years={self.keep_years}, "
+            f"refresh_months={self.refresh_months})"
+        )
+
+    def periods(self, today: date = None) -> Dict[str, Tuple[date, date]]:
+        """Partitions the policy wants, by period.
+
+        Args:
+            today (date, optional): Defaults to `date.today()`.
+
+        Returns:
+            Dict[str, Tuple[date, date]]: `YYYY` or `YYYY-MM` to the first day
+                in the period and the first day after it, oldest first.
+        """
+        today = today or date.today()
+        first_hot = _add_months(today, 1 - self.refresh_months)
+        monthly_from = date(min(today.year, first_hot.year), 1, 1)
+        periods = {
+            str(year): (date(year, 1, 1), date(year + 1, 1, 1))
+            for year in range(today.year - self.keep_years, monthly_from.year)
+        }
+        month = monthly_from
+        while month <= today:
+            periods[month.strftime("%Y-%m")] = (month, _add_months(month, 1))
+            month = _add_months(month, 1)
+        return periods
+
+    def plan(self, prefix: str, existing: List[str], today: date = None) -> List[PolicyAction]:
+        """Steps to get from the `existing` partitions to the policy.
+
+        Args:
+            prefix (str): Start of the partition names, usually the table name.
+            existing (List[str]): Names of the partitions of the table.
+                Names that don't match `{prefix} YYYY` or `{prefix} YYYY-MM` are ignored.
+            today (date, optional): Defaults to `date.today()`.
+
+        Returns:
+            List[PolicyAction]: Creates, then merges, removes and refreshes.
+        """
+        today = today or date.today()
+        pattern = re.compile(rf"^{re.escape(prefix)} (\d{{4}}(?:-\d{{2}})?)$")
+        current = {
+            match.group(1): name
+            for name, match in ((name, pattern.match(name)) for name in existing)
+            if match is not None
+        }
+        wanted = self.periods(today)
+        hot = _add_months(today, 1 - self.refresh_months)
+        creates, merges, removes, refreshes = [], [], [], []
+        for period, (start, end) in wanted.items():
+            name = f"{prefix} {period}"
+            months = [
+                month
+                for month in current
+                if len(period) == 4 and len(month) == 7 and month.startswith(period)
+            ]
+            if period not in current:
+                creates.append(PolicyAction("create", name, start, end))
+                if len(months) == 0:
+                    refreshes.append(PolicyAction("refresh", name, start, end))
+            elif end > hot:
+                refreshes.append(PolicyAction("refresh", name, start, end))
+            for month in sorted(months):
+                month_start = date(int(month[:4]), int(month[5:]), 1)
+                merges.append(
+                    PolicyAction(
+                        "merge", current[month], month_start, _add_months(month_start, 1)
+                    )
+                )
+        merged = {action.partition for action in merges}
+        for period, name in sorted(current.items()):
+            if period not in wanted and name not in merged:
+                start = date(int(period[:4]), int(period[5:] or 1), 1)
+                end = _add_months(start, 1 if len(period) == 7 else 12)
+                removes.append(PolicyAction("remove", name, start, end))
+        return creates + merges + removes + refreshes
+
+    def literal(self, day: date, source_attr: str) -> str:
+        """Date literal for a template.
+
+        Args:
+            day (date): The date.
+            source_attr (str): "Expression" for M, "Query" for SQL.
+
+        Returns:
+            str: The literal, ex. `#date(2024, 1, 1)` or `'2024-01-01'`.
+        """
+        if self.date_format is not None:
+            return self.date_format.format(d=day)
+        if source_attr == "Expression":
+            return f"#date({day.year}, {day.month}, {day.day})"
+        return f"'{day.isoformat()}'"
+
+    def render(self, template: str, start: date, end: date, source_attr: str) -> str:
+        """Template with the placeholders replaced by date literals.
+
+        Args:
+            template (str): M or SQL with the placeholders.
+            start (date): First day in the partition.
+            end (date): First day after the partition.
+            source_attr (str): "Expression" for M, "Query" for SQL.
+
+        Returns:
+            str: Source of the partition.
+        """
+        for parameter, day in ((self.start_parameter, start), (self.end_parameter, end)):
+            template = re.sub(
+                rf"(?<![\w@]){re.escape(parameter)}(?!\w)|@{re.escape(parameter)}\b",
+                self.literal(day, source_attr),
+                template,
+            )
+        return template
+
+
+def _template(table, policy: RefreshPolicy, template) -> Tuple[str, object]:
+    """Template source, and the template partition if it should be removed."""
+    annotation = table._object.Annotations.Find(TEMPLATE_ANNOTATION)
+    if template is None and annotation is not None:
+        return annotation.Value, None
+    if template is None:
+        raise ValueError(
+            f"{table.Name} has no refresh policy template yet... Pass `template`"
+        )
+    if isinstance(template, str) and template not in [p.Name for p in table.Partitions]:
+        return template, None
+    partition = table.Partitions[template] if isinstance(template, str) else template
+    source = getattr(partition.Source, _source_attr(partition))
+    if policy.start_parameter not in source or policy.end_parameter not in source:
+        raise ValueError(
+            f"{partition.Name} doesn't use {policy.start_parameter} and {policy.end_parameter}"
+        )
+    return source, partition
+
+
+def apply_refresh_policy(
+    table,
+    policy: RefreshPolicy,
+    template=None,
+    today: date = None,
+    refresh: bool = True,
+    **kwargs,
+) -> pd.DataFrame:
+    """Creates, merges and removes partitions to match the policy, then refreshes.
+
+    See `PyTable.apply_refresh_policy()`.
+    """
+    model = table.Model
+    with model.write_lock():
+        source, template_partition = _template(table, policy, template)
+        actions = policy.plan(table.Name, [p.Name for p in table.Partitions], today)
+        prototype = (template_partition or table.Partitions[0])._object
+        source_attr = _source_attr(prototype)
+        for action in actions:
+            if action.action == "create":
+                logger.info(f"Creating partition {action.partition}")
+                partition = prototype.Clone()
+                partition.Name = action.partition
+                setattr(
+                    partition.Source,
+                    source_attr,
+                    policy.render(source, action.start, action.end, source_attr),
+                )
+                table._object.Partitions.Add(partition)
+            elif action.action == "remove":
+                logger.info(f"Removing partition {action.partition}")
+                table._object.Partitions.Remove(action.partition)
+        annotation = table._object.Annotations.Find(TEMPLATE_ANNOTATION)
+        if annotation is None:
+            annotation = Annotation()
+            annotation.Name = TEMPLATE_ANNOTATION
+            table._object.Annotations.Add(annotation)
+        annotation.Value = source
+        if template_partition is not None:
+            logger.info(f"Removing template partition {template_partition.Name}")
+            table._object.Partitions.Remove(template_partition.Name)
+        model.save_changes()
+        # `save_changes()` publishes new `PyTable`s, get the current one.
+        table = model.Tables[table.Name]
+
+        merges: Dict[str, List] = {}
+        for action in actions:
+            if action.action == "merge":
+                year = f"{table.Name} {action.start.year}"
+                merges.setdefault(year, []).append(table.Partitions[action.partition]._object)
+        for year, months in merges.items():
+            logger.info(f"Merging {len(months)} months into {year}")
+            table.Partitions[year]._object.RequestMerge(months)
+        if len(merges) > 0:
+            model.save_changes()
+            table = model.Tables[table.Name]
+
+        hot = [action.partition for action in actions if action.action == "refresh"]
+        if refresh and len(hot) > 0:
+            logger.info(f"Refreshing {len(hot)} of {len(table.Partitions)} partitions")
+            model.refresh({table: [table.Partitions[name] for name in hot]}, **kwargs)
+    return pd.DataFrame(actions, columns=PolicyAction._fields)
@@ -3,7 +3,10 @@
 Main class is `Tabular()`. Use that for connecting with your models.
 """
 
+import functools
 import logging
+import threading
+from types import SimpleNamespace
 
 from Microsoft.AnalysisServices.Tabular import (
     Server,
@@ -12,9 +15,11 @@ from Microsoft.AnalysisServices.Tabular import (
     DataColumn,
     Partition,
     MPartitionSource,
+    SaveOptions,
 )
 
 from typing import List, Union
+from rich.table import Table as RichTable
 from collections import namedtuple
 import pandas as pd
 import os
@@ -33,13 +38,30 @@ from pytabular.column import PyColumns
 from pytabular.measure import PyMeasures
 from pytabular.culture import PyCultures, PyCulture
 from pytabular.relationship import PyRelationship, PyRelationships
-from pytabular.object import PyObject
+from pytabular.object import PyObject, PyObjects, clear_property_caches
 from pytabular.refresh import PyRefresh
 from pytabular.query import Connection
+from pytabular.snapshot import MetadataSnapshot, find_database, take_snapshot
+from pytabular.dependency import DependencyGraph
+from pytabular.journal import ChangeJournal
+from pytabular.search import ExpressionIndex
+from pytabular.view import ModelView
+from pytabular.identity import IdentityMap
 
 logger = logging.getLogger("PyTabular")
 
 
+def _writer(method):
+    """Runs a `Tabular` method while holding its `write_lock()`."""
+
+    @functools.wraps(method)
+    def locked(self, *args, **kwargs):
+        with self._write_lock:
+            return method(self, *args, **kwargs)
+
+    return locked
+
+
 class Tabular(PyObject):
     """This is the Tabular Class to perform operations.
 
@@ -49,45 +71,85 @@ class Tabular(PyObject):
     Args:
             connection_str (str): Need a valid connection string:
                     [link](https://learn.microsoft.com/en-us/analysis-services/instances/connection-string-properties-analysis-services)
+            server (Server, optional): An already connected .Net `Server` to use
+                instead of `connection_str`. The `Server` is not disconnected
+                by `disconnect()`, it belongs to whoever connected it.
+                See `ServerCatalog`. Defaults to None.
+            database (str, optional): Name of the database to open.
+                Defaults to the `Catalog` of the connection.
+            thread_safe (bool, optional): Share the `Tabular` class across threads.
+                Each thread gets its own `Adomd` connection (and effective user connections).
+                Reading metadata (`Tables`, `Measures`, etc.) never waits,
+                see `ModelView`. Changes should be made inside `write_lock()`,
+                `save_changes()`, `refresh()` and the other methods that change
+                the model hold it already. Defaults to False.
 
     Attributes:
         Adomd (Connection): For querying.
-            This is the `Connection` class.
+            This is the `Connection` class. One per thread if `thread_safe`.
         Tables (PyTables): See `PyTables` for more information.
             Iterate through your tables in your model.
         Columns (PyColumns): See `PyColumns` for more information.
         Partitions (PyPartitions): See `PyPartitions` for more information.
         Measures (PyMeasures): See `PyMeasures` for more information.
         PyRefresh (PyRefresh): See `PyRefresh` for more information.
+        journal (ChangeJournal): If set, every `save_changes()` is recorded in it.
+            See `ChangeJournal` for more information. Defaults to None.
     """
 
-    def __init__(self, connection_str: str):
+    _wrapper_attrs = frozenset(
+        (
+            "Server",
+            "Catalog",
+            "Database",
+            "CompatibilityLevel",
+            "CompatibilityMode",
+            "Model",
+            "PyRefresh",
+            "journal",
+        )
+    )
+
+    def __init__(
+        self,
+        connection_str: str = None,
+        server: Server = None,
+        database: str = None,
+        thread_safe: bool = False,
+    ):
         """Connect to model. Just supply a solid connection string."""
         # Connecting to model...
         logger.debug("Initializing Tabular Class")
-        self.Server = Server()
-        self.Server.Connect(connection_str)
-        logger.info(f"Connected to Server - {self.Server.Name}")
-        self.Catalog = self.Server.ConnectionInfo.Catalog
+        self._owns_server: bool = server is None
+        if self._owns_server:
+            self.Server = Server()
+            self.Server.Connect(connection_str)
+            logger.info(f"Connected to Server - {self.Server.Name}")
+        else:
+            self.Server = server
+            logger.info(f"Using connected Server - {self.Server.Name}")
+        self.Catalog = database or self.Server.ConnectionInfo.Catalog
         logger.debug(f"Received Catalog - {self.Catalog}")
-        try:
-            self.Database = [
-                database
-                for database in self.Server.Databases.GetEnumerator()
-                if database.Name == self.Catalog or self.Catalog is None
-            ][0]
-        except Exception:
-            err_msg = f"Unable to find Database... {self.Catalog}"
-            logger.error(err_msg)
-            raise Exception(err_msg)
+        self.Database = find_database(self.Server, self.Catalog)
         logger.info(f"Connected to Database - {self.Database.Name}")
         self.CompatibilityLevel: int = self.Database.CompatibilityLevel
         self.CompatibilityMode: int = self.Database.CompatibilityMode.value__
         self.Model = self.Database.Model
         logger.info(f"Connected to Model - {self.Model.Name}")
-        self.Adomd: Connection = Connection(self.Server)
-        self.effective_users: dict = {}
+        self._thread_safe: bool = thread_safe
+        self._write_lock = threading.RLock()
+        self._sessions = threading.local()
+        self._session_lock = threading.Lock()
+        self._session_list: List[SimpleNamespace] = []
+        self._adomd: Connection = Connection(self.Server, catalog=self.Database.Name)
+        self._effective_users: dict = {}
         self.PyRefresh: PyRefresh = PyRefresh
+        self._property_cache: bool = False
+        self._view: ModelView = None
+        self._identity: IdentityMap = IdentityMap()
+        self._dependencies: DependencyGraph = None
+        self._expression_index: ExpressionIndex = None
+        self.journal: ChangeJournal = None
 
         # Build PyObjects
         self.reload_model_info()
@@ -95,64 +157,376 @@ class Tabular(PyObject):
         # Run subclass init
         super().__init__(self.Model)
 
-        # Building rich table display for repr
-        self._display.add_row(
+        # Finished and registering disconnect
+        logger.debug("Class Initialization Completed")
+        if self._owns_server:
+            logger.debug("Registering Disconnect on Termination...")
+            atexit.register(self.disconnect)
+
+    def _build_display(self) -> RichTable:
+        """Builds the `rich` table display for repr."""
+        display = super()._build_display()
+        display.add_row(
             "EstimatedSize",
             f"{round(self.Database.EstimatedSize / 1000000000, 2)} GB",
             end_section=True,
         )
-        self._display.add_row("# of Tables", str(len(self.Tables)))
-        self._display.add_row("# of Partitions", str(len(self.Partitions)))
-        self._display.add_row("# of Columns", str(len(self.Columns)))
-        self._display.add_row(
-            "# of Measures", str(len(self.Measures)), end_section=True
-        )
-        self._display.add_row("Database", self.Database.Name)
-        self._display.add_row("Server", self.Server.Name)
+        display.add_row("# of Tables", str(len(self.Tables)))
+        display.add_row("# of Partitions", str(len(self.Partitions)))
+        display.add_row("# of Columns", str(len(self.Columns)))
+        display.add_row("# of Measures", str(len(self.Measures)), end_section=True)
+        display.add_row("Database", self.Database.Name)
+        display.add_row("Server", self.Server.Name)
+        return display
+
+    @property
+    def Adomd(self) -> Connection:  # noqa: N802
+        """`Connection` for querying. One per thread if `thread_safe`."""
+        if self._thread_safe:
+            return self._session().adomd
+        return self._adomd
+
+    @property
+    def effective_users(self) -> dict:
+        """Connections by effective user, see `query()`. One dict per thread if `thread_safe`."""
+        if self._thread_safe:
+            return self._session().effective_users
+        return self._effective_users
+
+    def _session(self) -> SimpleNamespace:
+        """Connections of the current thread. Created on first use in the thread."""
+        session = getattr(self._sessions, "session", None)
+        if session is None:
+            logger.debug(f"New session for thread {threading.get_ident()}")
+            session = SimpleNamespace(
+                adomd=Connection(self.Server, catalog=self.Database.Name),
+                effective_users={},
+            )
+            self._sessions.session = session
+            with self._session_lock:
+                self._session_list.append(session)
+        return session
 
-        # Finished and registering disconnect
-        logger.debug("Class Initialization Completed")
-        logger.debug("Registering Disconnect on Termination...")
-        atexit.register(self.disconnect)
+    def write_lock(self) -> threading.RLock:
+        """Lock for changing the model. Use it in a `with` block.
 
+        Held by `save_changes()`, `reload_model_info()`, `refresh()` and the other
+        methods that change the model. It is reentrant, so those can be called
+        inside the `with` block. Holding it around your own changes keeps another
+        thread's `save_changes()` from saving them half done.
+
+        Returns:
+            threading.RLock: The lock.
+
+        Example:
+            ```python
+            with model.write_lock():
+                model.Measures["Total Sales"].Expression = "SUM('Sales'[Amount])"
+                model.Measures["Total Sales"].FormatString = "#,0"
+                model.save_changes()
+            ```
+        """
+        return self._write_lock
+
+    @_writer
     def reload_model_info(self) -> bool:
         """Reload your model info into the `Tabular` class.
 
         Should be called after any model changes.
-        Called in `save_changes()` and `__init__()`.
+        Called in `__init__()`, and in `save_changes()`
+        when the changes can't be patched in.
+        A `PyTable` whose .Net objects are unchanged is reused with its children,
+        see `IdentityMap`. Nothing is changed in place,
+        so a pinned `ModelView` is left as it was.
 
         Returns:
                 bool: True if successful
         """
         self.Database.Refresh()
+        self._dependencies = None
+        self._expression_index = None
+
+        clear_property_caches()
+        with self._identity.rebuild() as identity:
+            tables = PyTables(
+                [
+                    identity.wrap(PyTable, table, self)
+                    for table in self.Model.Tables.GetEnumerator()
+                ]
+            )
+            view = ModelView(
+                Tables=tables,
+                Relationships=PyRelationships(
+                    [
+                        PyRelationship(relationship, self, tables)
+                        for relationship in self.Model.Relationships.GetEnumerator()
+                    ]
+                ),
+                Partitions=PyPartitions(
+                    [partition for table in tables for partition in table.Partitions]
+                ),
+                Columns=PyColumns(
+                    [column for table in tables for column in table.Columns]
+                ),
+                Measures=PyMeasures(
+                    [measure for table in tables for measure in table.Measures], self
+                ),
+                Cultures=PyCultures(
+                    [
+                        PyCulture(culture, self)
+                        for culture in self.Model.Cultures.GetEnumerator()
+                    ]
+                ),
+            )
+        # Published in one assignment, see `ModelView`.
+        self._view = view
+        if self._property_cache:
+            self.cache_properties()
+        return True
 
-        self.Tables = PyTables(
-            [PyTable(table, self) for table in self.Model.Tables.GetEnumerator()]
-        )
-        self.Relationships = PyRelationships(
-            [
-                PyRelationship(relationship, self)
-                for relationship in self.Model.Relationships.GetEnumerator()
-            ]
-        )
-        self.Partitions = PyPartitions(
-            [partition for table in self.Tables for partition in table.Partitions]
-        )
-        self.Columns = PyColumns(
-            [column for table in self.Tables for column in table.Columns]
-        )
-        self.Measures = PyMeasures(
-            [measure for table in self.Tables for measure in table.Measures], self
-        )
+    @property
+    def Tables(self) -> PyTables:  # noqa: N802
+        """`PyTables` of the current `ModelView`."""
+        return self._view.Tables
 
-        self.Cultures = PyCultures(
-            [
-                PyCulture(culture, self)
-                for culture in self.Model.Cultures.GetEnumerator()
-            ]
+    @property
+    def Relationships(self) -> PyRelationships:  # noqa: N802
+        """`PyRelationships` of the current `ModelView`."""
+        return self._view.Relationships
+
+    @property
+    def Partitions(self) -> PyPartitions:  # noqa: N802
+        """`PyPartitions` of the current `ModelView`."""
+        return self._view.Partitions
+
+    @property
+    def Columns(self) -> PyColumns:  # noqa: N802
+        """`PyColumns` of the current `ModelView`."""
+        return self._view.Columns
+
+    @property
+    def Measures(self) -> PyMeasures:  # noqa: N802
+        """`PyMeasures` of the current `ModelView`."""
+        return self._view.Measures
+
+    @property
+    def Cultures(self) -> PyCultures:  # noqa: N802
+        """`PyCultures` of the current `ModelView`."""
+        return self._view.Cultures
+
+    def pin(self) -> ModelView:
+        """The current `ModelView`, to keep reading the same collections.
+
+        Later changes publish a new `ModelView`, the pinned one stays as is.
+        See `view.py` for more details.
+
+        Returns:
+            ModelView: The current `ModelView`. Can be used in a `with` block.
+
+        Example:
+            ```python
+            with model.pin() as view:
+                view.Measures.to_dataframe()
+            ```
+        """
+        return self._view
+
+    def cache_properties(self, enabled: bool = True) -> None:
+        """Turns on (or off) the property cache for every `PyObject` in the model.
+
+        See `PyObject.cache_properties()`. Stays on through `reload_model_info()`.
+
+        Args:
+            enabled (bool, optional): `False` turns caching off. Defaults to True.
+        """
+        self._property_cache = enabled
+        super().cache_properties(enabled)
+        for attr in ("Tables", "Columns", "Measures", "Partitions"):
+            getattr(self, attr).cache_properties(enabled)
+        self.Relationships.cache_properties(enabled)
+        self.Cultures.cache_properties(enabled)
+
+    @property
+    def dependencies(self) -> DependencyGraph:
+        """`DependencyGraph` of the model, from one `DISCOVER_CALC_DEPENDENCY` query.
+
+        The query only runs on first access. It runs again after
+        `save_changes()` or `reload_model_info()`.
+        """
+        if self._dependencies is None:
+            self._dependencies = DependencyGraph.from_model(self)
+        return self._dependencies
+
+    @property
+    def expression_index(self) -> ExpressionIndex:
+        """`ExpressionIndex` of the model, built on first access.
+
+        Built again after `save_changes()` or `reload_model_info()`.
+        """
+        if self._expression_index is None:
+            self._expression_index = ExpressionIndex(self)
+        return self._expression_index
+
+    def search(self, query: str, kind: str = None, exact: bool = False) -> PyObjects:
+        """Searches the DAX and M expressions of the model.
+
+        See `ExpressionIndex.search()` for more details.
+
+        Args:
+            query (str): Text to search for. Every token needs to be in the expression.
+            kind (str, optional): "measure", "column" or "partition".
+                Defaults to None, which searches all three.
+            exact (bool, optional): Also require `query` as is
+                (not case sensitive) in the expression. Defaults to False.
+
+        Returns:
+            PyObjects: Objects with a matching expression.
+
+        Example:
+            ```python
+            model.search("CALCULATE", kind="measure")
+            ```
+        """
+        return self.expression_index.search(query, kind, exact)
+
+    def _apply_impact(self, impact) -> bool:
+        """Patches the `PyObjects` from a `SaveChanges()` impact.
+
+        Handles added and removed columns, measures and partitions.
+        Each table with added or removed children gets a new `PyTable`,
+        built from the .Net table, and relationships to it are rebuilt.
+        Nothing is changed in place, the new collections are published
+        as a new `ModelView`.
+        Property changes need nothing, a `PyObject` reads from the .Net object.
+        Renames, and anything else that PyTabular wraps (tables, relationships, cultures),
+        are not handled and `False` is returned,
+        so `reload_model_info()` can be run instead.
+
+        Args:
+            impact (ModelOperationImpact): `Impact` from the `SaveChanges()` results.
+
+        Returns:
+            bool: True if the `PyObjects` were patched.
+        """
+        added_objects = [obj for obj in impact.AddedObjects]
+        removed_objects = [obj for obj in impact.RemovedObjects]
+        changed_objects = [change.Object for change in impact.PropertyChanges]
+
+        not_handled = ("Model", "Table", "Relationship", "Culture")
+        if any(str(obj.ObjectType) in not_handled for obj in added_objects) or any(
+            str(obj.ObjectType) in not_handled for obj in removed_objects
+        ):
+            logger.debug("Impact adds or removes tables or relationships...")
+            return False
+        if any(
+            str(obj.ObjectType) in ("Relationship", "Culture") for obj in changed_objects
+        ):
+            logger.debug("Impact changes relationships or cultures...")
+            return False
+        if any(change.PropertyName == "Name" for change in impact.PropertyChanges):
+            logger.debug("Impact renames objects...")
+            return False
+
+        try:
+            affected = {
+                self.Tables[obj.Parent.Name]
+                for obj in added_objects
+                if str(obj.ObjectType) in ("Column", "Measure", "Partition")
+            }
+        except IndexError:
+            logger.debug("Impact adds objects to a table not in PyTables...")
+            return False
+
+        view = self._view
+        removed = set(removed_objects)
+        replaced = {}
+        for table in view.Tables:
+            children = table._children()
+            if table not in affected and not any(
+                pyobject._object in removed for pyobject in children
+            ):
+                continue
+            logger.debug(f"Rebuilding {table.Name}")
+            for pyobject in (table, *children):
+                self._identity.discard(pyobject._object)
+            replaced[table] = self._identity.wrap(PyTable, table._object, self)
+            if self._property_cache:
+                replaced[table].cache_properties()
+                for attr in ("Partitions", "Columns", "Measures"):
+                    getattr(replaced[table], attr).cache_properties()
+        for obj in removed:
+            self._identity.discard(obj)
+        if len(replaced) > 0:
+            tables = view.Tables._changed(replaced=replaced)
+            self._view = view._replace(
+                Tables=tables,
+                Relationships=view.Relationships._changed(
+                    replaced={
+                        relationship: PyRelationship(relationship._object, self, tables)
+                        for relationship in view.Relationships
+                        if relationship.From_Table in replaced
+                        or relationship.To_Table in replaced
+                    }
+                ),
+                Partitions=PyPartitions(
+                    [partition for table in tables for partition in table.Partitions]
+                ),
+                Columns=PyColumns([column for table in tables for column in table.Columns]),
+                Measures=PyMeasures(
+                    [measure for table in tables for measure in table.Measures], self
+                ),
+            )
+
+        logger.debug(
+            f"Patched model info - {len(added_objects)} added, {len(removed_objects)} removed"
         )
         return True
 
+    def snapshot(self, cache_dir: str = None) -> MetadataSnapshot:
+        """Takes a `MetadataSnapshot` of the model.
+
+        See `snapshot.py` for more details.
+        The `Tabular` class has already walked the model to build the `PyObjects`,
+        use `cached_snapshot()` to get a snapshot without that walk.
+
+        Args:
+            cache_dir (str, optional): Folder of cached snapshots.
+                If given, the snapshot is saved there, and a saved snapshot is
+                used instead of walking the model again if `LastSchemaUpdate` hasn't changed.
+                Defaults to None.
+
+        Returns:
+            MetadataSnapshot: Snapshot of the model metadata.
+        """
+        return take_snapshot(self.Server.Name, self.Database, cache_dir)
+
+    def metadata_frame(
+        self, object_type: str = "Columns", properties: List[str] = None
+    ) -> pd.DataFrame:
+        """Reads properties of all objects of a type into a `pd.DataFrame`.
+
+        Just calls `to_dataframe()` on the `PyObjects`, see it for more details.
+        Use `where()` on the same `PyObjects` to get the objects back from a filter.
+
+        Args:
+            object_type (str, optional): "Tables", "Columns", "Measures",
+                "Partitions" or "Relationships". Defaults to "Columns".
+            properties (List[str], optional): Properties to read.
+                Defaults to the `PyObjects` defaults.
+
+        Returns:
+            pd.DataFrame: One row per object, one column per property.
+
+        Example:
+            ```python
+            df = model.metadata_frame("Measures")
+            df.groupby("DisplayFolder").size() # (1)
+            ```
+
+            1. Number of measures per display folder.
+        """
+        return getattr(self, object_type).to_dataframe(properties)
+
     def is_process(self) -> bool:
         """Run method to check if Processing is occurring.
 
@@ -166,7 +540,24 @@ class Tabular(PyObject):
         return len(_jobs_df[_jobs_df["JOB_DESCRIPTION"] == "Process"]) > 0
 
     def disconnect(self) -> None:
-        """Disconnects from Model."""
+        """Disconnects from Model.
+
+        The `Adomd` and effective user connections are always closed,
+        every thread's if `thread_safe`.
+        The `Server` is not disconnected if it was passed in,
+        disconnect that wherever it was connected (ex. `ServerCatalog.disconnect()`).
+        """
+        with self._session_lock:
+            sessions, self._session_list = self._session_list, []
+        sessions.append(SimpleNamespace(adomd=self._adomd, effective_users=self._effective_users))
+        self._effective_users = {}
+        for session in sessions:
+            session.adomd.Close()
+            for connection in session.effective_users.values():
+                connection.Close()
+        if self._owns_server is False:
+            logger.debug(f"Server {self.Server.Name} is shared... Not disconnecting...")
+            return None
         logger.info(f"Disconnecting from - {self.Server.Name}")
         atexit.unregister(self.disconnect)
         return self.Server.Disconnect()
@@ -176,6 +567,7 @@ class Tabular(PyObject):
         logger.info(f"Reconnecting to {self.Server.Name}")
         return self.Server.Reconnect()
 
+    @_writer
     def refresh(self, *args, **kwargs) -> pd.DataFrame:
         """`PyRefresh` class to handle refreshes of model.
 
@@ -183,11 +575,19 @@ class Tabular(PyObject):
         """
         return self.PyRefresh(self, *args, **kwargs).run()
 
-    def save_changes(self):
+    @_writer
+    def save_changes(self, max_parallelism: int = None):
         """Called after refreshes or any model changes.
 
         Currently will return a named tuple of all changes detected.
         A ton of room for improvement on what gets returned here.
+        The `PyObjects` are patched from the changes when possible,
+        otherwise `reload_model_info()` is run.
+
+        Args:
+            max_parallelism (int, optional): Max number of objects
+                the server processes in parallel, see `SaveOptions.MaxParallelism`.
+                Defaults to None, the server decides.
         """
         if self.Server.Connected is False:
             self.reconnect()
@@ -210,7 +610,15 @@ class Tabular(PyObject):
             ]
 
         logger.info("Executing save_changes()...")
-        model_save_results = self.Model.SaveChanges()
+        if max_parallelism is None:
+            model_save_results = self.Model.SaveChanges()
+        else:
+            options = SaveOptions()
+            options.MaxParallelism = max_parallelism
+            model_save_results = self.Model.SaveChanges(options)
+        clear_property_caches()
+        self._dependencies = None
+        self._expression_index = None
         if isinstance(model_save_results.Impact, type(None)):
             logger.warning(f"No changes detected on save for {self.Server.Name}")
             return None
@@ -234,7 +642,15 @@ class Tabular(PyObject):
                 removed_subtree_roots,
                 xmla_results,
             ]
-            self.reload_model_info()
+            if self.journal is not None:
+                try:
+                    self.journal.record(self, model_save_results.Impact)
+                except Exception as error:
+                    # Changes are already saved, so don't fail over the journal.
+                    logger.warning(f"Unable to journal changes... {error}")
+            if not self._apply_impact(model_save_results.Impact):
+                logger.debug("Unable to patch model info... Reloading...")
+                self.reload_model_info()
             return changes(
                 property_changes(property_changes_var),
                 added_objects,
@@ -244,6 +660,7 @@ class Tabular(PyObject):
                 xmla_results,
             )
 
+    @_writer
     def backup_table(self, table_str: str) -> bool:
         """This will be removed.
 
@@ -339,6 +756,7 @@ class Tabular(PyObject):
         self.save_changes()
         return True
 
+    @_writer
     def revert_table(self, table_str: str) -> bool:
         """This will be removed.
 
@@ -465,7 +883,9 @@ class Tabular(PyObject):
             logger.debug(f"Effective user found querying as... {effective_user}")
         except Exception:
             logger.info(f"Creating new connection with {effective_user}")
-            conn = Connection(self.Server, effective_user=effective_user)
+            conn = Connection(
+                self.Server, effective_user=effective_user, catalog=self.Database.Name
+            )
             self.effective_users[effective_user] = conn
 
         return conn.query(query_str)
@@ -512,6 +932,7 @@ class Tabular(PyObject):
                 output for output in raw_output.split("\n") if "violates rule" in output
             ]
 
+    @_writer
     def create_table(self, df: pd.DataFrame, table_name: str) -> bool:
         """Creates table from pd.DataFrame to a table in your model.
 
@@ -37,13 +37,15 @@ class Connection(AdomdConnection):
     so use that instead.
     """
 
-    def __init__(self, server, effective_user=None) -> None:
+    def __init__(self, server, effective_user=None, catalog=None) -> None:
         """Init creates the connection.
 
         Args:
             server (Server): The server that you are connecting to.
             effective_user (str, optional): Pass through an effective user
                 to query as somebody else. Defaults to None.
+            catalog (str, optional): Database to query, if it isn't
+                the one in the server's connection string. Defaults to None.
         """
         super().__init__()
         if server.ConnectionInfo.Password is None:
@@ -53,6 +55,8 @@ class Connection(AdomdConnection):
                 f"{server.ConnectionString};Password='{server.ConnectionInfo.Password}'"
             )
         logger.debug(f"ADOMD Connection: {connection_string}")
+        if catalog is not None and catalog != server.ConnectionInfo.Catalog:
+            connection_string += f";Initial Catalog={catalog}"
         if effective_user is not None:
             connection_string += f";EffectiveUserName={effective_user}"
         self.ConnectionString = connection_string
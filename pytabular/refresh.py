@@ -26,6 +26,8 @@ Example:
     ```python title="refresh from PyPartition"
     model.Tables['Sales'].Partitions['Last Fiscal Year'].refresh()
     ```
+
+    See `RefreshScheduler` to refresh many tables in dependency order.
 """
 
 from tabular_tracing import RefreshTrace, BaseTrace
@@ -252,6 +254,7 @@ class PyRefresh:
         refresh_checks: RefreshCheckCollection = RefreshCheckCollection(),
         default_row_count_check: bool = True,
         refresh_type: RefreshType = RefreshType.Full,
+        max_parallelism: int = None,
     ) -> None:
         """Init when a refresh is requested.
 
@@ -268,13 +271,18 @@ class PyRefresh:
             refresh_checks (RefreshCheckCollection, optional): Defaults to RefreshCheckCollection().
             default_row_count_check (bool, optional): Defaults to True.
             refresh_type (RefreshType, optional): Defaults to RefreshType.Full.
+            max_parallelism (int, optional): `MaxParallelism` of the save.
+                Defaults to None, the server decides.
         """
         self.model = model
         self.object = object
         self.trace = trace
         self.default_row_count_check = default_row_count_check
         self.refresh_type = refresh_type
+        self.max_parallelism = max_parallelism
         self._objects_to_refresh = []
+        self._row_count_tables: PyTables = PyTables([])
+        self._row_counts: Dict[str, int] = {}
         self._request_refresh(self.object)
         self._checks = refresh_checks
         self._pre_checks()
@@ -285,6 +293,7 @@ class PyRefresh:
         """Checks if any `BaseTrace` classes are needed from `tabular_tracing.py`.
 
         Then checks if any `RefreshChecks` are needed, along with the default `row_count` check.
+        The default row counts of every table are queried at once, see `_count_rows()`.
         """
         logger.debug("Running Pre-checks")
         if self.trace is not None:
@@ -305,11 +314,15 @@ class PyRefresh:
                 post = 0 if post is None else post
                 return post > 0
 
-            for table in set(tables):
+            self._row_count_tables = PyTables(list(dict.fromkeys(tables)))
+            for table in self._row_count_tables:
                 check = RefreshCheck(
-                    f"{table.Name} Row Count", table.row_count, row_count_assertion
+                    f"{table.Name} Row Count",
+                    lambda name=table.Name: self._row_counts.get(name),
+                    row_count_assertion,
                 )
                 self._checks.add_refresh_check(check)
+            self._count_rows()
         for check in self._checks:
             check.pre_check()
         pass
@@ -322,12 +335,34 @@ class PyRefresh:
         if self.trace is not None:
             self.trace.stop()
             self.trace.drop()
+        if self.default_row_count_check:
+            self._count_rows()
         for check in self._checks:
             check.post_check()
             # self._checks.remove_refresh_check(check)
         self._checks.clear_refresh_checks()
         pass
 
+    def _count_rows(self) -> None:
+        """Row counts of the tables in the default row count check, in one query.
+
+        Uses `PyTables.query_all()`, so it's one `UNION` of a `ROW` per table
+        instead of a `row_count()` query per table. The checks read from the results.
+        Empty tables are `None`, same as `row_count()`.
+        """
+        tables = self._row_count_tables
+        if len(tables) == 0:
+            self._row_counts = {}
+        elif len(tables) == 1:
+            self._row_counts = {tables[0].Name: tables[0].row_count()}
+        else:
+            counts = tables.query_all("COUNTROWS(_)")
+            self._row_counts = {
+                name: None if pd.isna(count) else int(count)
+                for name, count in zip(counts["[Table]"], counts["[COUNTROWS(_)]"])
+            }
+        logger.debug(f"Counted rows of {len(self._row_counts)} tables")
+
     def _get_trace(self) -> BaseTrace:
         """Creates Trace and creates it in model."""
         return self.trace(self.model)
@@ -447,7 +482,7 @@ class PyRefresh:
         if self.trace is not None:
             self.trace.start()
 
-        save_changes = self.model.save_changes()
+        save_changes = self.model.save_changes(max_parallelism=self.max_parallelism)
 
         self._post_checks()
 
@@ -2,18 +2,37 @@
 
 Once connected to your model, interacting with relationship(s)
 will be done through these classes.
+
+Example:
+    ```python title="filter propagation checks in CI"
+    import pytabular as p
+    model = p.Tabular(CONNECTION_STR)
+    model.Relationships.filter_path("Date", "Sales") # (1)
+    model.Relationships.analyze_filter_paths(
+        [("Date", "Sales"), ("Customer", "Product")]
+    ) # (2)
+    model.Relationships.bidirectional_cycles() # (3)
+    ```
+
+    1. Shortest chain of active relationships a filter on 'Date' takes to reach 'Sales'.
+    2. `pd.DataFrame` with the path, and if it is ambiguous, for each pair.
+    3. Cycles in the relationships that are closed by a bi-directional relationship.
 """
 
 import logging
 from pytabular.object import PyObject, PyObjects
 from pytabular.table import PyTable, PyTables
+from pytabular.column import PyColumn
 
 from Microsoft.AnalysisServices.Tabular import (
     CrossFilteringBehavior,
     SecurityFilteringBehavior,
 )
 
-from typing import Union
+from collections import defaultdict, deque
+from typing import Dict, List, Set, Tuple, Union
+import pandas as pd
+from rich.table import Table
 
 logger = logging.getLogger("PyTabular")
 
@@ -21,38 +40,53 @@ logger = logging.getLogger("PyTabular")
 class PyRelationship(PyObject):
     """The main class for interacting with relationships in your model."""
 
-    def __init__(self, object, model) -> None:
+    _wrapper_attrs = frozenset(
+        (
+            "Model",
+            "CrossFilteringBehavior",
+            "SecurityFilteringBehavior",
+            "To_Table",
+            "To_Column",
+            "From_Table",
+            "From_Column",
+        )
+    )
+
+    def __init__(self, object, model, tables=None) -> None:
         """Init extends to `PyObject`.
 
-        It also extends a few unique rows to `rich` table.
         A few easy access attributes have been added.
         For example, see `self.From_Table` or `self.To_Column`
 
         Args:
             object (_type_): _description_
             model (_type_): _description_
+            tables (PyTables, optional): Tables to find `From_Table` and `To_Table` in.
+                Defaults to `model.Tables`.
         """
         super().__init__(object)
         self.Model = model
         self.CrossFilteringBehavior = CrossFilteringBehavior(
-            self.CrossFilteringBehavior.value__
+            self._object.CrossFilteringBehavior.value__
         ).ToString()
         self.SecurityFilteringBehavior = SecurityFilteringBehavior(
-            self.SecurityFilteringBehavior.value__
+            self._object.SecurityFilteringBehavior.value__
         ).ToString()
-        self.To_Table = self.Model.Tables[self.ToTable.Name]
+        tables = self.Model.Tables if tables is None else tables
+        self.To_Table = tables[self.ToTable.Name]
         self.To_Column = self.To_Table.Columns[self.ToColumn.Name]
-        self.From_Table = self.Model.Tables[self.FromTable.Name]
+        self.From_Table = tables[self.FromTable.Name]
         self.From_Column = self.From_Table.Columns[self.FromColumn.Name]
-        self._display.add_row("Is Active", str(self.IsActive))
-        self._display.add_row("Cross Filtering Behavior", self.CrossFilteringBehavior)
-        self._display.add_row(
-            "Security Filtering Behavior", self.SecurityFilteringBehavior
-        )
-        self._display.add_row(
-            "From", f"'{self.From_Table.Name}'[{self.From_Column.Name}]"
-        )
-        self._display.add_row("To", f"'{self.To_Table.Name}'[{self.To_Column.Name}]")
+
+    def _build_display(self) -> Table:
+        """Extends a few unique relationship rows to `rich` table."""
+        display = super()._build_display()
+        display.add_row("Is Active", str(self.IsActive))
+        display.add_row("Cross Filtering Behavior", self.CrossFilteringBehavior)
+        display.add_row("Security Filtering Behavior", self.SecurityFilteringBehavior)
+        display.add_row("From", f"'{self.From_Table.Name}'[{self.From_Column.Name}]")
+        display.add_row("To", f"'{self.To_Table.Name}'[{self.To_Column.Name}]")
+        return display
 
 
 class PyRelationships(PyObjects):
@@ -63,29 +97,355 @@ class PyRelationships(PyObjects):
     For ex: `model.Relationships`.
     """
 
+    _frame_properties = [
+        "Name",
+        "From_Table.Name",
+        "From_Column.Name",
+        "To_Table.Name",
+        "To_Column.Name",
+        "IsActive",
+        "CrossFilteringBehavior",
+    ]
+
     def __init__(self, objects) -> None:
         """Init just extends from PyObjects."""
         super().__init__(objects)
+        self._graph = None
+
+    def __iadd__(self, obj):
+        """Adds to `PyRelationships` and resets the relationship graph."""
+        self._graph = None
+        return super().__iadd__(obj)
+
+    def _changed(self, removed=frozenset(), added=(), replaced=None) -> "PyRelationships":
+        """Same as for `PyObjects`, but the copy builds its own relationship graph."""
+        changed = super()._changed(removed, added, replaced)
+        changed._graph = None
+        return changed
 
-    def related(self, object: Union[PyTable, str]) -> PyTables:
+    def _adjacency(self) -> dict:
+        """Relationship graph of the model. Built on first use.
+
+        Returns:
+            dict: With keys
+                `"to"` - `{table name: [(PyRelationship, PyTable), ...]}` where the
+                table is the `From_Table` and the `PyTable` is the `To_Table`.
+                `"from"` - The other way around.
+                `"columns"` - `{(table name, column name): [PyRelationship, ...]}`.
+        """
+        if self._graph is None:
+            to_tables, from_tables, columns = (
+                defaultdict(list),
+                defaultdict(list),
+                defaultdict(list),
+            )
+            for rel in self._objects:
+                from_name, to_name = rel.From_Table.Name, rel.To_Table.Name
+                to_tables[from_name].append((rel, rel.To_Table))
+                from_tables[to_name].append((rel, rel.From_Table))
+                columns[(from_name, rel.From_Column.Name)].append(rel)
+                columns[(to_name, rel.To_Column.Name)].append(rel)
+            self._graph = {"to": to_tables, "from": from_tables, "columns": columns}
+        return self._graph
+
+    def _neighbors(self, table_name: str) -> list:
+        """`(PyRelationship, PyTable)` for each relationship of the table."""
+        graph = self._adjacency()
+        return graph["to"].get(table_name, []) + graph["from"].get(table_name, [])
+
+    def related(self, object: Union[PyTable, str], depth: int = 1) -> PyTables:
         """Finds related tables of a given table.
 
         Args:
             object (Union[PyTable, str]): `PyTable` or str of table name to find related tables for.
+            depth (int, optional): Number of relationships to travel.
+                `None` will return every table that can be reached. Defaults to 1.
 
         Returns:
             PyTables: Returns `PyTables` class of the tables in question.
+                Each table is only in there once.
         """
         table_to_find = object if isinstance(object, str) else object.Name
-        to_tables = [
-            rel.To_Table
-            for rel in self._objects
-            if rel.From_Table.Name == table_to_find
-        ]
-        from_tables = [
-            rel.From_Table
-            for rel in self._objects
-            if rel.To_Table.Name == table_to_find
-        ]
-        to_tables += from_tables
-        return PyTables(to_tables)
+        seen = {table_to_find}
+        frontier = [table_to_find]
+        related = []
+        hops = 0
+        while len(frontier) > 0 and (depth is None or hops < depth):
+            next_frontier = []
+            for table_name in frontier:
+                for _, table in self._neighbors(table_name):
+                    if table.Name not in seen:
+                        seen.add(table.Name)
+                        related.append(table)
+                        next_frontier.append(table.Name)
+            frontier = next_frontier
+            hops += 1
+        return PyTables(related)
+
+    def for_table(self, object: Union[PyTable, str]) -> "PyRelationships":
+        """Finds the relationships of a given table.
+
+        Args:
+            object (Union[PyTable, str]): `PyTable` or str of table name.
+
+        Returns:
+            PyRelationships: Relationships to or from the table.
+        """
+        table_name = object if isinstance(object, str) else object.Name
+        return PyRelationships([rel for rel, _ in self._neighbors(table_name)])
+
+    def for_column(self, object: Union[PyColumn, tuple]) -> "PyRelationships":
+        """Finds the relationships of a given column.
+
+        Args:
+            object (Union[PyColumn, tuple]): `PyColumn` or `(table name, column name)`.
+
+        Returns:
+            PyRelationships: Relationships to or from the column.
+        """
+        key = object if isinstance(object, tuple) else (object.Table.Name, object.Name)
+        return PyRelationships(list(self._adjacency()["columns"].get(key, [])))
+
+    def _filter_graph(self, include_inactive: bool = False) -> dict:
+        """Which tables a table's filters go to. Built on first use.
+
+        A filter goes from the `To_Table` to the `From_Table`,
+        and also the other way if `CrossFilteringBehavior` is `BothDirections`.
+
+        Args:
+            include_inactive (bool, optional): Include inactive relationships.
+                Defaults to False.
+
+        Returns:
+            dict: `{table name: [(PyRelationship, filtered table name), ...]}`
+        """
+        graph = self._adjacency()
+        key = ("filters", include_inactive)
+        if key not in graph:
+            filters = defaultdict(list)
+            for rel in self._objects:
+                if not (rel.IsActive or include_inactive):
+                    continue
+                from_name, to_name = rel.From_Table.Name, rel.To_Table.Name
+                filters[to_name].append((rel, from_name))
+                if rel.CrossFilteringBehavior == "BothDirections":
+                    filters[from_name].append((rel, to_name))
+            graph[key] = filters
+        return graph[key]
+
+    def filter_reachability(self, include_inactive: bool = False) -> Dict[str, Set[str]]:
+        """Every table that a filter on each table reaches. Built on first use.
+
+        Args:
+            include_inactive (bool, optional): Include inactive relationships.
+                Defaults to False.
+
+        Returns:
+            Dict[str, Set[str]]: `{table name: {filtered table names}}`
+        """
+        graph = self._adjacency()
+        key = ("reachability", include_inactive)
+        if key not in graph:
+            filters = self._filter_graph(include_inactive)
+            tables = set(filters) | {
+                name for targets in filters.values() for _, name in targets
+            }
+            reachability = {}
+            for table in tables:
+                seen, queue = {table}, deque([table])
+                while queue:
+                    for _, target in filters.get(queue.popleft(), []):
+                        if target not in seen:
+                            seen.add(target)
+                            queue.append(target)
+                reachability[table] = seen - {table}
+            graph[key] = reachability
+        return graph[key]
+
+    def filter_path(
+        self,
+        from_table: Union[PyTable, str],
+        to_table: Union[PyTable, str],
+        include_inactive: bool = False,
+    ) -> "PyRelationships":
+        """Shortest path a filter on `from_table` takes to reach `to_table`.
+
+        Honors `IsActive` and `CrossFilteringBehavior`.
+
+        Args:
+            from_table (Union[PyTable, str]): Table the filter is on.
+            to_table (Union[PyTable, str]): Table to be filtered.
+            include_inactive (bool, optional): Include inactive relationships,
+                as if they were turned on with `USERELATIONSHIP`. Defaults to False.
+
+        Returns:
+            PyRelationships: The relationships in order. `None` if the filter doesn't reach.
+        """
+        start = from_table if isinstance(from_table, str) else from_table.Name
+        end = to_table if isinstance(to_table, str) else to_table.Name
+        filters = self._filter_graph(include_inactive)
+        previous = {start: None}
+        queue = deque([start])
+        while queue and end not in previous:
+            table = queue.popleft()
+            for rel, target in filters.get(table, []):
+                if target not in previous:
+                    previous[target] = (rel, table)
+                    queue.append(target)
+        if end not in previous:
+            return None
+        path = []
+        while previous[end] is not None:
+            rel, end = previous[end]
+            path.append(rel)
+        return PyRelationships(path[::-1])
+
+    def _filter_paths(
+        self, start: str, end: str, include_inactive: bool = False, limit: int = 2
+    ) -> List[List[PyRelationship]]:
+        """Finds up to `limit` filter paths from `start` to `end` through different tables.
+
+        Only goes through tables that can still reach `end`, so stops early.
+        Parallel relationships between the same tables (role-playing dates, etc.)
+        give the same tables, so only the first of them is kept.
+
+        Returns:
+            List[List[PyRelationship]]: Each path as a list of relationships.
+        """
+        filters = self._filter_graph(include_inactive)
+        reachability = self.filter_reachability(include_inactive)
+        paths, seen = [], set()
+
+        def walk(table, tables, rels):
+            """Depth first walk through tables that reach `end`."""
+            for rel, target in filters.get(table, []):
+                if len(paths) >= limit:
+                    return
+                if target in tables:
+                    continue
+                if target == end:
+                    key = tuple(tables + [target])
+                    if key not in seen:
+                        seen.add(key)
+                        paths.append(rels + [rel])
+                elif end in reachability.get(target, set()):
+                    walk(target, tables + [target], rels + [rel])
+
+        walk(start, [start], [])
+        return paths
+
+    def ambiguous_paths(
+        self,
+        from_table: Union[PyTable, str],
+        to_table: Union[PyTable, str],
+        include_inactive: bool = False,
+    ) -> List[List[str]]:
+        """Checks if more than one path of active relationships connects the tables.
+
+        Paths only count as different if they go through different tables.
+
+        Args:
+            from_table (Union[PyTable, str]): Table the filter is on.
+            to_table (Union[PyTable, str]): Table to be filtered.
+            include_inactive (bool, optional): Include inactive relationships.
+                Defaults to False.
+
+        Returns:
+            List[List[str]]: Two of the paths as lists of relationship names if ambiguous.
+                Empty list if not.
+        """
+        start = from_table if isinstance(from_table, str) else from_table.Name
+        end = to_table if isinstance(to_table, str) else to_table.Name
+        paths = self._filter_paths(start, end, include_inactive)
+        if len(paths) < 2:
+            return []
+        return [[rel.Name for rel in path] for path in paths]
+
+    def bidirectional_cycles(self) -> List["PyRelationships"]:
+        """Finds cycles of active relationships that a bi-directional relationship closes.
+
+        For each active `BothDirections` relationship, looks for another
+        path between its two tables, ignoring direction.
+
+        Returns:
+            List[PyRelationships]: One `PyRelationships` per cycle,
+                starting with the bi-directional relationship.
+        """
+        active = [rel for rel in self._objects if rel.IsActive]
+        undirected = defaultdict(list)
+        for rel in active:
+            undirected[rel.From_Table.Name].append((rel, rel.To_Table.Name))
+            undirected[rel.To_Table.Name].append((rel, rel.From_Table.Name))
+
+        cycles, seen = [], set()
+        for bidirectional in active:
+            if bidirectional.CrossFilteringBehavior != "BothDirections":
+                continue
+            start, end = bidirectional.From_Table.Name, bidirectional.To_Table.Name
+            previous = {start: None}
+            queue = deque([start])
+            while queue and end not in previous:
+                table = queue.popleft()
+                for rel, target in undirected[table]:
+                    if rel is not bidirectional and target not in previous:
+                        previous[target] = (rel, table)
+                        queue.append(target)
+            if end not in previous:
+                continue
+            cycle, table = [bidirectional], end
+            while previous[table] is not None:
+                rel, table = previous[table]
+                cycle.append(rel)
+            key = frozenset(id(rel) for rel in cycle)
+            if key not in seen:
+                seen.add(key)
+                cycles.append(PyRelationships(cycle))
+        return cycles
+
+    def analyze_filter_paths(
+        self, pairs: List[Tuple[str, str]] = None, include_inactive: bool = False
+    ) -> pd.DataFrame:
+        """Checks filter paths for many pairs of tables in one call.
+
+        Args:
+            pairs (List[Tuple[str, str]], optional): `(from table, to table)` pairs.
+                Defaults to every pair where the filter reaches.
+            include_inactive (bool, optional): Include inactive relationships.
+                Defaults to False.
+
+        Returns:
+            pd.DataFrame: One row per pair with `Reaches`, `Hops`,
+                `Path` (shortest, as `'A' -> 'B'`) and `Ambiguous`.
+        """
+        reachability = self.filter_reachability(include_inactive)
+        if pairs is None:
+            pairs = [
+                (start, end)
+                for start in sorted(reachability)
+                for end in sorted(reachability[start])
+            ]
+        rows = []
+        for start, end in pairs:
+            reaches = end in reachability.get(start, set())
+            path = self.filter_path(start, end, include_inactive) if reaches else []
+            tables = [start]
+            for rel in path:
+                tables.append(
+                    rel.From_Table.Name
+                    if rel.To_Table.Name == tables[-1]
+                    else rel.To_Table.Name
+                )
+            rows.append(
+                [
+                    start,
+                    end,
+                    reaches,
+                    len(path) if reaches else None,
+                    " -> ".join(f"'{table}'" for table in tables) if reaches else "",
+                    reaches
+                    and len(self._filter_paths(start, end, include_inactive)) > 1,
+                ]
+            )
+        return pd.DataFrame(
+            rows, columns=["From", "To", "Reaches", "Hops", "Path", "Ambiguous"]
+        )
@@ -0,0 +1,300 @@
+"""`scheduler.py` refreshes tables in waves, in dependency order.
+
+`RefreshScheduler` builds a DAG of the tables to refresh.
+Calculated tables, and tables with calculated columns, come after the tables
+their DAX references (found with `static_dependencies()`).
+With `dimensions_first`, the one side of each relationship
+comes before the many side, unless the DAX says otherwise.
+
+Tables with nothing left to wait on make up a wave.
+Each wave is one `PyRefresh`, saved with its own `MaxParallelism`.
+After a run, `report()` has the timing of each wave,
+and `critical_path()` the chain of tables that decides how many waves there are.
+
+Example:
+    ```python title="nightly load"
+    import pytabular as p
+    model = p.Tabular(CONNECTION_STR)
+    scheduler = p.RefreshScheduler(
+        model, dimensions_first=True, max_parallelism=[4, 10] # (1)
+    )
+    scheduler.waves # (2)
+    scheduler.run() # (3)
+    scheduler.report()
+    scheduler.critical_path()
+    ```
+
+    1. First wave with `MaxParallelism` 4, every wave after with 10.
+    2. Table names of each wave, in the order they will be refreshed.
+    3. Refresh details of every wave, with a `Wave` column.
+"""
+
+import logging
+import time
+from collections import namedtuple
+from datetime import datetime
+from typing import Dict, List, Sequence, Set, Tuple, Union
+import pandas as pd
+from Microsoft.AnalysisServices.Tabular import RefreshType
+from pytabular.dax import static_dependencies
+from pytabular.dependency import DependencyGraph
+from pytabular.partition import PyPartition
+from pytabular.refresh import RefreshCheckCollection
+from pytabular.table import PyTable
+
+logger = logging.getLogger("PyTabular")
+
+CALCULATED = ("CALC_COLUMN", "CALC_TABLE")
+"""`OBJECT_TYPE`s in a `DependencyGraph` that are computed during a refresh."""
+
+RefreshWave = namedtuple(
+    "RefreshWave", ["wave", "tables", "max_parallelism", "start", "end", "seconds"]
+)
+RefreshWave.__doc__ = """Timing of one wave of a `RefreshScheduler.run()`.
+
+Attributes:
+    wave (int): Position of the wave, from 0.
+    tables (List[str]): Tables refreshed in the wave.
+    max_parallelism (int): `MaxParallelism` the wave was saved with. `None` for the default.
+    start (datetime): When the wave started.
+    end (datetime): When the wave finished.
+    seconds (float): How long the wave took.
+"""
+
+
+class RefreshScheduler:
+    """Plans and runs a refresh in waves of tables that don't depend on each other.
+
+    Args:
+        model (Tabular): The `Tabular` class to refresh.
+        object (optional): What to refresh. A table name, `PyTable`, `PyPartition`,
+            `{table: partitions}` dict, or a list of those, same as `PyRefresh`.
+            Defaults to None, every table.
+        dimensions_first (bool, optional): Refresh the one side of each relationship
+            before the many side. Defaults to False.
+        max_parallelism (Union[int, Sequence[int]], optional): `MaxParallelism` of each wave.
+            A sequence has one per wave, the last one is used for the waves after it.
+            Defaults to None, the server decides.
+        dependencies (DependencyGraph, optional): Dependencies to order by,
+            ex. `model.dependencies`. Defaults to `static_dependencies(model)`.
+        refresh_type (RefreshType, optional): Defaults to RefreshType.Full.
+        default_row_count_check (bool, optional): Passed to each `PyRefresh`.
+            Defaults to True.
+        trace (BaseTrace, optional): Passed to each `PyRefresh`.
+            Defaults to None, no trace.
+
+    Attributes:
+        graph (Dict[str, Set[str]]): Table name to the table names it waits on.
+        waves (List[List[str]]): Table names of each wave, in order.
+        timings (List[RefreshWave]): Timing of each wave of the last `run()`.
+    """
+
+    def __init__(
+        self,
+        model,
+        object=None,
+        dimensions_first: bool = False,
+        max_parallelism: Union[int, Sequence[int]] = None,
+        dependencies: DependencyGraph = None,
+        refresh_type: RefreshType = RefreshType.Full,
+        default_row_count_check: bool = True,
+        trace=None,
+    ) -> None:
+        """Finds the tables to refresh, builds the DAG and plans the waves."""
+        self.model = model
+        self.dimensions_first = dimensions_first
+        self.max_parallelism = max_parallelism
+        self.refresh_type = refresh_type
+        self.default_row_count_check = default_row_count_check
+        self.trace = trace
+        self._tables: Dict[str, PyTable] = {}
+        self._partitions: Dict[str, List[PyPartition]] = {}
+        self._request(model.Tables if object is None else object)
+        self.graph: Dict[str, Set[str]] = self._build_graph(
+            dependencies if dependencies is not None else static_dependencies(model)
+        )
+        self.waves: List[List[str]] = self._plan()
+        self.timings: List[RefreshWave] = []
+        logger.info(
+            f"Planned {len(self._tables)} tables in {len(self.waves)} refresh waves"
+        )
+
+    def __repr__(self) -> str:
+        """Number of tables and waves."""
+        return f"RefreshScheduler({len(self._tables)} tables, {len(self.waves)} waves)"
+
+    def _request(self, object) -> None:
+        """Adds tables and partitions to refresh. `None` in `_partitions` is the whole table."""
+        if isinstance(object, str):
+            object = self.model.Tables[object]
+        if isinstance(object, PyTable):
+            self._tables[object.Name] = object
+            self._partitions[object.Name] = None
+        elif isinstance(object, PyPartition):
+            name = object.Table.Name
+            self._tables[name] = object.Table
+            if self._partitions.get(name, []) is not None:
+                self._partitions.setdefault(name, []).append(object)
+        elif isinstance(object, dict):
+            for table, partitions in object.items():
+                table = self.model.Tables[table] if isinstance(table, str) else table
+                if isinstance(partitions, (str, PyPartition)):
+                    partitions = [partitions]
+                self._request(
+                    [
+                        table.Partitions[partition]
+                        if isinstance(partition, str)
+                        else partition
+                        for partition in partitions
+                    ]
+                )
+        else:
+            for obj in object:
+                self._request(obj)
+
+    def _build_graph(self, dependencies: DependencyGraph) -> Dict[str, Set[str]]:
+        """Table name to the table names it waits on, out of the tables being refreshed."""
+        graph = {name: set() for name in self._tables}
+        frame = dependencies.frame
+        calculated = frame[frame["OBJECT_TYPE"].isin(CALCULATED)]
+        for table, name in set(zip(calculated["TABLE"], calculated["OBJECT"])):
+            if table not in graph:
+                continue
+            graph[table].update(
+                referenced
+                for referenced, _ in dependencies.upstream(table, name)
+                if referenced in graph and referenced != table
+            )
+        if self.dimensions_first:
+            for relationship in self.model.Relationships:
+                fact, dimension = relationship.From_Table.Name, relationship.To_Table.Name
+                if fact not in graph or dimension not in graph or fact == dimension:
+                    continue
+                if self._waits_on(graph, dimension, fact):
+                    logger.debug(f"{dimension} is calculated from {fact}... Keeping DAX order")
+                    continue
+                graph[fact].add(dimension)
+        return graph
+
+    @staticmethod
+    def _waits_on(graph: Dict[str, Set[str]], table: str, other: str) -> bool:
+        """`True` if `table` waits on `other`, directly or not."""
+        seen, stack = {table}, [table]
+        while stack:
+            for dependency in graph[stack.pop()]:
+                if dependency == other:
+                    return True
+                if dependency not in seen:
+                    seen.add(dependency)
+                    stack.append(dependency)
+        return False
+
+    def _plan(self) -> List[List[str]]:
+        """Splits the DAG into waves (Kahn's algorithm, one level at a time)."""
+        remaining = {name: set(dependencies) for name, dependencies in self.graph.items()}
+        waves = []
+        while remaining:
+            wave = sorted(name for name, waits_on in remaining.items() if not waits_on)
+            if len(wave) == 0:
+                raise ValueError(f"Circular dependencies between {sorted(remaining)}")
+            waves.append(wave)
+            for name in wave:
+                del remaining[name]
+            for waits_on in remaining.values():
+                waits_on.difference_update(wave)
+        return waves
+
+    def _wave_parallelism(self, wave: int) -> int:
+        """`MaxParallelism` of a wave."""
+        if self.max_parallelism is None or isinstance(self.max_parallelism, int):
+            return self.max_parallelism
+        return self.max_parallelism[min(wave, len(self.max_parallelism) - 1)]
+
+    def _wave_objects(self, wave: List[str]) -> list:
+        """What to pass to `PyRefresh` for a wave."""
+        return [
+            self._tables[name]
+            if self._partitions[name] is None
+            else {self._tables[name]: self._partitions[name]}
+            for name in wave
+        ]
+
+    def run(self) -> pd.DataFrame:
+        """Refreshes every wave in order, holding the `write_lock()` of the model.
+
+        Returns:
+            pd.DataFrame: Refresh details of every wave (see `PyRefresh.run()`),
+                with a `Wave` column.
+        """
+        self.timings = []
+        results = []
+        with self.model.write_lock():
+            for position, wave in enumerate(self.waves):
+                max_parallelism = self._wave_parallelism(position)
+                logger.info(
+                    f"Refreshing wave {position + 1} of {len(self.waves)} - "
+                    f"{len(wave)} tables, MaxParallelism {max_parallelism}"
+                )
+                start, began = datetime.now(), time.perf_counter()
+                result = self.model.PyRefresh(
+                    self.model,
+                    self._wave_objects(wave),
+                    trace=self.trace,
+                    refresh_checks=RefreshCheckCollection([]),
+                    default_row_count_check=self.default_row_count_check,
+                    refresh_type=self.refresh_type,
+                    max_parallelism=max_parallelism,
+                ).run()
+                self.timings.append(
+                    RefreshWave(
+                        position,
+                        wave,
+                        max_parallelism,
+                        start,
+                        datetime.now(),
+                        time.perf_counter() - began,
+                    )
+                )
+                results.append(result.assign(Wave=position))
+        path, seconds = self.critical_path()
+        logger.info(f"Critical path {' -> '.join(path)} - {round(seconds, 2)} seconds")
+        return pd.concat(results, ignore_index=True)
+
+    def report(self) -> pd.DataFrame:
+        """Timing of each wave of the last `run()`.
+
+        Returns:
+            pd.DataFrame: One row per wave, with the fields of `RefreshWave`.
+        """
+        return pd.DataFrame(self.timings, columns=RefreshWave._fields)
+
+    def critical_path(self, durations: Dict[str, float] = None) -> Tuple[List[str], float]:
+        """Longest chain of tables that wait on each other.
+
+        Args:
+            durations (Dict[str, float], optional): Seconds per table,
+                ex. from last night's trace. Missing tables count as 0.
+                Defaults to the seconds of each table's wave in the last `run()`,
+                or 1 per table before a run.
+
+        Returns:
+            Tuple[List[str], float]: Table names of the chain in refresh order,
+                and its total seconds.
+        """
+        if durations is None and len(self.timings) > 0:
+            durations = {name: wave.seconds for wave in self.timings for name in wave.tables}
+        elif durations is None:
+            durations = {name: 1.0 for name in self.graph}
+        finish, previous = {}, {}
+        for wave in self.waves:
+            for name in wave:
+                before = max(sorted(self.graph[name]), key=finish.get, default=None)
+                previous[name] = before
+                finish[name] = finish.get(before, 0.0) + durations.get(name, 0.0)
+        if len(finish) == 0:
+            return [], 0.0
+        last = max(finish, key=finish.get)
+        path = [last]
+        while previous[path[-1]] is not None:
+            path.append(previous[path[-1]])
+        return path[::-1], finish[last]
@@ -0,0 +1,132 @@
+"""`search.py` is a full text index over the DAX and M expressions of a model.
+
+`ExpressionIndex` reads every measure, calculated column and partition expression
+once and keeps an inverted index of their tokens.
+Searches are then set intersections instead of reading `.Expression` through .Net
+for every object. It is cached on the `Tabular` class and rebuilt after
+`save_changes()` or `reload_model_info()`.
+
+Tokens are runs of letters, digits and underscores, not case sensitive.
+A query matches the expressions that have every token in the query.
+
+Example:
+    ```python title="find references"
+    import pytabular as p
+    model = p.Tabular(CONNECTION_STR)
+    model.search("CALCULATE", kind="measure") # (1)
+    model.search("Sales[Amount]") # (2)
+    model.search("myserver.database.windows.net", kind="partition", exact=True) # (3)
+    ```
+
+    1. `PyMeasures` with `CALCULATE` in the expression.
+    2. Every measure, calculated column and partition with both `sales` and `amount`.
+    3. Partitions with that exact text in the source, not just the tokens.
+"""
+
+import logging
+import re
+from typing import Dict, List, Set, Tuple
+from pytabular.object import PyObject, PyObjects
+from pytabular.column import PyColumns
+from pytabular.measure import PyMeasures
+from pytabular.partition import PyPartitions
+from pytabular.snapshot import source_expression
+
+logger = logging.getLogger("PyTabular")
+
+_WORDS = re.compile(r"\w+")
+
+KINDS: Dict[str, type] = {
+    "measure": PyMeasures,
+    "column": PyColumns,
+    "partition": PyPartitions,
+}
+"""Kinds of expressions and the `PyObjects` class returned for each."""
+
+
+def tokens(text: str) -> Set[str]:
+    """Lower case tokens of `text`, as indexed by `ExpressionIndex`."""
+    return set(_WORDS.findall((text or "").lower()))
+
+
+class ExpressionIndex:
+    """Inverted index of the measure, calculated column and partition expressions.
+
+    Args:
+        model (Tabular): The `Tabular` class to index.
+
+    Attributes:
+        entries (List[Tuple[str, PyObject, str]]): Kind, `PyObject`
+            and lower case expression of each indexed object.
+        postings (Dict[str, Set[int]]): Token to positions in `entries`.
+    """
+
+    def __init__(self, model) -> None:
+        """Reads every expression once and indexes the tokens."""
+        self.entries: List[Tuple[str, PyObject, str]] = []
+        self.postings: Dict[str, Set[int]] = {}
+        for measure in model.Measures:
+            self._add("measure", measure, measure.Expression)
+        for column in model.Columns:
+            if str(column.Type) == "Calculated":
+                self._add("column", column, column.Expression)
+        for partition in model.Partitions:
+            self._add("partition", partition, source_expression(partition))
+        logger.debug(
+            f"Indexed {len(self.entries)} expressions, {len(self.postings)} tokens"
+        )
+
+    def __len__(self) -> int:
+        """Number of indexed expressions."""
+        return len(self.entries)
+
+    def __repr__(self) -> str:
+        """Number of expressions and tokens."""
+        return f"ExpressionIndex({len(self)} expressions, {len(self.postings)} tokens)"
+
+    def _add(self, kind: str, pyobject: PyObject, expression: str) -> None:
+        """Adds one expression."""
+        position = len(self.entries)
+        self.entries.append((kind, pyobject, (expression or "").lower()))
+        for token in tokens(expression):
+            self.postings.setdefault(token, set()).add(position)
+
+    def search(self, query: str, kind: str = None, exact: bool = False) -> PyObjects:
+        """Finds the objects with every token of `query` in their expression.
+
+        Args:
+            query (str): Text to search for.
+            kind (str, optional): "measure", "column" or "partition".
+                Defaults to None, which searches all three.
+            exact (bool, optional): Also require `query` as is
+                (not case sensitive) in the expression. Defaults to False.
+
+        Returns:
+            PyObjects: `PyMeasures`, `PyColumns` or `PyPartitions` for a `kind`,
+                otherwise `PyObjects` of any of them.
+        """
+        cls = PyObjects
+        if kind is not None:
+            kind = kind.lower().rstrip("s")
+            if kind not in KINDS:
+                raise ValueError(f"kind must be one of {list(KINDS)}, not {kind}")
+            cls = KINDS[kind]
+        postings = sorted(
+            (self.postings.get(token, set()) for token in tokens(query)), key=len
+        )
+        if len(postings) == 0:
+            return cls([])
+        matches = set(postings[0]).intersection(*postings[1:])
+        query = query.lower()
+        found = [
+            self.entries[position]
+            for position in sorted(matches)
+            if kind is None or self.entries[position][0] == kind
+        ]
+        return cls(
+            [
+                pyobject
+                for _, pyobject, expression in found
+                if not exact or query in expression
+            ]
+        )
@@ -0,0 +1,358 @@
+"""`snapshot.py` saves the metadata of your model to a local JSON file.
+
+A `MetadataSnapshot` holds plain python copies of the
+table, column, measure, partition, relationship and role metadata.
+It is keyed by server, database and `Database.LastSchemaUpdate`.
+So a later run only needs to read `LastSchemaUpdate` to know if the file
+on disk is still good, and can skip walking the model.
+Only `cached_snapshot()` skips the walk completely, it doesn't build the `Tabular` class.
+`Tabular.snapshot()` runs after `Tabular()` has already walked the model,
+the cache only saves walking it a second time.
+
+Example:
+    ```python title="scheduled job"
+    import pytabular as p
+    snapshot = p.cached_snapshot(CONNECTION_STR, cache_dir="metadata_cache") # (1)
+    snapshot.frame("columns") # (2)
+    ```
+
+    1. Only walks the model if the schema changed since the last run.
+    2. Returns a `pd.DataFrame` of every column in the model.
+
+    ```python title="from a model you are already connected to"
+    model = p.Tabular(CONNECTION_STR) # (1)
+    snapshot = model.snapshot(cache_dir="metadata_cache")
+    ```
+
+    1. Already walks the model, to build the `PyObjects`.
+"""
+
+import json
+import logging
+import os
+import re
+from typing import Dict, List
+import pandas as pd
+from Microsoft.AnalysisServices.Tabular import Server
+
+logger = logging.getLogger("PyTabular")
+
+SNAPSHOT_VERSION = 2
+"""Bumped whenever the layout of the file changes, so old files get rebuilt."""
+
+KINDS = ("tables", "columns", "measures", "partitions", "relationships", "roles")
+
+
+def source_expression(partition) -> str:
+    """Gets the M, DAX or SQL source of a partition. Empty if it has none.
+
+    Args:
+        partition (Partition): The .Net `Partition` or a `PyPartition`.
+
+    Returns:
+        str: The `Expression` or `Query` of the partition source.
+    """
+    source = partition.Source
+    for attr in ("Expression", "Query"):
+        try:
+            expression = getattr(source, attr)
+        except AttributeError:
+            continue
+        if expression is not None:
+            return expression
+    return ""
+
+
+def _expression(column) -> str:
+    """Gets the DAX expression of a calculated column. Empty if it has none."""
+    try:
+        return column.Expression or ""
+    except AttributeError:
+        return ""
+
+
+def walk_model(model) -> Dict[str, List[dict]]:
+    """Walks the .Net `Model` once and copies the metadata into plain dicts.
+
+    Used by `take_snapshot()` and `static_dependencies()`.
+
+    Args:
+        model (Model): The .Net `Model`, not the `Tabular` class.
+
+    Returns:
+        Dict[str, List[dict]]: A list of dicts for each of `KINDS`.
+    """
+    metadata = {kind: [] for kind in KINDS}
+    for table in model.Tables.GetEnumerator():
+        metadata["tables"].append(
+            {
+                "name": table.Name,
+                "description": table.Description or "",
+                "is_hidden": table.IsHidden,
+                "data_category": table.DataCategory or "",
+            }
+        )
+        for column in table.Columns.GetEnumerator():
+            metadata["columns"].append(
+                {
+                    "table": table.Name,
+                    "name": column.Name,
+                    "type": str(column.Type),
+                    "data_type": str(column.DataType),
+                    "description": column.Description or "",
+                    "display_folder": column.DisplayFolder or "",
+                    "format_string": column.FormatString or "",
+                    "is_hidden": column.IsHidden,
+                    "expression": _expression(column),
+                }
+            )
+        for measure in table.Measures.GetEnumerator():
+            metadata["measures"].append(
+                {
+                    "table": table.Name,
+                    "name": measure.Name,
+                    "description": measure.Description or "",
+                    "display_folder": measure.DisplayFolder or "",
+                    "format_string": measure.FormatString or "",
+                    "is_hidden": measure.IsHidden,
+                    "expression": measure.Expression or "",
+                }
+            )
+        for partition in table.Partitions.GetEnumerator():
+            metadata["partitions"].append(
+                {
+                    "table": table.Name,
+                    "name": partition.Name,
+                    "source_type": str(partition.SourceType),
+                    "mode": str(partition.Mode),
+                    "expression": source_expression(partition),
+                }
+            )
+    for relationship in model.Relationships.GetEnumerator():
+        metadata["relationships"].append(
+            {
+                "name": relationship.Name,
+                "from_table": relationship.FromTable.Name,
+                "from_column": relationship.FromColumn.Name,
+                "to_table": relationship.ToTable.Name,
+                "to_column": relationship.ToColumn.Name,
+                "is_active": relationship.IsActive,
+                "cross_filtering_behavior": str(relationship.CrossFilteringBehavior),
+            }
+        )
+    for role in model.Roles.GetEnumerator():
+        metadata["roles"].append(
+            {
+                "name": role.Name,
+                "description": role.Description or "",
+                "model_permission": str(role.ModelPermission),
+                "table_permissions": sorted(
+                    [permission.Table.Name, permission.FilterExpression or ""]
+                    for permission in role.TablePermissions.GetEnumerator()
+                ),
+            }
+        )
+    return metadata
+
+
+def _stamp(database) -> int:
+    """`Database.LastSchemaUpdate` in ticks. Used to check if a snapshot is stale."""
+    return database.LastSchemaUpdate.Ticks
+
+
+class MetadataSnapshot:
+    """Plain python copy of a model's metadata.
+
+    Attributes:
+        server (str): Name of the server.
+        database (str): Name of the database.
+        stamp (int): `Database.LastSchemaUpdate` in ticks when the snapshot was taken.
+        tables (List[dict]): One dict per table.
+        columns (List[dict]): One dict per column.
+        measures (List[dict]): One dict per measure.
+        partitions (List[dict]): One dict per partition.
+        relationships (List[dict]): One dict per relationship.
+        roles (List[dict]): One dict per role, with `[table, filter]` table permissions.
+    """
+
+    def __init__(
+        self, server: str, database: str, stamp: int, metadata: Dict[str, List[dict]]
+    ) -> None:
+        """Init sets the key and the metadata.
+
+        Args:
+            server (str): Name of the server.
+            database (str): Name of the database.
+            stamp (int): `Database.LastSchemaUpdate` in ticks.
+            metadata (Dict[str, List[dict]]): A list of dicts for each of `KINDS`.
+        """
+        self.server = server
+        self.database = database
+        self.stamp = stamp
+        for kind in KINDS:
+            setattr(self, kind, metadata.get(kind, []))
+
+    def __repr__(self) -> str:
+        """Server, database and number of objects in the snapshot."""
+        counts = ", ".join(f"{len(getattr(self, kind))} {kind}" for kind in KINDS)
+        return f"MetadataSnapshot({self.server}::{self.database} - {counts})"
+
+    def is_current(self, server: str, database: str, stamp: int) -> bool:
+        """Checks the snapshot against a server, database and `LastSchemaUpdate`."""
+        return (self.server, self.database, self.stamp) == (server, database, stamp)
+
+    def frame(self, kind: str) -> pd.DataFrame:
+        """Returns one of `KINDS` as a `pd.DataFrame`.
+
+        Args:
+            kind (str): "tables", "columns", "measures", "partitions",
+                "relationships" or "roles".
+
+        Returns:
+            pd.DataFrame: One row per object.
+        """
+        return pd.DataFrame(getattr(self, kind))
+
+    def save(self, path: str) -> str:
+        """Saves the snapshot as compact JSON.
+
+        Each kind is stored as a list of field names and a list of rows,
+        so keys aren't repeated for every object.
+
+        Args:
+            path (str): File path to save to. Folders are created if needed.
+
+        Returns:
+            str: The file path.
+        """
+        folder = os.path.dirname(path)
+        if folder and os.path.exists(folder) is False:
+            os.makedirs(folder)
+        content = {
+            "version": SNAPSHOT_VERSION,
+            "server": self.server,
+            "database": self.database,
+            "stamp": self.stamp,
+        }
+        for kind in KINDS:
+            objects = getattr(self, kind)
+            fields = list(objects[0].keys()) if len(objects) > 0 else []
+            content[kind] = {
+                "fields": fields,
+                "rows": [[obj[field] for field in fields] for obj in objects],
+            }
+        with open(path, "w", encoding="utf-8") as file:
+            json.dump(content, file, ensure_ascii=False, separators=(",", ":"))
+        logger.info(f"Saved snapshot of {self.server}::{self.database} -> {path}")
+        return path
+
+
+def load_snapshot(path: str) -> MetadataSnapshot:
+    """Loads a snapshot saved with `MetadataSnapshot.save()`.
+
+    Args:
+        path (str): File path of the snapshot.
+
+    Returns:
+        MetadataSnapshot: The snapshot. `None` if the file was saved by another layout version.
+    """
+    with open(path, "r", encoding="utf-8") as file:
+        content = json.load(file)
+    if content.get("version") != SNAPSHOT_VERSION:
+        logger.info(f"Snapshot {path} is an old version... Ignoring...")
+        return None
+    metadata = {
+        kind: [dict(zip(content[kind]["fields"], row)) for row in content[kind]["rows"]]
+        for kind in KINDS
+    }
+    return MetadataSnapshot(
+        content["server"], content["database"], content["stamp"], metadata
+    )
+
+
+def snapshot_path(cache_dir: str, server: str, database: str) -> str:
+    """File path for the snapshot of a server and database in `cache_dir`."""
+    name = re.sub(r"[^\w\-.]+", "_", f"{server}__{database}")
+    return os.path.join(cache_dir, f"{name}.json")
+
+
+def take_snapshot(server: str, database, cache_dir: str = None) -> MetadataSnapshot:
+    """Takes a snapshot of a .Net `Database`, using the cache in `cache_dir` if it is current.
+
+    Args:
+        server (str): Name of the server.
+        database (Database): The .Net `Database`.
+        cache_dir (str, optional): Folder of cached snapshots.
+            If `None`, the model is always walked and nothing is saved. Defaults to None.
+
+    Returns:
+        MetadataSnapshot: Snapshot of the database.
+    """
+    stamp = _stamp(database)
+    path = None
+    if cache_dir is not None:
+        path = snapshot_path(cache_dir, server, database.Name)
+        if os.path.isfile(path):
+            snapshot = load_snapshot(path)
+            if snapshot is not None and snapshot.is_current(
+                server, database.Name, stamp
+            ):
+                logger.info(f"Snapshot is current, using {path}")
+                return snapshot
+            logger.info(f"Snapshot is stale... {path}")
+    logger.info(f"Taking snapshot of {server}::{database.Name}")
+    snapshot = MetadataSnapshot(server, database.Name, stamp, walk_model(database.Model))
+    if path is not None:
+        snapshot.save(path)
+    return snapshot
+
+
+def find_database(server: Server, catalog: str = None):
+    """Finds the database to connect to, same way for `Tabular` and `cached_snapshot()`.
+
+    Args:
+        server (Server): Connected server.
+        catalog (str, optional): Name of the database.
+            `None` uses the first database on the server. Defaults to None.
+
+    Raises:
+        Exception: If the database isn't on the server.
+
+    Returns:
+        Database: The .Net database.
+    """
+    if catalog is None:
+        found = server.Databases[0] if server.Databases.Count > 0 else None
+    else:
+        found = server.Databases.FindByName(catalog)
+    if found is None:
+        err_msg = f"Unable to find Database... {catalog}"
+        logger.error(err_msg)
+        raise Exception(err_msg)
+    return found
+
+
+def cached_snapshot(
+    connection_str: str, cache_dir: str = "pytabular_snapshots"
+) -> MetadataSnapshot:
+    """Gets a snapshot without building the `Tabular` class.
+
+    Connects to the server, reads `LastSchemaUpdate` of the database
+    and only walks the model if the cached snapshot is stale or missing.
+
+    Args:
+        connection_str (str): Same connection string you would give `Tabular()`.
+        cache_dir (str, optional): Folder of cached snapshots.
+            `None` always walks the model and saves nothing.
+            Defaults to "pytabular_snapshots".
+
+    Returns:
+        MetadataSnapshot: Snapshot of the database in the connection string.
+    """
+    server = Server()
+    server.Connect(connection_str)
+    try:
+        database = find_database(server, server.ConnectionInfo.Catalog)
+        return take_snapshot(server.Name, database, cache_dir)
+    finally:
+        server.Disconnect()
@@ -9,8 +9,11 @@ from pytabular.partition import PyPartition, PyPartitions
 from pytabular.column import PyColumn, PyColumns
 from pytabular.measure import PyMeasure, PyMeasures
 from pytabular.object import PyObjects, PyObject
-from logic_utils import ticks_to_datetime
-from datetime import datetime
+from pytabular.policy import RefreshPolicy, apply_refresh_policy
+from logic_utils import ticks_to_datetime, ticks_to_datetime64
+from datetime import date, datetime
+from typing import Union
+from rich.table import Table
 
 logger = logging.getLogger("PyTabular")
 
@@ -40,11 +43,13 @@ class PyTable(PyObject):
         -> `PyPartition` (.Name == 'Last Year') -> `.refresh()`
     """
 
+    _wrapper_attrs = frozenset(("Model", "Partitions", "Columns", "Measures"))
+
     def __init__(self, object, model) -> None:
         """Init extends from `PyObject` class.
 
-        Also adds a few specific rows to the `rich`
-        table.
+        Also builds the `PyPartitions`, `PyColumns`
+        and `PyMeasures` of the table.
 
         Args:
             object (Table): The actual .Net table.
@@ -52,37 +57,69 @@ class PyTable(PyObject):
         """
         super().__init__(object)
         self.Model = model
+        self._build_children()
+
+    def _build_children(self) -> None:
+        """Builds the `PyPartitions`, `PyColumns` and `PyMeasures` of the table.
+
+        `PyObject`s are kept in the `IdentityMap` of the model if it has one,
+        so they are reused with the table across reloads.
+        """
+        identity = getattr(self.Model, "_identity", None)
+        wrap = identity.wrap if identity is not None else lambda cls, *args: cls(*args)
         self.Partitions: PyPartitions = PyPartitions(
             [
-                PyPartition(partition, self)
+                wrap(PyPartition, partition, self)
                 for partition in self._object.Partitions.GetEnumerator()
             ]
         )
         self.Columns: PyColumns = PyColumns(
-            [PyColumn(column, self) for column in self._object.Columns.GetEnumerator()]
+            [
+                wrap(PyColumn, column, self)
+                for column in self._object.Columns.GetEnumerator()
+            ]
         )
         self.Measures: PyMeasures = PyMeasures(
             [
-                PyMeasure(measure, self)
+                wrap(PyMeasure, measure, self)
                 for measure in self._object.Measures.GetEnumerator()
             ],
             self,
         )
-        self._display.add_row("# of Partitions", str(len(self.Partitions)))
-        self._display.add_row("# of Columns", str(len(self.Columns)))
-        self._display.add_row(
-            "# of Measures", str(len(self.Measures)), end_section=True
+
+    def _unchanged(self, object, model) -> bool:
+        """`True` if the table, its partitions, columns and measures are the same .Net objects."""
+        return (
+            self._object == object
+            and self.Model is model
+            and all(
+                [pyobject._object for pyobject in getattr(self, attr)]
+                == list(getattr(object, attr).GetEnumerator())
+                for attr in ("Partitions", "Columns", "Measures")
+            )
         )
-        self._display.add_row("Description", self._object.Description, end_section=True)
-        self._display.add_row("DataCategory", str(self._object.DataCategory))
-        self._display.add_row("IsHidden", str(self._object.IsHidden))
-        self._display.add_row("IsPrivate", str(self._object.IsPrivate))
-        self._display.add_row(
+
+    def _children(self) -> tuple:
+        """The `PyPartition`s, `PyColumn`s and `PyMeasure`s of the table."""
+        return (*self.Partitions, *self.Columns, *self.Measures)
+
+    def _build_display(self) -> Table:
+        """Adds a few table specific rows to the `rich` table."""
+        display = super()._build_display()
+        display.add_row("# of Partitions", str(len(self.Partitions)))
+        display.add_row("# of Columns", str(len(self.Columns)))
+        display.add_row("# of Measures", str(len(self.Measures)), end_section=True)
+        display.add_row("Description", self._object.Description, end_section=True)
+        display.add_row("DataCategory", str(self._object.DataCategory))
+        display.add_row("IsHidden", str(self._object.IsHidden))
+        display.add_row("IsPrivate", str(self._object.IsPrivate))
+        display.add_row(
             "ModifiedTime",
             ticks_to_datetime(self._object.ModifiedTime.Ticks).strftime(
                 "%m/%d/%Y, %H:%M:%S"
             ),
         )
+        return display
 
     def row_count(self) -> int:
         """Method to return count of rows.
@@ -116,22 +153,60 @@ class PyTable(PyObject):
         """
         return self.Model.refresh(self, *args, **kwargs)
 
+    def apply_refresh_policy(
+        self,
+        policy: RefreshPolicy,
+        template: Union[str, PyPartition] = None,
+        today: date = None,
+        refresh: bool = True,
+        **kwargs,
+    ) -> pd.DataFrame:
+        """Creates, merges and removes partitions to match a `RefreshPolicy`, then refreshes.
+
+        Only the hot months and the new partitions are refreshed.
+        See `policy.py` for how partitions are named and templated.
+
+        Args:
+            policy (RefreshPolicy): Years to keep and months to refresh.
+            template (Union[str, PyPartition], optional): Template partition,
+                or its M or SQL source. Needed on the first run,
+                after that the template kept on the table is used. Defaults to None.
+            today (date, optional): Defaults to `date.today()`.
+            refresh (bool, optional): Refresh the hot partitions. Defaults to True.
+            **kwargs: Passed through to `refresh()`, ex. `trace=None`.
+
+        Returns:
+            pd.DataFrame: The `PolicyAction`s that were applied.
+
+        Example:
+            ```python
+            policy = p.RefreshPolicy(keep_years=3, refresh_months=2)
+            model.Tables["Sales"].apply_refresh_policy(policy, template="Sales Template")
+            ```
+        """
+        return apply_refresh_policy(self, policy, template, today, refresh, **kwargs)
+
     def last_refresh(self) -> datetime:
         """Will query each partition for the last refresh time.
 
         Then will select the max value to return.
+        Only the max is converted to datetime.
 
         Returns:
             datetime: Last refresh time in datetime format
         """
-        partition_refreshes = [
-            partition.last_refresh() for partition in self.Partitions
-        ]
-        return max(partition_refreshes)
+        return ticks_to_datetime(
+            max(partition.RefreshedTime.Ticks for partition in self.Partitions)
+        )
+
+    def related(self, depth: int = 1) -> "PyTables":
+        """Returns tables with a relationship with the table in question.
 
-    def related(self):
-        """Returns tables with a relationship with the table in question."""
-        return self.Model.Relationships.related(self)
+        Args:
+            depth (int, optional): Number of relationships to travel.
+                See `PyRelationships.related()`. Defaults to 1.
+        """
+        return self.Model.Relationships.related(self, depth)
 
 
 class PyTables(PyObjects):
@@ -141,6 +216,8 @@ class PyTables(PyObjects):
     You can even filter down with `.find()`.
     """
 
+    _frame_properties = ["Name", "IsHidden", "Description", "DataCategory"]
+
     def __init__(self, objects) -> None:
         """Init just extends from the main `PyObjects` class."""
         super().__init__(objects)
@@ -219,18 +296,17 @@ class PyTables(PyObjects):
                 If group_partition == True and the table has
                 multiple partitions, then df.groupby(by["tables"]).max()
         """
+        tables, partitions, ticks = [], [], []
+        for table in self:
+            table_name = table.Name
+            for partition in table.Partitions:
+                tables.append(table_name)
+                partitions.append(partition.Name)
+                ticks.append(partition.RefreshedTime.Ticks)
         data = {
-            "Tables": [
-                partition.Table.Name for table in self for partition in table.Partitions
-            ],
-            "Partitions": [
-                partition.Name for table in self for partition in table.Partitions
-            ],
-            "RefreshedTime": [
-                partition.last_refresh()
-                for table in self
-                for partition in table.Partitions
-            ],
+            "Tables": tables,
+            "Partitions": partitions,
+            "RefreshedTime": ticks_to_datetime64(ticks).tolist(),
         }
         df = pd.DataFrame(data)
         if group_partition:
@@ -0,0 +1,53 @@
+"""`view.py` has the `ModelView`, the collections of a `Tabular` class at one point in time.
+
+`Tabular.Tables`, `Tabular.Columns`, etc. all read from the current `ModelView`.
+A `ModelView` is never changed. `reload_model_info()` and `save_changes()`
+build a new one and publish it by swapping a single attribute,
+so a reader on another thread sees either the old collections or the new ones,
+never a collection that is half rebuilt.
+
+Pin the current view to keep reading the same collections through a change.
+An old view is freed once nothing references it.
+Writers on many threads take turns with `Tabular.write_lock()`, see `Tabular(thread_safe=True)`.
+
+Example:
+    ```python title="request thread"
+    with model.pin() as view: # (1)
+        names = [measure.Name for measure in view.Measures]
+        folders = view.Measures.to_dataframe(["Name", "DisplayFolder"])
+    ```
+
+    1. `view.Measures` stays the same `PyMeasures`,
+    even if another thread runs `save_changes()` in the meantime.
+"""
+
+from collections import namedtuple
+
+_FIELDS = ["Tables", "Relationships", "Partitions", "Columns", "Measures", "Cultures"]
+
+
+class ModelView(namedtuple("ModelView", _FIELDS)):
+    """Immutable set of the `PyObjects` of a model.
+
+    The collections of a view, and the `PyObject`s in them, never change.
+    A reload or patch builds new `PyTable`s (with new children) for the tables
+    that changed. Tables that didn't change are shared between views.
+
+    Attributes:
+        Tables (PyTables): See `PyTables` for more information.
+        Relationships (PyRelationships): See `PyRelationships` for more information.
+        Partitions (PyPartitions): See `PyPartitions` for more information.
+        Columns (PyColumns): See `PyColumns` for more information.
+        Measures (PyMeasures): See `PyMeasures` for more information.
+        Cultures (PyCultures): See `PyCultures` for more information.
+    """
+
+    __slots__ = ()
+
+    def __enter__(self) -> "ModelView":
+        """Pins the view for a `with` block."""
+        return self
+
+    def __exit__(self, *args) -> bool:
+        """Nothing to release, the view is freed once it isn't referenced."""
+        return False
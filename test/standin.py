@@ -0,0 +1,188 @@
+"""Local stand-in for the .Net tabular object model.
+
+Used for tests that measure PyTabular itself (building wrappers, memory, etc.),
+so they don't depend on the size of whatever model is open locally.
+Only what the wrappers touch is implemented.
+"""
+
+from collections import Counter
+
+
+class StandInCollection(list):
+    """Stand-in for a .Net collection. Supports `GetEnumerator()`."""
+
+    def GetEnumerator(self):  # noqa: N802
+        """Same as `iter()`."""
+        return iter(self)
+
+
+class StandInObject:
+    """Stand-in for a .Net `MetadataObject`.
+
+    Every property read is counted in `StandInObject.reads`,
+    so tests can see how many times the "boundary" was crossed.
+    """
+
+    reads: Counter = Counter()
+
+    def __init__(self, object_type: str, name: str, parent=None, **properties):
+        """Set the name, object type, parent and any other properties."""
+        self.__dict__["_properties"] = dict(
+            Name=name, ObjectType=object_type, Parent=parent, **properties
+        )
+
+    def __getattr__(self, attr):
+        """Reads (and counts) a property."""
+        try:
+            value = self.__dict__["_properties"][attr]
+        except KeyError:
+            raise AttributeError(attr)
+        StandInObject.reads[attr] += 1
+        return value
+
+    def __setattr__(self, attr, value):
+        """Sets a property."""
+        self.__dict__["_properties"][attr] = value
+
+
+class StandInTicks:
+    """Stand-in for a .Net `DateTime`, only has `Ticks`."""
+
+    def __init__(self, ticks: int = 638000000000000000):
+        """Set the ticks."""
+        self.Ticks = ticks
+
+
+def synthetic_model(
+    tables: int = 500, columns: int = 80, measures: int = 15, partitions: int = 5
+) -> StandInObject:
+    """Builds a stand-in `Model`.
+
+    Defaults build a 50k object model (500 * (80 + 15 + 5)).
+
+    Args:
+        tables (int, optional): Number of tables. Defaults to 500.
+        columns (int, optional): Columns per table. Defaults to 80.
+        measures (int, optional): Measures per table. Defaults to 15.
+        partitions (int, optional): Partitions per table. Defaults to 5.
+
+    Returns:
+        StandInObject: The stand-in `Model`.
+    """
+    model = StandInObject(
+        "Model",
+        "Model",
+        Tables=StandInCollection(),
+        Relationships=StandInCollection(),
+        Cultures=StandInCollection(),
+        Roles=StandInCollection(),
+    )
+    for t in range(tables):
+        table = StandInObject(
+            "Table",
+            f"Table {t}",
+            model,
+            Description="",
+            DataCategory="Regular",
+            IsHidden=False,
+            IsPrivate=False,
+            ModifiedTime=StandInTicks(),
+            Partitions=StandInCollection(),
+            Columns=StandInCollection(),
+            Measures=StandInCollection(),
+        )
+        table.Partitions.extend(
+            StandInObject(
+                "Partition",
+                f"Partition {p}",
+                table,
+                Mode="Import",
+                State="Ready",
+                SourceType="M",
+                Source=StandInObject(
+                    "PartitionSource",
+                    "",
+                    Expression=f'let Source = Sql.Database("server{t % 10}", "db") '
+                    f"in Source{{[Name=\"Table {t}\"]}}",
+                ),
+                RefreshedTime=StandInTicks(),
+            )
+            for p in range(partitions)
+        )
+        table.Columns.extend(
+            StandInObject(
+                "Column",
+                f"Column {c}",
+                table,
+                Type="Data",
+                Description="",
+                DataType="String",
+                EncodingHint="Default",
+                IsAvailableInMDX=True,
+                IsHidden=False,
+                IsKey=False,
+                IsNullable=True,
+                State="Ready",
+                DisplayFolder="",
+                FormatString="",
+            )
+            for c in range(columns)
+        )
+        table.Measures.extend(
+            StandInObject(
+                "Measure",
+                f"Measure {t}.{m}",
+                table,
+                Expression=f"SUM('Table {t}'[Column {m}])",
+                Description="",
+                DisplayFolder="",
+                IsHidden=False,
+                FormatString="",
+            )
+            for m in range(measures)
+        )
+        model.Tables.append(table)
+    return model
+
+
+class StandInDatabases(StandInCollection):
+    """Stand-in for a .Net `DatabaseCollection`."""
+
+    @property
+    def Count(self):  # noqa: N802
+        """Same as `len()`."""
+        return len(self)
+
+    def FindByName(self, name):  # noqa: N802
+        """Database by name, `None` if not found."""
+        return next((database for database in self if database.Name == name), None)
+
+
+def synthetic_server(model: StandInObject = None, name: str = "Stand In") -> StandInObject:
+    """Builds a stand-in `Server` with one database, to pass to `Tabular(server=...)`.
+
+    Args:
+        model (StandInObject, optional): The `Model` of the database.
+            Defaults to `synthetic_model()`.
+        name (str, optional): Name of the database. Defaults to "Stand In".
+
+    Returns:
+        StandInObject: The stand-in `Server`.
+    """
+    database = StandInObject(
+        "Database",
+        name,
+        Model=model if model is not None else synthetic_model(),
+        CompatibilityLevel=1600,
+        CompatibilityMode=StandInObject("CompatibilityMode", "", value__=0),
+        EstimatedSize=0,
+        Refresh=lambda: None,
+    )
+    return StandInObject(
+        "Server",
+        "Stand In Server",
+        Databases=StandInDatabases([database]),
+        ConnectionInfo=StandInObject("ConnectionInfo", "", Catalog=name, Password=None),
+        ConnectionString="",
+        Connected=True,
+    )
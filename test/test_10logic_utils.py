@@ -77,3 +77,12 @@ def test_remove_file():
         f.write("Delete this file...")
     logic_utils.remove_file(f"{os.getcwd()}\\{file_to_delete}")
     assert file_to_delete not in os.listdir()
+
+
+ticks = [0, 630822816000000000, 638000000000000123]
+
+
+def test_ticks_to_datetime64():
+    """Tests `ticks_to_datetime64()` matches `ticks_to_datetime()`."""
+    result = logic_utils.ticks_to_datetime64(ticks).tolist()
+    assert result == [logic_utils.ticks_to_datetime(tick) for tick in ticks]
@@ -24,3 +24,17 @@ def test_basic_documentation_removed():
     remove = f"{docs_class.save_location}/{docs_class.friendly_name}"
     logic_utils.remove_folder_and_contents(remove)
     assert os.path.exists(remove) is False
+
+
+def test_get_translation(model):
+    """Tests `get_translation()` matches the first translation, or falls back to the name."""
+    for culture in model.Cultures:
+        for translation in culture.ObjectTranslations[:10]:
+            found = culture.get_translation(
+                translation["object_name"],
+                translation["object_parent_name"],
+                translation["object_type"],
+            )
+            assert found["object_translation"] is not None
+        missing = culture.get_translation("Not an object", "Not a table")
+        assert missing == {"object_translation": "Not an object"}
@@ -0,0 +1,307 @@
+"""Benchmarks of PyTabular itself, against the stand-in model in `standin.py`.
+
+These don't need the `model` fixture.
+Results are logged, run `pytest -k benchmark -s` to see them.
+"""
+
+import sys
+import time
+import tracemalloc
+from types import SimpleNamespace
+import pandas as pd
+import pytest
+import pytabular as p
+from pytabular.table import PyTable, PyTables
+from pytabular.column import PyColumn, PyColumns
+from pytabular.measure import PyMeasures
+from pytabular.partition import PyPartitions
+from pytabular.refresh import PyRefresh, RefreshCheckCollection
+from pytabular.search import ExpressionIndex
+from pytabular.object import clear_property_caches
+from pytabular.snapshot import MetadataSnapshot
+from test.standin import StandInObject, synthetic_model, synthetic_server
+
+
+def build_tables(model) -> PyTables:
+    """Builds the `PyTables` the same way `Tabular.reload_model_info()` does."""
+    return PyTables([PyTable(table, model) for table in model.Tables.GetEnumerator()])
+
+
+def test_benchmark_object_graph_build():
+    """Object graph build time on a 50k object model. Displays are not built."""
+    model = synthetic_model()
+    StandInObject.reads.clear()
+    start = time.perf_counter()
+    tables = build_tables(model)
+    seconds = time.perf_counter() - start
+    objects = sum(
+        1 + len(t.Columns) + len(t.Measures) + len(t.Partitions) for t in tables
+    )
+    p.logger.info(f"Built {objects} objects in {seconds:.3f}s")
+    assert objects == 50500
+    assert StandInObject.reads["RefreshedTime"] == 0
+    assert StandInObject.reads["ModifiedTime"] == 0
+
+
+def test_benchmark_display_on_demand():
+    """`rich` display is still built when asked for."""
+    tables = build_tables(synthetic_model(tables=1))
+    StandInObject.reads.clear()
+    tables[0].Partitions[0].__rich_repr__()
+    assert StandInObject.reads["RefreshedTime"] == 1
+
+
+def test_benchmark_name_lookups():
+    """Name lookups on a 40k `PyColumns` with duplicated names."""
+    tables = build_tables(synthetic_model(tables=500, measures=0, partitions=0))
+    columns = PyColumns([column for table in tables for column in table.Columns])
+    start = time.perf_counter()
+    for c in range(80):
+        assert columns[f"Column {c}"].Table is tables[-1]
+    seconds = time.perf_counter() - start
+    p.logger.info(f"80 lookups in {len(columns)} columns in {seconds:.3f}s")
+
+
+def test_name_lookup_after_rename():
+    """A renamed `PyObject` is found by its new name. A missing name doesn't rebuild the index."""
+    columns = build_tables(synthetic_model(tables=1, measures=0, partitions=0))[0].Columns
+    column = columns["Column 0"]
+    index = columns._name_index()
+    with pytest.raises(IndexError):
+        columns["Renamed"]
+    assert columns._name_index() is index
+    column.Name = "Renamed"
+    assert columns["Renamed"] is column
+    with pytest.raises(IndexError):
+        columns["Column 0"]
+
+
+class DictColumn(PyColumn):
+    """`PyColumn` with an instance `__dict__`, like before `__slots__`."""
+
+
+def bytes_per_column(cls, columns) -> float:
+    """Bytes allocated per wrapper when wrapping `columns` with `cls`."""
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    wrappers = [cls(column, None) for column in columns]
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    allocated = sum(stat.size_diff for stat in after.compare_to(before, "filename"))
+    return (allocated - sys.getsizeof(wrappers)) / len(wrappers)
+
+
+def test_benchmark_column_memory():
+    """Bytes per `PyColumn` with `__slots__`, compared to one with a `__dict__`."""
+    model = synthetic_model(tables=750, measures=0, partitions=0)
+    columns = [column for table in model.Tables for column in table.Columns]
+    with_dict = bytes_per_column(DictColumn, columns)
+    with_slots = bytes_per_column(PyColumn, columns)
+    p.logger.info(
+        f"{len(columns)} columns - {with_dict:.0f} bytes/column before, "
+        f"{with_slots:.0f} bytes/column with __slots__"
+    )
+    assert PyColumn.__dictoffset__ == 0
+    assert with_slots < with_dict
+
+
+def scan(columns) -> None:
+    """Reads a few properties of every column, like a documentation run would."""
+    for column in columns:
+        column.Name, column.IsHidden, column.Description, column.DataType
+
+
+def test_benchmark_property_cache():
+    """.Net reads for three scans of 8k columns, with and without the cache."""
+    tables = build_tables(synthetic_model(tables=100, measures=0, partitions=0))
+    columns = PyColumns([column for table in tables for column in table.Columns])
+    StandInObject.reads.clear()
+    [scan(columns) for _ in range(3)]
+    without_cache = sum(StandInObject.reads.values())
+    columns.cache_properties()
+    StandInObject.reads.clear()
+    [scan(columns) for _ in range(3)]
+    with_cache = sum(StandInObject.reads.values())
+    p.logger.info(f"{without_cache} .Net reads without cache, {with_cache} with cache")
+    assert with_cache * 3 == without_cache
+
+
+def test_property_cache_invalidation():
+    """Property cache is cleared by `clear_property_caches()` and by `setattr`."""
+    column = build_tables(synthetic_model(tables=1))[0].Columns[0]
+    column.cache_properties()
+    assert column.Description == ""
+    column._object.Description = "Changed outside of PyTabular"
+    assert column.Description == ""
+    clear_property_caches()
+    assert column.Description == "Changed outside of PyTabular"
+    column.Description = "Changed through PyTabular"
+    assert column.Description == "Changed through PyTabular"
+
+
+def test_setattr_target():
+    """Wrapper attributes are set on the `PyObject`, .Net properties on `_object`."""
+    net_model = synthetic_model(tables=1, columns=1, measures=1, partitions=1)
+    model = p.Tabular(server=synthetic_server(net_model))
+    table = model.Tables[0]
+    table.Description = "Changed through PyTable"
+    assert net_model.Tables[0].Description == "Changed through PyTable"
+    assert "Description" not in vars(table)
+    table.Model = model
+    assert vars(table)["Model"] is model
+    with pytest.raises(AttributeError):
+        model.Tables = None
+
+
+DAX_TEMPLATES = [
+    "SUM('Table {t}'[Column {c}])",
+    "CALCULATE([Measure {t}.{n}], 'Table {u}'[Column {c}] = \"[x]\") // [Not a ref]",
+    "VAR total = [Measure {t}.{n}]\nRETURN DIVIDE(total, COUNTROWS('Table {u}'))",
+    "/* 'Table 0'[Column 0] */ SUMX(FILTER('Table {t}', 'Table {t}'[Column {c}] > 0), "
+    "[Measure {u}.{n}])",
+]
+"""Measures of `dax_corpus()`, with 1, 2, 2 and 3 references."""
+
+
+def dax_corpus(tables: int = 500, measures: int = 100) -> MetadataSnapshot:
+    """Snapshot with `tables * measures` measures, cycling through `DAX_TEMPLATES`."""
+    metadata = {
+        "tables": [{"name": f"Table {t}"} for t in range(tables)],
+        "columns": [],
+        "partitions": [],
+        "measures": [
+            {
+                "table": f"Table {t}",
+                "name": f"Measure {t}.{m}",
+                "expression": DAX_TEMPLATES[m % len(DAX_TEMPLATES)].format(
+                    t=t, u=(t + 1) % tables, n=(m + 1) % measures, c=m % 80
+                ),
+            }
+            for t in range(tables)
+            for m in range(measures)
+        ],
+    }
+    return MetadataSnapshot("server", "database", 0, metadata)
+
+
+def test_benchmark_dax_extraction():
+    """Static dependencies of 50k DAX measures."""
+    snapshot = dax_corpus()
+    start = time.perf_counter()
+    graph = p.static_dependencies(snapshot)
+    seconds = time.perf_counter() - start
+    p.logger.info(f"{len(graph)} references in {len(snapshot.measures)} measures in {seconds:.3f}s")
+    assert len(graph) == 12500 * (1 + 2 + 2 + 3)
+    direct = graph.depends_on("Table 0", "Measure 0.1")
+    assert set(zip(direct["REFERENCED_TABLE"], direct["REFERENCED_OBJECT"])) == {
+        ("Table 0", "Measure 0.2"),
+        ("Table 1", "Column 1"),
+    }
+
+
+def diff_snapshot(tables: int = 1000) -> MetadataSnapshot:
+    """Snapshot with 100 columns per table, so 100k objects with the default."""
+    metadata = {
+        "tables": [{"name": f"Table {t}", "is_hidden": False} for t in range(tables)],
+        "columns": [
+            {"table": f"Table {t}", "name": f"Column {c}", "data_type": "String"}
+            for t in range(tables)
+            for c in range(99)
+        ],
+    }
+    return MetadataSnapshot("server", "database", 0, metadata)
+
+
+def test_benchmark_diff():
+    """Diff of two 100k object snapshots with a few changes."""
+    old, new = diff_snapshot(), diff_snapshot()
+    new.columns[5]["data_type"] = "Int64"
+    new.columns.pop()
+    new.tables[10]["is_hidden"] = True
+    start = time.perf_counter()
+    diff = p.diff_models(old, new)
+    seconds = time.perf_counter() - start
+    p.logger.info(f"Diffed {len(old.tables) + len(old.columns)} objects in {seconds:.3f}s")
+    assert (len(diff.added), len(diff.removed), len(diff.changed)) == (0, 1, 2)
+    assert diff.tables_compared == 3
+
+
+def test_benchmark_expression_search():
+    """Searches of the expressions of 7.5k measures and 2.5k partitions."""
+    tables = build_tables(synthetic_model(columns=0))
+    model = SimpleNamespace(
+        Measures=PyMeasures([m for table in tables for m in table.Measures]),
+        Columns=PyColumns([]),
+        Partitions=PyPartitions([p for table in tables for p in table.Partitions]),
+    )
+    start = time.perf_counter()
+    index = ExpressionIndex(model)
+    built = time.perf_counter() - start
+    start = time.perf_counter()
+    for t in range(100):
+        measures = index.search(f"'Table {t}'[Column 3]", kind="measure")
+    partitions = index.search('Sql.Database("server3"', kind="partitions", exact=True)
+    searched = time.perf_counter() - start
+    p.logger.info(f"Indexed {len(index)} in {built:.3f}s, 101 searches in {searched:.3f}s")
+    assert isinstance(measures, PyMeasures) and len(measures) == 1
+    assert measures[0].Name == "Measure 99.3"
+    assert isinstance(partitions, PyPartitions) and len(partitions) == 250
+
+
+def test_set_properties_skips_unchanged():
+    """`set_properties()` only sets what changed, by mapping or `pd.DataFrame`."""
+    tables = build_tables(synthetic_model(tables=2, columns=0, partitions=0))
+    measures = PyMeasures([m for table in tables for m in table.Measures])
+    assert measures.set_properties({"DisplayFolder": ""}, auto_save=False) == 0
+    assert measures.set_properties({"DisplayFolder": "Sales"}, auto_save=False) == 30
+    df = measures.to_dataframe(["Name", "Parent.Name", "FormatString"])
+    df.loc[df["Name"] == "Measure 1.3", "FormatString"] = "#,0"
+    df.loc[df["Name"] == "Measure 0.3", "FormatString"] = None
+    assert measures.set_properties(df, auto_save=False) == 1
+    assert measures["Measure 1.3"].FormatString == "#,0"
+    updates = {"Measure 1.3": {"FormatString": "0%", "Description": ""}}
+    assert measures.set_properties(updates, auto_save=False) == 1
+
+
+def test_set_properties_tables():
+    """`set_properties()` on `model.Tables` sets the .Net tables, not the `PyTable`s."""
+    net_model = synthetic_model(tables=2, columns=1, measures=1, partitions=1)
+    model = p.Tabular(server=synthetic_server(net_model))
+    model.Tables.cache_properties()
+    assert model.Tables[0].Description == ""
+    assert model.Tables.set_properties({"Description": "Fact"}, auto_save=False) == 2
+    assert [table.Description for table in net_model.Tables] == ["Fact", "Fact"]
+    assert all("Description" not in vars(table) for table in model.Tables)
+    assert model.Tables[0].Description == "Fact"
+
+
+def test_batched_row_counts():
+    """Default row count checks of 150 tables are one query before and one after."""
+    net_model = synthetic_model(tables=150, columns=0, measures=0, partitions=1)
+    for table in net_model.Tables:
+        table.RequestRefresh = lambda refresh_type: None
+        table.get_Name = lambda name=table.Name: name
+    model = p.Tabular(server=synthetic_server(net_model))
+    counts = {table.Name: 100 for table in model.Tables}
+    queries = []
+
+    def query(query_str):
+        queries.append(query_str)
+        return pd.DataFrame(
+            {"[Table]": list(counts), "[COUNTROWS(_)]": list(counts.values())}
+        )
+
+    model.query = query
+    refresh = PyRefresh(
+        model, model.Tables, trace=None, refresh_checks=RefreshCheckCollection([])
+    )
+    checks = list(refresh._checks)
+    assert len(queries) == 1
+    assert len(checks) == 150
+    assert all(check.pre == 100 for check in checks)
+    counts["Table 7"] = float("nan")
+    with pytest.raises(AssertionError):
+        refresh._post_checks()
+    assert len(queries) == 2
+    assert checks[7].post is None
+    assert checks[6].post == 100
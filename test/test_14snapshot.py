@@ -0,0 +1,48 @@
+"""Tests to cover the snapshot.py file."""
+
+import os
+import pytest
+import pytabular as p
+from test.standin import synthetic_model, synthetic_server
+
+cache_dir = "snapshot_testing"
+
+
+def test_snapshot(model):
+    """Tests the snapshot matches the model."""
+    snapshot = model.snapshot()
+    assert len(snapshot.tables) == len(model.Tables)
+    assert len(snapshot.columns) == len(model.Columns)
+    assert len(snapshot.measures) == len(model.Measures)
+
+
+def test_snapshot_save_load(model):
+    """Tests a saved snapshot loads back the same."""
+    snapshot = model.snapshot(cache_dir)
+    path = p.snapshot.snapshot_path(cache_dir, snapshot.server, snapshot.database)
+    loaded = p.load_snapshot(path)
+    assert loaded.is_current(snapshot.server, snapshot.database, snapshot.stamp)
+    assert loaded.measures == snapshot.measures
+
+
+def test_snapshot_cached(model):
+    """Tests the cached snapshot is used while the schema hasn't changed."""
+    snapshot = model.snapshot(cache_dir)
+    path = p.snapshot.snapshot_path(cache_dir, snapshot.server, snapshot.database)
+    modified = os.path.getmtime(path)
+    model.snapshot(cache_dir)
+    unchanged = os.path.getmtime(path) == modified
+    p.logic_utils.remove_folder_and_contents(cache_dir)
+    assert unchanged
+
+
+def test_cached_snapshot_missing_database(monkeypatch):
+    """Tests `cached_snapshot()` raises the same error as `Tabular` for a missing database."""
+    server = synthetic_server(synthetic_model(2, 2, 1, 1))
+    server.ConnectionInfo.Catalog = "Missing"
+    server.Connect = lambda connection_str: None
+    server.Disconnect = lambda: None
+    server.Name = "Stand In Server"
+    monkeypatch.setattr(p.snapshot, "Server", lambda: server)
+    with pytest.raises(Exception, match="Unable to find Database... Missing"):
+        p.cached_snapshot("Catalog=Missing", cache_dir=None)
@@ -0,0 +1,73 @@
+"""pytest for `scan_fleet()`."""
+
+import time
+from concurrent.futures import ThreadPoolExecutor
+import pytabular as p
+
+
+def table_count(model):
+    """Collector for `test_scan_fleet`."""
+    return len(model.Tables)
+
+
+def failing_collector(model):
+    """Collector that always fails."""
+    raise ValueError("Collector failed")
+
+
+def test_scan_fleet(model):
+    """Tests results and per model errors are yielded."""
+    results = list(
+        p.scan_fleet(
+            [model.Server.ConnectionString, "Data Source=not a server"],
+            collectors={"table_count": table_count, "failing": failing_collector},
+            max_workers=2,
+        )
+    )
+    assert len(results) == 2
+    scanned = [result for result in results if result.database is not None][0]
+    assert scanned.results["table_count"] == len(model.Tables)
+    assert "failing" in scanned.errors
+    assert len(scanned.snapshot.tables) == len(model.Tables)
+    failed = [result for result in results if result.database is None][0]
+    assert "connect" in failed.errors
+
+
+def test_scan_fleet_snapshot_only(model, tmp_path):
+    """Tests a scan without collectors takes the snapshot from the cache."""
+    connection_strs = [model.Server.ConnectionString]
+    first = list(p.scan_fleet(connection_strs, max_workers=1, cache_dir=str(tmp_path)))
+    second = list(p.scan_fleet(connection_strs, max_workers=1, cache_dir=str(tmp_path)))
+    assert first[0].errors == {} and second[0].errors == {}
+    assert second[0].database == model.Database.Name
+    assert second[0].snapshot.stamp == first[0].snapshot.stamp
+    assert len(second[0].snapshot.tables) == len(model.Tables)
+
+
+class RecordingExecutor(ThreadPoolExecutor):
+    """`ThreadPoolExecutor` that records how it was shut down."""
+
+    shutdowns = []
+
+    def shutdown(self, wait=True, **kwargs):
+        """Records `wait` and shuts down."""
+        RecordingExecutor.shutdowns.append(wait)
+        super().shutdown(wait, **kwargs)
+
+
+def slow_scan(connection_str, collectors, snapshot, cache_dir):
+    """Stand-in for `_scan_model` that takes a while."""
+    time.sleep(0.2)
+    return p.FleetResult(connection_str, "Stand In", "Stand In", None, {}, {}, 0.2)
+
+
+def test_scan_fleet_break_cancels_queued(monkeypatch):
+    """Tests breaking out of `scan_fleet()` doesn't wait on the queued models."""
+    monkeypatch.setattr(p.fleet, "ProcessPoolExecutor", RecordingExecutor)
+    monkeypatch.setattr(p.fleet, "_scan_model", slow_scan)
+    start = time.perf_counter()
+    for result in p.scan_fleet([f"Catalog={i}" for i in range(10)], max_workers=1):
+        break
+    assert result.connection_str == "Catalog=0"
+    assert time.perf_counter() - start < 1
+    assert RecordingExecutor.shutdowns == [False]
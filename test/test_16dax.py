@@ -0,0 +1,74 @@
+"""pytests for the static DAX reference extraction in `dax.py`."""
+
+import pytest
+import pytabular as p
+from pytabular.dax import tokenize
+
+measures = {"Total Sales": "Sales", "Tax": "Sales"}
+tables = {"Sales", "Product", "Date Table"}
+
+expressions = [
+    pytest.param(
+        "SUM('Sales'[Amount])",
+        [("Sales", "Amount", "COLUMN")],
+        id="quoted table",
+    ),
+    pytest.param(
+        "SUM(Sales[Amount]) + [Tax]",
+        [("Sales", "Amount", "COLUMN"), ("Sales", "Tax", "MEASURE")],
+        id="unquoted table and measure",
+    ),
+    pytest.param(
+        "COUNTROWS(Product) // [Tax]\n/* 'Sales'[Amount] */",
+        [("Product", "Product", "TABLE")],
+        id="comments",
+    ),
+    pytest.param(
+        'IF([Amount] > 0, "[Tax]", "\'Sales\'[Amount]")',
+        [("Sales", "Amount", "COLUMN")],
+        id="strings",
+    ),
+    pytest.param(
+        "VAR Sales2 = [Total Sales] RETURN Sales2 * 'Date Table'[Year]",
+        [("Sales", "Total Sales", "MEASURE"), ("Date Table", "Year", "COLUMN")],
+        id="variables",
+    ),
+    pytest.param(
+        "'It''s'[a]]b] + Sales[Tax]",
+        [("It's", "a]b", "COLUMN"), ("Sales", "Tax", "MEASURE")],
+        id="escapes",
+    ),
+    pytest.param(
+        "SUM(sales[Amount]) + SALES[tax] + [total SALES] + COUNTROWS(product)",
+        [
+            ("Sales", "Amount", "COLUMN"),
+            ("Sales", "Tax", "MEASURE"),
+            ("Sales", "Total Sales", "MEASURE"),
+            ("Product", "Product", "TABLE"),
+        ],
+        id="mixed case",
+    ),
+]
+
+
+@pytest.mark.parametrize("expression,expected", expressions)
+def test_extract_references(expression, expected):
+    """Tests references resolved from DAX expressions."""
+    references = p.extract_references(expression, "Sales", measures, tables)
+    assert [tuple(reference) for reference in references] == expected
+
+
+def test_tokenize_skips_functions():
+    """Tests function names are not yielded as tables."""
+    assert list(tokenize("CALCULATE(SUM(Sales[Amount]))")) == [
+        ("Sales", "Amount", False)
+    ]
+
+
+def test_static_dependencies(model):
+    """Tests `static_dependencies()` finds the dependencies of every measure."""
+    graph = p.static_dependencies(model)
+    measure = [m for m in model.Measures if "[" in m.Expression][0]
+    assert len(graph.depends_on(measure.Table.Name, measure.Name)) > 0
+    snapshot_graph = p.static_dependencies(model.snapshot())
+    assert len(snapshot_graph) == len(graph)
@@ -0,0 +1,61 @@
+"""pytests for `diff_models()`."""
+
+import copy
+import pytabular as p
+from pytabular.snapshot import MetadataSnapshot
+
+
+def small_snapshot() -> MetadataSnapshot:
+    """Two tables, a relationship and a role."""
+    metadata = {
+        "tables": [{"name": "Sales"}, {"name": "Product"}],
+        "columns": [
+            {"table": "Sales", "name": "Amount", "data_type": "Double"},
+            {"table": "Sales", "name": "ProductKey", "data_type": "Int64"},
+            {"table": "Product", "name": "ProductKey", "data_type": "Int64"},
+        ],
+        "measures": [{"table": "Sales", "name": "Total", "expression": "SUM([Amount])"}],
+        "partitions": [],
+        "relationships": [
+            {
+                "name": "generated-1",
+                "from_table": "Sales",
+                "from_column": "ProductKey",
+                "to_table": "Product",
+                "to_column": "ProductKey",
+                "is_active": True,
+            }
+        ],
+        "roles": [{"name": "Reader", "model_permission": "Read"}],
+    }
+    return MetadataSnapshot("server", "database", 0, metadata)
+
+
+def test_diff_same():
+    """Tests no changes are found between copies, even with other relationship names."""
+    old, new = small_snapshot(), small_snapshot()
+    new.relationships[0]["name"] = "generated-2"
+    assert not p.diff_models(old, new)
+
+
+def test_diff_changes():
+    """Tests added, removed and changed objects."""
+    old = small_snapshot()
+    new = copy.deepcopy(old)
+    new.measures[0]["expression"] = "SUM(Sales[Amount])"
+    new.columns.append({"table": "Product", "name": "Color", "data_type": "String"})
+    new.roles = []
+    diff = p.diff_models(old, new)
+    assert [(c.kind, c.table, c.name) for c in diff.added] == [
+        ("columns", "Product", "Color")
+    ]
+    assert [(c.kind, c.name) for c in diff.removed] == [("roles", "Reader")]
+    assert diff.changed[0].properties == {
+        "expression": ("SUM([Amount])", "SUM(Sales[Amount])")
+    }
+    assert len(diff.frame()) == 3
+
+
+def test_diff_model(model):
+    """Tests a model has no changes against its own snapshot."""
+    assert not p.diff_models(model.snapshot(), model)
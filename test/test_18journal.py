@@ -0,0 +1,58 @@
+"""pytests for `ChangeJournal`."""
+
+import os
+from types import SimpleNamespace
+import pytabular as p
+from test.standin import StandInCollection, StandInObject
+
+journal_path = "journal_testing.db"
+
+
+def standin_impact():
+    """Impact with a property change, an added and a removed measure."""
+    model = StandInObject("Model", "Model")
+    table = StandInObject("Table", "Sales", model)
+    measure = StandInObject("Measure", "Total", table)
+    change = SimpleNamespace(
+        Object=measure, PropertyName="Description", OriginalValue="", NewValue="Sum"
+    )
+    return SimpleNamespace(
+        PropertyChanges=StandInCollection([change]),
+        AddedObjects=StandInCollection([StandInObject("Measure", "New", table)]),
+        RemovedObjects=StandInCollection([StandInObject("Measure", "Old", None)]),
+    )
+
+
+def test_journal_record():
+    """Tests changes are recorded and queried by table and time."""
+    journal = p.ChangeJournal(journal_path)
+    model = SimpleNamespace(
+        Server=SimpleNamespace(Name="server"),
+        Database=SimpleNamespace(Name="database"),
+        Columns=[],
+        Measures=[],
+        Partitions=[],
+    )
+    assert journal.record(model, standin_impact()) == 3
+    sales = journal.changes(table="Sales")
+    after = journal.changes(since="9999-01-01")
+    os.remove(journal_path)
+    assert sorted(sales["kind"]) == ["added", "property"]
+    assert sales[sales["kind"] == "property"].iloc[0]["object_path"] == "Sales/Total"
+    assert len(after) == 0
+
+
+def test_journal_save_changes(model):
+    """Tests `save_changes()` writes to `Tabular.journal`."""
+    model.journal = p.ChangeJournal(journal_path)
+    measure = model.Measures[0]
+    original = measure.Description
+    measure.Description = "Journal testing"
+    model.save_changes()
+    measure.Description = original
+    model.save_changes()
+    changes = model.journal.changes(table=measure.Table.Name, object_type="Measure")
+    model.journal = None
+    os.remove(journal_path)
+    assert len(changes) == 2
+    assert changes.iloc[1]["new"] == "Journal testing"
@@ -0,0 +1,83 @@
+"""pytests for `ModelView`, against the stand-in model in `standin.py`."""
+
+import threading
+from types import SimpleNamespace
+import pytabular as p
+from test.standin import StandInObject, synthetic_model, synthetic_server
+
+
+def standin_tabular(tables: int = 3) -> p.Tabular:
+    """`Tabular` class on a stand-in server."""
+    model = synthetic_model(tables=tables, columns=2, measures=2, partitions=1)
+    return p.Tabular(server=synthetic_server(model))
+
+
+def impact(added=(), removed=(), changes=()):
+    """Stand-in `SaveChanges()` impact. `changes` are `(object, property name)`."""
+    return SimpleNamespace(
+        AddedObjects=list(added),
+        RemovedObjects=list(removed),
+        PropertyChanges=[
+            SimpleNamespace(Object=obj, PropertyName=name) for obj, name in changes
+        ],
+    )
+
+
+def test_pinned_view_is_unchanged():
+    """Tests a pinned view keeps its tables and their children after a patch."""
+    model = standin_tabular()
+    with model.pin() as view:
+        table = model.Model.Tables[0]
+        new_measure = StandInObject("Measure", "New", table, Expression="1")
+        removed_measure = table.Measures.pop(0)
+        table.Measures.append(new_measure)
+        assert model._apply_impact(impact([new_measure], [removed_measure]))
+        assert len(view.Measures) == 6
+        assert view.Measures[0]._object is removed_measure
+    assert model.pin() is not view
+    assert len(model.Measures) == 6
+    assert model.Measures["New"].Table is model.Tables[0]
+    assert "Measure 0.0" not in [m.Name for m in model.Tables[0].Measures]
+    assert "Measure 0.0" in [m.Name for m in view.Tables[0].Measures]
+    assert "New" not in [m.Name for m in view.Tables[0].Measures]
+    assert all(m.Table is view.Tables[0] for m in view.Tables[0].Measures)
+    assert view.Tables[1] is model.Tables[1]
+    assert model.Tables[0].Measures.parent is model.Tables[0]
+
+
+def test_readers_during_patches():
+    """Tests readers only see whole views while a writer patches the model."""
+    model = standin_tabular(tables=20)
+    errors = []
+    done = threading.Event()
+
+    def read():
+        while not done.is_set():
+            view = model.pin()
+            if len(view.Measures) != sum(len(table.Measures) for table in view.Tables):
+                errors.append(len(view.Measures))
+
+    readers = [threading.Thread(target=read) for _ in range(4)]
+    [reader.start() for reader in readers]
+    table = model.Model.Tables[0]
+    for i in range(200):
+        measure = StandInObject("Measure", f"Added {i}", table, Expression="1")
+        table.Measures.append(measure)
+        model._apply_impact(impact([measure]))
+        table.Measures.remove(measure)
+        model._apply_impact(impact(removed=[measure]))
+    done.set()
+    [reader.join() for reader in readers]
+    assert errors == []
+    assert len(model.Measures) == 40
+
+
+def test_rename_is_not_patched():
+    """Tests a rename asks for a reload, and the reload finds the new name."""
+    model = standin_tabular()
+    column = model.Model.Tables[0].Columns[0]
+    assert model._apply_impact(impact(changes=[(column, "Description")]))
+    column.Name = "Renamed"
+    assert not model._apply_impact(impact(changes=[(column, "Name")]))
+    assert model.reload_model_info()
+    assert model.Tables[0].Columns["Renamed"]._object is column
@@ -0,0 +1,122 @@
+"""pytests for `Tabular(thread_safe=True)`, against the stand-in model in `standin.py`."""
+
+import threading
+import time
+from types import SimpleNamespace
+import pytabular as p
+from test.standin import synthetic_model, synthetic_server
+
+
+def standin_tabular(tables: int = 5) -> p.Tabular:
+    """Thread safe `Tabular` class on a stand-in server.
+
+    `SaveChanges()` records the descriptions of every measure
+    and fails if two saves ever overlap.
+    """
+    model = p.Tabular(
+        server=synthetic_server(
+            synthetic_model(tables=tables, columns=2, measures=2, partitions=1)
+        ),
+        thread_safe=True,
+    )
+    saving = threading.Lock()
+    model.saves, model.overlaps = [], []
+
+    def save_changes():
+        if not saving.acquire(blocking=False):
+            model.overlaps.append(threading.get_ident())
+            return SimpleNamespace(Impact=None)
+        try:
+            time.sleep(0.001)
+            model.saves.append({m._object.Description for m in model.Measures})
+        finally:
+            saving.release()
+        return SimpleNamespace(Impact=None)
+
+    model.Model.SaveChanges = save_changes
+    return model
+
+
+def test_sessions_per_thread():
+    """Tests each thread gets its own `Adomd` connection and effective users."""
+    model = standin_tabular()
+    sessions = {}
+
+    def connect(name):
+        sessions[name] = (model.Adomd, model.Adomd, model.effective_users)
+
+    threads = [threading.Thread(target=connect, args=(i,)) for i in range(4)]
+    [thread.start() for thread in threads]
+    [thread.join() for thread in threads]
+    assert all(first is second for first, second, _ in sessions.values())
+    assert len({id(adomd) for adomd, _, _ in sessions.values()}) == 4
+    assert len({id(users) for _, _, users in sessions.values()}) == 4
+    assert model.Adomd not in [adomd for adomd, _, _ in sessions.values()]
+    assert len(model._session_list) == 5
+
+
+def test_disconnect_closes_connections():
+    """Tests `disconnect()` closes the main and per thread connections, and effective users."""
+    model = standin_tabular()
+    closed = []
+
+    def connection(name):
+        return SimpleNamespace(Close=lambda: closed.append(name))
+
+    model._adomd = connection("main")
+    model._effective_users["user"] = connection("main user")
+    model._session_list[:] = [
+        SimpleNamespace(
+            adomd=connection("thread"), effective_users={"user": connection("thread user")}
+        )
+    ]
+    model.disconnect()
+    assert sorted(closed) == ["main", "main user", "thread", "thread user"]
+    assert model._session_list == [] and model._effective_users == {}
+
+
+def test_reads_do_not_wait_on_writers():
+    """Tests metadata can be read while another thread holds the write lock."""
+    model = standin_tabular()
+    names = []
+
+    def read():
+        names.extend(measure.Name for measure in model.Measures)
+        names.extend(table.Name for table in model.Tables)
+
+    with model.write_lock():
+        reader = threading.Thread(target=read)
+        reader.start()
+        reader.join(timeout=5)
+        assert not reader.is_alive()
+    assert len(names) == 15
+
+
+def test_writers_stress():
+    """Tests concurrent writers never overlap a save or save each other's half done changes."""
+    model = standin_tabular()
+    errors = []
+
+    def write(writer):
+        try:
+            for i in range(20):
+                tag = f"writer {writer}, {i}"
+                if writer % 2 == 0:
+                    model.Measures.set_properties({"Description": tag})
+                else:
+                    with model.write_lock():
+                        for measure in model.Measures:
+                            measure.Description = tag
+                        model.save_changes()
+                [measure.Name for measure in model.Measures]
+                model.Adomd
+        except Exception as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=write, args=(i,)) for i in range(8)]
+    [thread.start() for thread in threads]
+    [thread.join() for thread in threads]
+    assert errors == []
+    assert model.overlaps == []
+    assert len(model.saves) == 160
+    assert all(len(descriptions) == 1 for descriptions in model.saves)
@@ -0,0 +1,72 @@
+"""pytests for `IdentityMap`, against the stand-in model in `standin.py`."""
+
+import pytabular as p
+from test.standin import StandInObject, synthetic_model, synthetic_server
+
+
+def standin_tabular(tables: int = 3) -> p.Tabular:
+    """`Tabular` class on a stand-in server."""
+    model = synthetic_model(tables=tables, columns=2, measures=2, partitions=1)
+    return p.Tabular(server=synthetic_server(model))
+
+
+def test_reload_reuses_pyobjects():
+    """Tests every `PyObject` is reused by a reload of an unchanged model."""
+    model = standin_tabular()
+    tables, measures = list(model.Tables), list(model.Measures)
+    assert model._identity.created == 18
+    assert model.reload_model_info()
+    assert model._identity.created == 0
+    assert model._identity.reused == 18
+    assert model._identity.dropped == 0
+    assert all(old is new for old, new in zip(tables, model.Tables))
+    assert all(old is new for old, new in zip(measures, model.Measures))
+    assert model.Measures[0].Table is model.Tables[0]
+
+
+def test_pinned_view_across_reload():
+    """Tests a pinned view keeps its tables, and their children point at them, after a reload."""
+    model = standin_tabular()
+    with model.pin() as view:
+        model.Model.Tables[0].Measures.pop()
+        assert model.reload_model_info()
+        assert len(view.Tables[0].Measures) == 2
+        assert len(view.Measures) == 6
+        assert all(
+            pyobject.Table is table for table in view.Tables for pyobject in table._children()
+        )
+        assert len(model.Tables[0].Measures) == 1
+        assert len(model.Measures) == 5
+    assert model.Tables[0] is not view.Tables[0]
+    assert model.Tables[0].Measures[0] is not view.Tables[0].Measures[0]
+    assert model.Tables[0].Measures[0].Table is model.Tables[0]
+    assert model.Tables[1] is view.Tables[1]
+
+
+def test_reload_replaces_and_drops():
+    """Tests a table with a replaced .Net object gets new `PyObject`s, removed ones are dropped."""
+    model = standin_tabular()
+    table = model.Model.Tables[0]
+    measure, removed = model.Tables[0].Measures[0], model.Tables[0].Measures[1]
+    reloaded = StandInObject("Measure", measure.Name, table, Expression="2")
+    table.Measures[:] = [reloaded]
+    assert model.reload_model_info()
+    assert model._identity.dropped == 1
+    assert model.Measures[measure.Name] is not measure
+    assert measure._object is not reloaded
+    assert model.Measures[measure.Name].Expression == "2"
+    assert removed not in list(model.Measures)
+    assert model._identity.reused == 12
+
+
+def test_lineage_tag_survives_rename():
+    """Tests a renamed object with a `LineageTag` keeps its `PyObject`."""
+    model = standin_tabular()
+    net_measure = model.Model.Tables[0].Measures[0]
+    net_measure.LineageTag = "b5a1c3e0"
+    assert model.reload_model_info()
+    measure = model.Measures[net_measure.Name]
+    net_measure.Name = "Renamed"
+    assert model.reload_model_info()
+    assert model.Measures["Renamed"] is measure
+    assert p.identity.identity_key(net_measure) == ("Measure", "LineageTag", "b5a1c3e0")
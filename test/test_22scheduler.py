@@ -0,0 +1,98 @@
+"""pytests for `RefreshScheduler`, against the stand-in model in `standin.py`."""
+
+from types import SimpleNamespace
+import pandas as pd
+import pytest
+import pytabular as p
+from test.standin import StandInObject, synthetic_model, synthetic_server
+
+
+def calculated_column(table: StandInObject, name: str, expression: str) -> None:
+    """Adds a stand-in calculated column to a stand-in table."""
+    table.Columns.append(
+        StandInObject(
+            "Column",
+            name,
+            table,
+            Type="Calculated",
+            Expression=expression,
+            Description="",
+            DataType="Double",
+            DisplayFolder="",
+            FormatString="",
+            IsHidden=False,
+        )
+    )
+
+
+@pytest.fixture
+def standin():
+    """`Tabular` class on a stand-in server, with calculated columns across tables.
+
+    `Table 3` references `Table 0` directly and `Table 1` through `[Measure 1.0]`.
+    `Table 2` references `Table 3`.
+    """
+    net_model = synthetic_model(tables=4, columns=2, measures=1, partitions=2)
+    tables = net_model.Tables
+    calculated_column(tables[3], "Calc", "[Measure 1.0] + SUM('Table 0'[Column 0])")
+    calculated_column(tables[2], "Calc", "SUM('Table 3'[Calc])")
+    return p.Tabular(server=synthetic_server(net_model))
+
+
+def relate(model: p.Tabular, *pairs) -> None:
+    """Gives the model `(many side, one side)` relationships."""
+    relationships = [
+        SimpleNamespace(From_Table=model.Tables[fact], To_Table=model.Tables[dimension])
+        for fact, dimension in pairs
+    ]
+    model._view = model._view._replace(Relationships=relationships)
+
+
+def test_waves_follow_dax(standin):
+    """Tests calculated columns are refreshed after the tables they reference."""
+    scheduler = p.RefreshScheduler(standin)
+    assert scheduler.graph["Table 3"] == {"Table 0", "Table 1"}
+    assert scheduler.waves == [["Table 0", "Table 1"], ["Table 3"], ["Table 2"]]
+    assert scheduler.critical_path() == (["Table 0", "Table 3", "Table 2"], 3.0)
+
+
+def test_dimensions_first(standin):
+    """Tests the one side goes first, unless the DAX says otherwise."""
+    relate(standin, ("Table 1", "Table 0"), ("Table 3", "Table 2"))
+    scheduler = p.RefreshScheduler(standin, dimensions_first=True)
+    assert scheduler.waves == [["Table 0"], ["Table 1"], ["Table 3"], ["Table 2"]]
+    scheduler = p.RefreshScheduler(standin, dimensions_first=False)
+    assert len(scheduler.waves) == 3
+
+
+def test_partial_request(standin):
+    """Tests only the requested tables and partitions are planned."""
+    partition = standin.Tables["Table 3"].Partitions[0]
+    scheduler = p.RefreshScheduler(standin, ["Table 2", partition])
+    assert scheduler.waves == [["Table 3"], ["Table 2"]]
+    assert scheduler._wave_objects(["Table 3"]) == [{partition.Table: [partition]}]
+
+
+def test_run(standin):
+    """Tests each wave is one `PyRefresh` with its own `MaxParallelism`."""
+    refreshes = []
+
+    class StandInRefresh:
+        def __init__(self, model, object, max_parallelism=None, **kwargs):
+            refreshes.append((object, max_parallelism))
+
+        def run(self):
+            return pd.DataFrame(
+                [["x", "y", None]], columns=["Table", "Partition", "Refreshed Time"]
+            )
+
+    standin.PyRefresh = StandInRefresh
+    scheduler = p.RefreshScheduler(standin, max_parallelism=[2, 8])
+    result = scheduler.run()
+    assert [parallelism for _, parallelism in refreshes] == [2, 8, 8]
+    assert refreshes[1][0] == [standin.Tables["Table 3"]]
+    assert result["Wave"].tolist() == [0, 1, 2]
+    assert scheduler.report()["tables"].tolist() == scheduler.waves
+    path, seconds = scheduler.critical_path()
+    assert path == ["Table 0", "Table 3", "Table 2"]
+    assert seconds == pytest.approx(scheduler.report()["seconds"].sum())
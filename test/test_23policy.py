@@ -0,0 +1,140 @@
+"""pytests for `RefreshPolicy`. Applied to the stand-in model in `standin.py`."""
+
+from datetime import date
+import pytest
+import pytabular as p
+from test.standin import StandInCollection, StandInObject, synthetic_model, synthetic_server
+
+
+def names(actions, action):
+    """Partition names of one kind of action."""
+    return [a.partition for a in actions if a.action == action]
+
+
+def test_periods():
+    """Tests older years are yearly and the hot months stay monthly."""
+    policy = p.RefreshPolicy(keep_years=2, refresh_months=3)
+    periods = policy.periods(date(2024, 5, 17))
+    assert list(periods) == ["2022", "2023", "2024-01", "2024-02", "2024-03", "2024-04", "2024-05"]
+    assert periods["2023"] == (date(2023, 1, 1), date(2024, 1, 1))
+    assert periods["2024-05"] == (date(2024, 5, 1), date(2024, 6, 1))
+    periods = policy.periods(date(2024, 2, 1))
+    assert "2023-12" in periods and "2023" not in periods
+
+
+def test_first_run():
+    """Tests every partition is created and refreshed on the first run."""
+    policy = p.RefreshPolicy(keep_years=1, refresh_months=1)
+    actions = policy.plan("Sales", ["Sales Template"], date(2024, 3, 2))
+    assert names(actions, "create") == [
+        "Sales 2023",
+        "Sales 2024-01",
+        "Sales 2024-02",
+        "Sales 2024-03",
+    ]
+    assert names(actions, "refresh") == names(actions, "create")
+    assert names(actions, "remove") == []
+
+
+def test_rolling_run():
+    """Tests a new year merges its months, old years roll off and only hot months refresh."""
+    policy = p.RefreshPolicy(keep_years=1, refresh_months=2)
+    existing = ["Sales 2022", "Sales 2023"] + [f"Sales 2024-{m:02}" for m in range(1, 13)]
+    existing.append("Sales Other")
+    actions = policy.plan("Sales", existing, date(2025, 2, 3))
+    assert names(actions, "create") == ["Sales 2024", "Sales 2025-01", "Sales 2025-02"]
+    assert len(names(actions, "merge")) == 12
+    assert names(actions, "remove") == ["Sales 2022", "Sales 2023"]
+    assert names(actions, "refresh") == ["Sales 2025-01", "Sales 2025-02"]
+    existing = ["Sales 2024", "Sales 2025-01", "Sales 2025-02"]
+    actions = policy.plan("Sales", existing, date(2025, 2, 4))
+    assert [(a.action, a.partition) for a in actions] == [
+        ("refresh", "Sales 2025-01"),
+        ("refresh", "Sales 2025-02"),
+    ]
+
+
+def test_render():
+    """Tests the placeholders are replaced with M or SQL date literals."""
+    policy = p.RefreshPolicy(keep_years=1)
+    m = "Table.SelectRows(Source, each [Date] >= RangeStart and [Date] < RangeEnd)"
+    assert policy.render(m, date(2024, 1, 1), date(2024, 2, 1), "Expression") == (
+        "Table.SelectRows(Source, each [Date] >= #date(2024, 1, 1) and [Date] < #date(2024, 2, 1))"
+    )
+    sql = "select * from sales where OrderDate >= @RangeStart and OrderDate < @RangeEnd"
+    assert policy.render(sql, date(2024, 1, 1), date(2024, 2, 1), "Query").endswith(
+        ">= '2024-01-01' and OrderDate < '2024-02-01'"
+    )
+    with pytest.raises(ValueError):
+        p.RefreshPolicy(keep_years=1, refresh_months=0)
+
+
+class StandInNamed(StandInCollection):
+    """Stand-in for a .Net collection of named objects, ex. `PartitionCollection`."""
+
+    def Find(self, name):  # noqa: N802
+        """Object by name, `None` if not found."""
+        return next((obj for obj in self if obj.Name == name), None)
+
+    def Add(self, obj):  # noqa: N802
+        """Same as `append()`."""
+        self.append(obj)
+
+    def Remove(self, name):  # noqa: N802
+        """Removes by name."""
+        self.remove(self.Find(name))
+
+
+def policy_partition(table: StandInObject, name: str, expression: str) -> StandInObject:
+    """Stand-in partition that can be cloned and merged into."""
+    partition = StandInObject(
+        "Partition", name, table, Source=StandInObject("PartitionSource", "", Expression=expression)
+    )
+    partition.Clone = lambda: policy_partition(table, name, partition.Source.Expression)
+
+    def request_merge(months):
+        for month in months:
+            table.Partitions.remove(month)
+
+    partition.RequestMerge = request_merge
+    return partition
+
+
+def test_apply_refresh_policy():
+    """Tests a first run creates, saves, merges, saves and refreshes with the current tables."""
+    net_model = synthetic_model(tables=1, columns=1, measures=0, partitions=0)
+    net_table = net_model.Tables[0]
+    net_table.Annotations = StandInNamed()
+    net_table.Partitions = StandInNamed(
+        [
+            policy_partition(net_table, "Template", "Data(RangeStart, RangeEnd)"),
+            policy_partition(net_table, "Table 0 2023-12", "December"),
+        ]
+    )
+    model = p.Tabular(server=synthetic_server(net_model))
+    model.save_changes = model.reload_model_info
+    refreshed = []
+    model.refresh = lambda objects, **kwargs: refreshed.append(objects)
+    policy = p.RefreshPolicy(keep_years=1, refresh_months=1)
+    actions = model.Tables[0].apply_refresh_policy(policy, "Template", date(2024, 2, 10))
+    assert actions["action"].tolist() == [
+        "create",
+        "create",
+        "create",
+        "merge",
+        "refresh",
+        "refresh",
+    ]
+    assert [partition.Name for partition in net_table.Partitions] == [
+        "Table 0 2023",
+        "Table 0 2024-01",
+        "Table 0 2024-02",
+    ]
+    assert net_table.Partitions[1].Source.Expression == (
+        "Data(#date(2024, 1, 1), #date(2024, 2, 1))"
+    )
+    annotation = net_table.Annotations.Find(p.policy.TEMPLATE_ANNOTATION)
+    assert annotation.Value == "Data(RangeStart, RangeEnd)"
+    ((table, partitions),) = refreshed[0].items()
+    assert table is model.Tables[0]
+    assert [partition.Name for partition in partitions] == ["Table 0 2024-01", "Table 0 2024-02"]
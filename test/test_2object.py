@@ -102,3 +102,31 @@ def test_find_measure(model):
     a = model.Measures[0].Name
     b = model.Measures.find(a)
     assert len(b) > 0
+
+
+def test_getitem_last_duplicate(model):
+    """Tests `__getitem__()` returns the last `PyObject` when names are duplicated."""
+    tables = model.Tables[0:2]
+    tables += model.Tables[0]
+    assert tables[model.Tables[0].Name] is tables[-1]
+
+
+def test_getitem_missing(model):
+    """Tests `__getitem__()` raises `IndexError` on a missing name."""
+    with pytest.raises(IndexError):
+        model.Tables["This table does not exist"]
+
+
+def test_to_dataframe(model):
+    """Tests `to_dataframe()` has a row per `PyObject`."""
+    df = model.Columns.to_dataframe()
+    assert len(df) == len(model.Columns)
+    assert df.columns.to_list() == model.Columns._frame_properties
+
+
+def test_where(model):
+    """Tests `where()` returns the `PyObject`(s) matching the mask."""
+    df = model.metadata_frame("Columns", ["Name", "IsHidden"])
+    hidden = model.Columns.where(df["IsHidden"])
+    assert len(hidden) == df["IsHidden"].sum()
+    assert all(column.IsHidden for column in hidden)
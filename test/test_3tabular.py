@@ -172,3 +172,59 @@ def test_bad_partition(model):
     table = model.Tables[testingtablename]
     with pytest.raises(Exception):
         model.refresh({table.Name: table.Partitions[0].Name + "fail"})
+
+
+def test_server_catalog(model):
+    """Tests `ServerCatalog` opens databases lazily on one shared `Server`."""
+    catalog = p.ServerCatalog(model.Server.ConnectionString)
+    assert model.Database.Name in catalog
+    assert len(catalog.opened) == 0
+    opened = catalog[model.Database.Name]
+    assert catalog[model.Database.Name] is opened
+    assert opened.Server is catalog.Server
+    assert len(opened.Tables) == len(model.Tables)
+    opened.disconnect()
+    assert catalog.Server.Connected
+    catalog.disconnect()
+
+
+def test_dependency_graph(model):
+    """Tests `model.dependencies` matches a query for a single measure."""
+    measure = model.Measures[0]
+    dmv_query = f"select * from $SYSTEM.DISCOVER_CALC_DEPENDENCY where \
+        [OBJECT] = '{measure.Name}' and [TABLE] = '{measure.Table.Name}'"
+    assert len(model.dependencies.depends_on(measure.Table.Name, measure.Name)) == len(
+        model.query(dmv_query)
+    )
+    assert model.dependencies is model.dependencies
+
+
+def test_dependency_graph_closure():
+    """Tests upstream and downstream closures of a `DependencyGraph`."""
+    dependencies = pd.DataFrame(
+        {
+            "TABLE": ["Sales", "Sales", "Sales"],
+            "OBJECT": ["Margin %", "Margin %", "Margin"],
+            "REFERENCED_TABLE": ["Sales", "Sales", "Sales"],
+            "REFERENCED_OBJECT": ["Margin", "Revenue", "Revenue"],
+        }
+    )
+    graph = p.DependencyGraph(dependencies)
+    assert graph.upstream("Sales", "Margin %") == {
+        ("Sales", "Margin"),
+        ("Sales", "Revenue"),
+    }
+    assert graph.downstream("Sales", "Revenue") == {
+        ("Sales", "Margin"),
+        ("Sales", "Margin %"),
+    }
+    assert len(graph.referenced_by("Sales", "Revenue")) == 2
+    assert len(graph.depends_on("Sales", "Revenue")) == 0
+
+
+def test_search(model):
+    """Tests `model.search()` finds a measure by its expression."""
+    measure = [m for m in model.Measures if len(m.Expression.strip()) > 0][0]
+    found = model.search(measure.Expression, kind="measure", exact=True)
+    assert isinstance(found, p.pytabular.PyMeasures)
+    assert measure.Name in [m.Name for m in found]
@@ -13,3 +13,28 @@ def test_create_measure(model):
     new_measure.Parent.Measures.Remove(new_measure)
     model.save_changes()
     assert query == ans
+
+
+def test_measure_patched_on_save(model):
+    """Tests new and removed measures are patched in without a reload."""
+    tables = model.Tables
+    name = "Test Patched Measure"
+    measure = model.Measures(name, "1 + 4")
+    assert model.Tables is tables
+    assert measure.Table.Measures[name] is measure
+    measure.Parent.Measures.Remove(measure._object)
+    model.save_changes()
+    assert model.Tables is tables
+    assert len(model.Measures.find(name)) == 0
+
+
+def test_measures_set_properties(model):
+    """Tests `set_properties()` sets and saves only what changed."""
+    measures = model.Measures
+    original = measures.to_dataframe(["Name", "Parent.Name", "Description"])
+    changed = measures.set_properties({"Description": "Bulk description"})
+    assert changed == (original["Description"] != "Bulk description").sum()
+    assert model.Measures is measures
+    assert all(m.Description == "Bulk description" for m in model.Measures)
+    assert measures.set_properties({"Description": "Bulk description"}) == 0
+    measures.set_properties(original.fillna(""))
@@ -3,6 +3,8 @@
 from test.config import testingtablename
 import pandas as pd
 from datetime import datetime
+from types import SimpleNamespace
+from pytabular.relationship import PyRelationships
 
 
 def test_row_count(model):
@@ -48,3 +50,75 @@ def test_last_refresh_pytables_true(model):
 def test_last_refresh_pytables_false(model):
     """Tests group_partition=False for `Last_Refresh()` of PyTables class."""
     assert isinstance(model.Tables.last_refresh(group_partition=False), pd.DataFrame)
+
+
+def test_related_depth(model):
+    """Tests `related()` with more than one hop includes the first hop."""
+    table = model.Relationships[0].From_Table
+    one_hop = {related.Name for related in table.related()}
+    two_hops = {related.Name for related in table.related(depth=2)}
+    assert one_hop <= two_hops and table.Name not in two_hops
+
+
+def test_relationships_for_column(model):
+    """Tests `PyRelationships.for_column()` finds the relationship of a column."""
+    relationship = model.Relationships[0]
+    found = model.Relationships.for_column(relationship.From_Column)
+    assert relationship.Name in [rel.Name for rel in found]
+
+
+def test_filter_path(model):
+    """Tests a filter goes from the `To_Table` to the `From_Table`."""
+    relationship = [rel for rel in model.Relationships if rel.IsActive][0]
+    path = model.Relationships.filter_path(
+        relationship.To_Table, relationship.From_Table
+    )
+    assert len(path) == 1
+
+
+def test_analyze_filter_paths(model):
+    """Tests `analyze_filter_paths()` returns a row per pair."""
+    df = model.Relationships.analyze_filter_paths()
+    assert isinstance(df, pd.DataFrame)
+    assert isinstance(model.Relationships.bidirectional_cycles(), list)
+
+
+def relationships(*edges):
+    """Builds `PyRelationships` from `(name, from table, to table, is active)` edges."""
+    return PyRelationships(
+        [
+            SimpleNamespace(
+                Name=name,
+                From_Table=SimpleNamespace(Name=from_table),
+                From_Column=SimpleNamespace(Name=name),
+                To_Table=SimpleNamespace(Name=to_table),
+                To_Column=SimpleNamespace(Name="Date"),
+                IsActive=is_active,
+                CrossFilteringBehavior="OneDirection",
+            )
+            for name, from_table, to_table, is_active in edges
+        ]
+    )
+
+
+def test_ambiguous_paths_parallel_relationships():
+    """Tests role-playing relationships between the same tables are not ambiguous."""
+    rels = relationships(
+        ("Order Date", "Sales", "Date", True),
+        ("Ship Date", "Sales", "Date", False),
+    )
+    assert rels.ambiguous_paths("Date", "Sales", include_inactive=True) == []
+
+
+def test_ambiguous_paths_names_relationships():
+    """Tests `ambiguous_paths()` returns the relationships of each path."""
+    rels = relationships(
+        ("Order Date", "Sales", "Date", True),
+        ("Ship Date", "Sales", "Date", False),
+        ("Return Date", "Returns", "Date", True),
+        ("Sales Return", "Sales", "Returns", True),
+    )
+    assert rels.ambiguous_paths("Date", "Sales") == [
+        ["Order Date"],
+        ["Return Date", "Sales Return"],
+    ]